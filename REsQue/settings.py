@@ -62,7 +62,7 @@ INSTALLED_APPS = (
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "account.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
@@ -86,6 +86,13 @@ SIMPLE_JWT = {
     "TOKEN_TYPE_CLAIM": "token_type",
 }
 
+# 검증한 액세스 토큰과 사용자 캐시 (account.authentication.DEFAULTS 참고)
+JWT_AUTH_CACHE = {
+    "MAX_TOKENS": 10000,
+    "USER_TTL": 60,
+    "SHARED_CACHE_ALIAS": None,
+}
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -133,6 +140,60 @@ DATABASES = {
 
 AUTH_USER_MODEL = "account.CustomUser"
 
+# 새 비밀번호를 만들 때 쓸 해셔 단계입니다. 목록의 나머지 해셔는 기존 해시를 검증하는 데만 쓰이며,
+# 로그인에 성공하면 check_password 가 선택한 단계의 해셔로 다시 해시해 저장합니다.
+PASSWORD_HASHER_TIERS = {
+    "pbkdf2": "account.hashers.TunedPBKDF2PasswordHasher",
+    "scrypt": "account.hashers.TunedScryptPasswordHasher",
+    "argon2": "account.hashers.TunedArgon2PasswordHasher",
+}
+PASSWORD_HASHER_TIER = os.environ.get("PASSWORD_HASHER_TIER", "pbkdf2")
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_TIERS[PASSWORD_HASHER_TIER],
+    *(
+        hasher
+        for tier, hasher in PASSWORD_HASHER_TIERS.items()
+        if tier != PASSWORD_HASHER_TIER
+    ),
+    # 단계에 없는 Django 기본 해셔입니다. 예전 해시로 저장된 사용자도 로그인할 수 있고
+    # 로그인하면 선택한 단계로 다시 해시됩니다.
+    # pbkdf2_sha256, scrypt, argon2 해시는 알고리즘 이름이 같은 단계 해셔가 검증합니다.
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+
+# 단계별 해셔 매개변수 (키는 PASSWORD_HASHER_TIERS 의 단계 이름, 지정하지 않은 값은 Django 기본값)
+# scrypt 와 argon2 는 OWASP Password Storage Cheat Sheet 의 권장 설정입니다.
+PASSWORD_HASHER_OPTIONS = {
+    "scrypt": {
+        "work_factor": 2**15,
+        "block_size": 8,
+        "parallelism": 3,
+        "maxmem": 64 * 1024 * 1024,
+    },
+    "argon2": {"time_cost": 2, "memory_cost": 19456, "parallelism": 1},
+}
+
+# ASGI 에서 비밀번호 해시를 계산할 스레드 수 (None 이면 CPU 수)
+PASSWORD_HASHING_WORKERS = None
+
+# 사용자 일괄 가져오기 API 가 비밀번호 해시에 쓸 스레드 수 (None 이면 PASSWORD_HASHING_WORKERS 의 절반)
+# 로그인 해시와 다른 풀을 쓰므로 큰 업로드가 로그인을 막지 않습니다.
+BULK_IMPORT_HASHING_WORKERS = None
+# 요청 하나로 가져올 수 있는 최대 사용자 수 (None 이면 제한 없음)
+BULK_IMPORT_MAX_ROWS = 5000
+
+# 로그인 사용자 조회 캐시 (account.user_cache.DEFAULTS 참고)
+# ENABLED 를 지정하지 않으면 CACHES 가 프로세스끼리 공유되는 백엔드일 때만 켜집니다.
+# 워커가 하나뿐인 배포라면 기본 locmem 캐시로도 켤 수 있습니다.
+SIGNIN_USER_CACHE = {
+    "TIMEOUT": 300,
+    "BLOOM_REBUILD_INTERVAL": 600,
+}
+
+# 로그인할 수 있는 이메일 도메인 (account.validators)
+ACCOUNT_ALLOWED_EMAIL_DOMAINS = ["example.com", "yourdomain.com"]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
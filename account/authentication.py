@@ -0,0 +1,200 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+DEFAULTS = {
+    "MAX_TOKENS": 10000,
+    "MAX_USERS": 10000,
+    # 다른 프로세스에서 저장한 사용자 변경은 시그널로 알 수 없으므로
+    # 프로세스 안의 사용자 항목은 이 시간(초)까지만 믿습니다.
+    "USER_TTL": 60,
+    # 지정하면 검증한 토큰과 사용자를 이 캐시에도 저장해 워커끼리 나눠 씁니다.
+    "SHARED_CACHE_ALIAS": None,
+}
+
+KEY_PREFIX = "jwt-auth"
+_INVALIDATED = "invalidated"
+# 무효화 직후 이 시간(초) 동안은 공유 캐시에 같은 사용자를 다시 넣지 않습니다.
+INVALIDATION_GRACE = 5
+
+
+def _options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "JWT_AUTH_CACHE", {})}
+
+
+def _token_key(raw_token: bytes) -> str:
+    digest = hashlib.blake2b(raw_token, digest_size=16).hexdigest()
+    return f"{KEY_PREFIX}:token:{digest}"
+
+
+def _user_key(user_id) -> str:
+    return f"{KEY_PREFIX}:user:{user_id}"
+
+
+class ExpiringLRUCache:
+    """
+    항목마다 만료 시각(time.time() 기준)을 두는 크기 제한 LRU 캐시입니다.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, now: float):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at: float):
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_tokens = None
+_users = None
+_caches_lock = threading.Lock()
+
+
+def _local_caches():
+    global _tokens, _users
+    with _caches_lock:
+        if _tokens is None:
+            options = _options()
+            _tokens = ExpiringLRUCache(options["MAX_TOKENS"])
+            _users = ExpiringLRUCache(options["MAX_USERS"])
+        return _tokens, _users
+
+
+def _shared_cache():
+    alias = _options()["SHARED_CACHE_ALIAS"]
+    return caches[alias] if alias else None
+
+
+def invalidate_user(user_id):
+    """
+    사용자가 바뀌거나 지워졌을 때 캐시된 사용자를 버립니다. 토큰 항목은 사용자를 담지 않으므로 그대로 둡니다.
+    """
+    _, users = _local_caches()
+    users.delete(str(user_id))
+    shared = _shared_cache()
+    if shared is not None:
+        shared.set(_user_key(user_id), _INVALIDATED, INVALIDATION_GRACE)
+
+
+def clear_jwt_auth_cache():
+    """
+    프로세스 안의 토큰/사용자 캐시를 비우고 다음 사용 때 설정을 다시 읽게 합니다.
+    """
+    global _tokens, _users
+    with _caches_lock:
+        _tokens = _users = None
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication 과 같지만 검증한 토큰을 만료 시각까지, 찾은 사용자를 USER_TTL 동안 캐시합니다.
+    같은 액세스 토큰으로 다시 요청하면 서명 검증과 사용자 조회를 모두 건너뜁니다.
+
+    토큰 항목의 키는 토큰 문자열 전체의 해시입니다. jti 는 서명을 검증하기 전에는 믿을 수 없으므로
+    키로 쓰지 않습니다. 사용자 항목은 account.signals 가 저장/삭제 시 지웁니다.
+    """
+
+    def get_validated_token(self, raw_token: bytes):
+        tokens, _ = _local_caches()
+        now = time.time()
+        token = tokens.get(raw_token, now)
+        if token is not None:
+            return token
+
+        shared = _shared_cache()
+        if shared is not None:
+            token = shared.get(_token_key(raw_token))
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            remaining = token["exp"] - now
+            if shared is not None and remaining > 0:
+                shared.set(_token_key(raw_token), token, remaining)
+        tokens.set(raw_token, token, token["exp"])
+        return token
+
+    def get_user(self, validated_token):
+        try:
+            # 토큰에는 문자열로 들어 있으므로 invalidate_user 와 키를 맞춥니다.
+            user_id = str(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        _, users = _local_caches()
+        now = time.time()
+        user = users.get(user_id, now)
+        if user is not None:
+            self.check_user(user, validated_token)
+            # 요청마다 따로 고칠 수 있도록 캐시에 둔 인스턴스 대신 복사본을 돌려줍니다.
+            return copy.copy(user)
+
+        shared = _shared_cache()
+        cached = shared.get(_user_key(user_id)) if shared is not None else None
+        if cached is not None and cached != _INVALIDATED:
+            user = cached
+            self.check_user(user, validated_token)
+        else:
+            # 조회와 비활성/비밀번호 변경 검사는 JWTAuthentication 이 합니다.
+            user = super().get_user(validated_token)
+            if cached is None and shared is not None:
+                # add 는 무효화 표시가 남아 있으면 아무것도 하지 않으므로
+                # 조회와 저장 사이에 바뀐 사용자를 다시 캐시하지 않습니다.
+                shared.add(
+                    _user_key(user_id), user, max(validated_token["exp"] - now, 1)
+                )
+        users.set(user_id, copy.copy(user), now + _options()["USER_TTL"])
+        return user
+
+    @staticmethod
+    def check_user(user, validated_token):
+        """
+        캐시에서 꺼낸 사용자에게 JWTAuthentication.get_user 와 같은 검사를 합니다.
+        """
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
@@ -0,0 +1,265 @@
+import functools
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import NamedTuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from account.serializers import UserSignUpSerializer
+from account.user_cache import signin_user_cache
+
+DEFAULT_BATCH_SIZE = 1000
+
+# 워커 하나에 보낼 청크 수. 해시 비용은 고르므로 크게 나눠 전송 횟수를 줄입니다.
+CHUNKS_PER_WORKER = 2
+
+
+class BulkUserListSerializer(serializers.ListSerializer):
+    """
+    BulkUserSerializer(many=True) 로 배치를 한 번에 검증합니다. 하위 serializer 와 필드는 한 번만
+    만들어 모든 행에 다시 쓰고, 잘못된 행이 있어도 나머지 행의 검증 결과를 버리지 않습니다.
+
+    validated_data 는 [(배치 안 순서, validated_data)], row_errors 는 {배치 안 순서: errors} 입니다.
+    """
+
+    def to_internal_value(self, data):
+        valid = []
+        self.row_errors = {}
+        for index, item in enumerate(data):
+            try:
+                valid.append((index, self.run_child_validation(item)))
+            except serializers.ValidationError as exc:
+                self.row_errors[index] = exc.detail
+        return valid
+
+
+class BulkUserSerializer(UserSignUpSerializer):
+    """
+    UserSignUpSerializer 와 같은 검증을 하되 이메일 중복은 import_users 가
+    배치마다 한 번의 쿼리로 검사하므로 행마다 쿼리하는 UniqueValidator 를 뺍니다.
+    """
+
+    class Meta(UserSignUpSerializer.Meta):
+        list_serializer_class = BulkUserListSerializer
+
+    def get_fields(self):
+        fields = super().get_fields()
+        email = fields["email"]
+        email.validators = [
+            validator
+            for validator in email.validators
+            if not isinstance(validator, UniqueValidator)
+        ]
+        return fields
+
+    @staticmethod
+    @functools.cache
+    def unique_email_message():
+        """
+        SignUpView 가 중복 이메일에 돌려주는 것과 같은 메시지입니다.
+        지연 번역 문자열이므로 요청의 언어로 바꾸려면 str() 로 감쌉니다.
+        """
+        for validator in UserSignUpSerializer().fields["email"].validators:
+            if isinstance(validator, UniqueValidator):
+                return validator.message
+        return "This field must be unique."
+
+
+class BulkImportError(NamedTuple):
+    row: int
+    email: str | None
+    errors: dict
+
+
+class BulkImportResult(NamedTuple):
+    rows: int
+    created: int
+    errors: list[BulkImportError]
+    elapsed: float
+    # 단계별 소요 시간(초): validate, hash, insert
+    timings: dict
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def users_per_second(self) -> float | None:
+        return round(self.created / self.elapsed, 2) if self.elapsed else None
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "created": self.created,
+            "failed": len(self.errors),
+            "elapsed_seconds": round(self.elapsed, 3),
+            "users_per_second": self.users_per_second,
+            "timings": {name: round(value, 3) for name, value in self.timings.items()},
+            "errors": [error._asdict() for error in self.errors],
+        }
+
+
+def import_users(
+    rows,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int | None = None,
+    dry_run: bool = False,
+    executor: Executor | None = None,
+    progress=None,
+) -> BulkImportResult:
+    """
+    {"email": ..., "password": ...} 행들을 batch_size 개씩 검증하고, 비밀번호를 프로세스 풀에서 해시한 뒤
+    bulk_create 로 넣습니다. 잘못된 행은 BulkImportError 로 모으고 나머지 행은 계속 처리합니다.
+
+    dry_run=True 이면 검증만 합니다. executor 를 주면 풀을 새로 만들지 않고 그것을 사용합니다.
+    progress 를 주면 배치마다 지금까지의 BulkImportResult 로 부릅니다.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    pool = None
+    if executor is None and max_workers > 1 and not dry_run:
+        # 워커는 make_password 만 실행하므로 DJANGO_SETTINGS_MODULE 만 물려받으면 됩니다.
+        pool = executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    timings = {"validate": 0.0, "hash": 0.0, "insert": 0.0}
+    errors = []
+    total = created = 0
+    start = time.perf_counter()
+    try:
+        rows = enumerate(rows)
+        while batch := list(islice(rows, batch_size)):
+            total += len(batch)
+
+            phase = time.perf_counter()
+            valid, batch_errors = _validate_batch(batch)
+            timings["validate"] += time.perf_counter() - phase
+            errors.extend(batch_errors)
+
+            if valid and not dry_run:
+                phase = time.perf_counter()
+                encoded = _hash_passwords(
+                    [data["password"] for _, data in valid], executor, max_workers
+                )
+                timings["hash"] += time.perf_counter() - phase
+
+                phase = time.perf_counter()
+                batch_created, batch_errors = _insert_batch(valid, encoded)
+                timings["insert"] += time.perf_counter() - phase
+                created += batch_created
+                errors.extend(batch_errors)
+
+            if progress is not None:
+                progress(
+                    BulkImportResult(
+                        total, created, errors, time.perf_counter() - start, timings
+                    )
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    errors.sort(key=lambda error: error.row)
+    return BulkImportResult(
+        total, created, errors, time.perf_counter() - start, timings
+    )
+
+
+def _validate_batch(batch):
+    """
+    배치를 BulkUserSerializer(many=True) 하나로 검증하고, 이메일 중복은 배치 안에서와 DB 에서 한 번에 검사합니다.
+    ([(행 번호, validated_data)], [BulkImportError]) 를 돌려줍니다.
+    """
+    User = get_user_model()
+    candidates = []
+    errors = []
+    rows = []
+    for row, data in batch:
+        if isinstance(data, dict):
+            rows.append((row, data))
+        else:
+            errors.append(
+                BulkImportError(row, None, {"non_field_errors": ["Invalid row"]})
+            )
+
+    serializer = BulkUserSerializer(data=[data for _, data in rows], many=True)
+    serializer.is_valid()
+    for index, row_errors in serializer.row_errors.items():
+        row, data = rows[index]
+        errors.append(BulkImportError(row, data.get("email"), _error_dict(row_errors)))
+    for index, validated in serializer.validated_data:
+        # create_user 와 같이 도메인 부분을 소문자로 바꾼 이메일로 저장하고 비교합니다.
+        validated["email"] = User.objects.normalize_email(validated["email"])
+        candidates.append((rows[index][0], validated))
+
+    existing = set(
+        User.objects.filter(
+            email__in=[data["email"] for _, data in candidates]
+        ).values_list("email", flat=True)
+    )
+    unique_message = str(BulkUserSerializer.unique_email_message())
+    valid = []
+    for row, data in candidates:
+        email = data["email"]
+        if email in existing:
+            errors.append(BulkImportError(row, email, {"email": [unique_message]}))
+            continue
+        existing.add(email)
+        valid.append((row, data))
+    return valid, errors
+
+
+def _error_dict(errors) -> dict:
+    return {
+        field: [str(message) for message in messages]
+        for field, messages in errors.items()
+    }
+
+
+def _hash_passwords(passwords, executor, max_workers):
+    if executor is None:
+        return [make_password(password) for password in passwords]
+    chunksize = max(1, len(passwords) // (max_workers * CHUNKS_PER_WORKER))
+    return list(executor.map(make_password, passwords, chunksize=chunksize))
+
+
+def _insert_batch(valid, encoded):
+    """
+    bulk_create 로 한 번에 넣습니다. 검증 뒤 다른 요청이 같은 이메일로 가입해 실패하면
+    행마다 다시 넣어 실패한 행을 찾습니다. (만든 사용자 수, [BulkImportError]) 를 돌려줍니다.
+    """
+    User = get_user_model()
+    users = [
+        User(email=data["email"], password=password)
+        for (_, data), password in zip(valid, encoded)
+    ]
+    try:
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+    except IntegrityError:
+        created = []
+        errors = []
+        unique_message = str(BulkUserSerializer.unique_email_message())
+        for (row, data), user in zip(valid, users):
+            user.pk = None
+            try:
+                with transaction.atomic():
+                    user.save(force_insert=True)
+            except IntegrityError:
+                errors.append(
+                    BulkImportError(row, data["email"], {"email": [unique_message]})
+                )
+            else:
+                # save 가 보내는 post_save 시그널이 블룸 필터에 이메일을 더합니다.
+                created.append(user)
+        return len(created), errors
+
+    # bulk_create 는 post_save 시그널을 보내지 않습니다.
+    signin_user_cache.add_known_emails(user.email for user in users)
+    return len(users), []
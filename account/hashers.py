@@ -0,0 +1,145 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+    make_password,
+    verify_password,
+)
+
+
+def _option(tier: str, name: str, default):
+    """
+    settings.PASSWORD_HASHER_OPTIONS 에서 해셔 매개변수를 읽습니다.
+    키는 settings.PASSWORD_HASHER_TIERS 의 단계 이름입니다.
+
+        PASSWORD_HASHER_OPTIONS = {
+            "pbkdf2": {"iterations": 1_000_000},
+            "scrypt": {"work_factor": 2**15, "block_size": 8, "parallelism": 3},
+        }
+    """
+    options = getattr(settings, "PASSWORD_HASHER_OPTIONS", {})
+    return options.get(tier, {}).get(name, default)
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    tier = "pbkdf2"
+
+    @property
+    def iterations(self):
+        return _option(self.tier, "iterations", PBKDF2PasswordHasher.iterations)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    tier = "scrypt"
+
+    @property
+    def work_factor(self):
+        return _option(self.tier, "work_factor", ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return _option(self.tier, "block_size", ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return _option(self.tier, "parallelism", ScryptPasswordHasher.parallelism)
+
+    @property
+    def maxmem(self):
+        return _option(self.tier, "maxmem", ScryptPasswordHasher.maxmem)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    argon2-cffi 가 설치되어 있어야 합니다. 없으면 사용할 때 ValueError 가 발생합니다.
+    """
+
+    tier = "argon2"
+
+    @property
+    def time_cost(self):
+        return _option(self.tier, "time_cost", Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return _option(self.tier, "memory_cost", Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return _option(self.tier, "parallelism", Argon2PasswordHasher.parallelism)
+
+
+_hash_executor = None
+_hash_executor_lock = threading.Lock()
+
+
+def hash_worker_count() -> int:
+    return getattr(settings, "PASSWORD_HASHING_WORKERS", None) or os.cpu_count() or 1
+
+
+def get_hash_executor() -> ThreadPoolExecutor:
+    """
+    비밀번호 해시 전용 스레드 풀입니다. hashlib 의 pbkdf2/scrypt 는 계산 중 GIL 을 놓으므로
+    settings.PASSWORD_HASHING_WORKERS(기본값: CPU 수) 개의 코어를 함께 쓸 수 있습니다.
+    """
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=hash_worker_count(),
+                thread_name_prefix="password-hashing",
+            )
+        return _hash_executor
+
+
+_bulk_hash_executor = None
+
+
+def bulk_hash_worker_count() -> int:
+    workers = getattr(settings, "BULK_IMPORT_HASHING_WORKERS", None)
+    return workers or max(1, hash_worker_count() // 2)
+
+
+def get_bulk_hash_executor() -> ThreadPoolExecutor:
+    """
+    일괄 가져오기 전용 해시 스레드 풀입니다. 큰 업로드가 get_hash_executor 를 채워
+    로그인 요청의 해시가 뒤로 밀리지 않도록 따로 둡니다.
+    settings.BULK_IMPORT_HASHING_WORKERS(기본값: 해시 스레드 수의 절반) 개의 스레드를 씁니다.
+    """
+    global _bulk_hash_executor
+    with _hash_executor_lock:
+        if _bulk_hash_executor is None:
+            _bulk_hash_executor = ThreadPoolExecutor(
+                max_workers=bulk_hash_worker_count(),
+                thread_name_prefix="bulk-password-hashing",
+            )
+        return _bulk_hash_executor
+
+
+async def amake_password(raw_password: str) -> str:
+    """
+    make_password 를 이벤트 루프 밖(해시 전용 스레드 풀)에서 실행합니다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_executor(), make_password, raw_password)
+
+
+async def acheck_password(user, raw_password: str) -> bool:
+    """
+    AbstractBaseUser.acheck_password 와 같지만 해시 계산을 해시 전용 스레드 풀에서 합니다.
+    비밀번호가 맞고 선호 해셔나 매개변수가 바뀌었다면 새 해시로 바꿔 저장합니다.
+    """
+    loop = asyncio.get_running_loop()
+    is_correct, must_update = await loop.run_in_executor(
+        get_hash_executor(), verify_password, raw_password, user.password
+    )
+    if is_correct and must_update:
+        user.password = await amake_password(raw_password)
+        await user.asave(update_fields=["password"])
+    return is_correct
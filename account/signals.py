@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from account.authentication import invalidate_user
+from account.user_cache import signin_user_cache
+
+
+@receiver(post_init, sender=settings.AUTH_USER_MODEL)
+def remember_loaded_email(sender, instance, **kwargs):
+    # email 이 지연(defer)된 인스턴스에서 instance.email 을 읽으면 행마다 쿼리가 나가므로
+    # 이미 불러온 값만 봅니다.
+    instance._loaded_email = instance.__dict__.get("email")
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def update_signin_user_cache_on_save(sender, instance, created, **kwargs):
+    invalidate_user(instance.pk)
+    # 불러오지도 설정하지도 않은 email 은 바뀌었을 수 없습니다.
+    email = instance.__dict__.get("email")
+    if created or (email is not None and email != instance._loaded_email):
+        signin_user_cache.add_known_email(email)
+        instance._loaded_email = email
+    if created:
+        # 새 사용자는 아직 아무도 캐시했을 수 없습니다.
+        return
+    # 커밋 전 다른 요청이 이전 값을 다시 캐시했을 수 있으므로 커밋 후에도 한 번 더 지웁니다.
+    signin_user_cache.invalidate(instance)
+    transaction.on_commit(lambda: signin_user_cache.invalidate(instance))
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def update_signin_user_cache_on_delete(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+    signin_user_cache.invalidate(instance)
+    transaction.on_commit(lambda: signin_user_cache.invalidate(instance))
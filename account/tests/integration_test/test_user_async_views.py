@@ -0,0 +1,128 @@
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+@override_settings(
+    PASSWORD_HASHERS=["account.hashers.TunedPBKDF2PasswordHasher"],
+    PASSWORD_HASHER_OPTIONS={"pbkdf2": {"iterations": 1000}},
+)
+class AsyncUserSignupTestCase(APITestCase):
+    def setUp(self):
+        self.signup_url = reverse("user-signup-async")
+
+    def create_valid_data(self):
+        return {"email": "newuser@example.com", "password": "SecurePass123"}
+
+    def test_successful_signup(self):
+        # Given
+        data = self.create_valid_data()
+
+        # When
+        response = self.client.post(self.signup_url, data)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json(), {"email": data["email"]})
+        user = User.objects.get(email=data["email"])
+        self.assertTrue(user.check_password(data["password"]))
+
+    def test_signup_with_json_body(self):
+        # Given
+        data = self.create_valid_data()
+
+        # When
+        response = self.client.post(self.signup_url, data, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_signup_with_existing_email(self):
+        # Given
+        existing_user = User.objects.create_user(
+            email="existing@example.com", password="password123"
+        )
+        data = self.create_valid_data()
+        data["email"] = existing_user.email
+
+        # When
+        response = self.client.post(self.signup_url, data)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("custom user의 email은/는 이미 존재합니다.", str(response.json()))
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_signup_with_weak_password(self):
+        # Given
+        data = self.create_valid_data()
+        data["password"] = "weakpassword"
+
+        # When
+        response = self.client.post(self.signup_url, data)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(
+            "Password must contain at least one uppercase letter",
+            response.json()["password"],
+        )
+        self.assertEqual(User.objects.count(), 0)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["account.hashers.TunedPBKDF2PasswordHasher"],
+    PASSWORD_HASHER_OPTIONS={"pbkdf2": {"iterations": 1000}},
+)
+class AsyncUserSignInTestCase(APITestCase):
+    def setUp(self):
+        self.user_info = {
+            "email": "testuser@example.com",
+            "password": "TestPassword123!",
+        }
+        self.user = User.objects.create_user(**self.user_info)
+        self.url = reverse("user-signin-async")
+
+    def test_success_login_with_valid_credentials(self):
+        # When
+        response = self.client.post(self.url, self.user_info, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.json())
+        self.assertIn("refresh", response.json())
+
+    def test_fail_login_with_invalid_password(self):
+        # Given
+        self.user_info["password"] = "InvalidPassword123!"
+
+        # When
+        response = self.client.post(self.url, self.user_info)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json(), {"error": "Invalid credentials"})
+
+    def test_fail_login_with_inactive_user(self):
+        # Given
+        self.user.is_active = False
+        self.user.save()
+
+        # When
+        response = self.client.post(self.url, self.user_info)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json(), {"error": "User account is disabled"})
+
+    def test_fail_login_with_invalid_json(self):
+        # When
+        response = self.client.post(self.url, "{", content_type="application/json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,76 @@
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class UserBulkImportTestCase(APITestCase):
+    def setUp(self):
+        self.url = reverse("user-bulk-import")
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com", password="AdminPassword123"
+        )
+        self.rows = [
+            {"email": "first@example.com", "password": "SecurePass123"},
+            {"email": "second@example.com", "password": "SecurePass123"},
+        ]
+
+    def test_admin_imports_users(self):
+        # Given
+        self.client.force_authenticate(self.admin)
+
+        # When
+        response = self.client.post(self.url, self.rows, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 2)
+        self.assertIn("users_per_second", response.data)
+        self.assertTrue(User.objects.filter(email="second@example.com").exists())
+
+    def test_partial_import_reports_failed_rows(self):
+        # Given
+        self.client.force_authenticate(self.admin)
+        self.rows.append({"email": "admin@example.com", "password": "SecurePass123"})
+
+        # When
+        response = self.client.post(self.url, {"users": self.rows}, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(response.data["errors"][0]["row"], 2)
+
+    def test_non_list_body_is_rejected(self):
+        # Given
+        self.client.force_authenticate(self.admin)
+
+        # When
+        response = self.client.post(self.url, {"users": "nope"}, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(BULK_IMPORT_MAX_ROWS=1)
+    def test_too_many_rows_are_rejected(self):
+        # Given
+        self.client.force_authenticate(self.admin)
+
+        # When
+        response = self.client.post(self.url, self.rows, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(User.objects.filter(email="first@example.com").exists())
+
+    def test_requires_admin(self):
+        # When
+        response = self.client.post(self.url, self.rows, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(User.objects.filter(email="first@example.com").exists())
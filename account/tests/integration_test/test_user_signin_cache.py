@@ -0,0 +1,88 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from account.user_cache import signin_user_cache
+
+User = get_user_model()
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    SIGNIN_USER_CACHE={"ENABLED": True},
+)
+class UserSignInCacheTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        signin_user_cache.clear()
+        self.user_info = {
+            "email": "testuser@example.com",
+            "password": "TestPassword123",
+        }
+        User.objects.create_user(**self.user_info)
+
+    def test_unknown_user_is_rejected_without_user_query(self):
+        # Given
+        self.client.post(reverse("user-signin"), self.user_info)
+
+        # When
+        with self.assertNumQueries(0):
+            response = self.client.post(
+                reverse("user-signin"),
+                {"email": "unknown@example.com", "password": "TestPassword123"},
+            )
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data, {"error": "Invalid credentials"})
+
+    def test_async_signin_uses_cache(self):
+        # When
+        response = self.client.post(reverse("user-signin-async"), self.user_info)
+        rejected = self.client.post(
+            reverse("user-signin-async"),
+            {"email": "unknown@example.com", "password": "TestPassword123"},
+        )
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(rejected.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(signin_user_cache.stats()["bloom_rejections"], 1)
+
+    def test_stats_require_admin(self):
+        # Given
+        admin = User.objects.create_superuser(
+            email="admin@example.com", password="AdminPassword123"
+        )
+
+        # When
+        anonymous = self.client.get(reverse("signin-cache-stats"))
+        self.client.force_authenticate(admin)
+        response = self.client.get(reverse("signin-cache-stats"))
+
+        # Then
+        self.assertEqual(anonymous.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("hit_rate", response.data)
+
+    def test_stats_accept_signin_access_token(self):
+        # Given
+        User.objects.create_superuser(
+            email="admin@example.com", password="AdminPassword123"
+        )
+        tokens = self.client.post(
+            reverse("user-signin"),
+            {"email": "admin@example.com", "password": "AdminPassword123"},
+        ).data
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.client.get(reverse("signin-cache-stats"))
+
+        # When
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("signin-cache-stats"))
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
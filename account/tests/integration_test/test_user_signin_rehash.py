@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+@override_settings(
+    PASSWORD_HASHERS=[
+        "account.hashers.TunedScryptPasswordHasher",
+        "account.hashers.TunedPBKDF2PasswordHasher",
+    ],
+    PASSWORD_HASHER_OPTIONS={
+        "pbkdf2": {"iterations": 1000},
+        "scrypt": {"work_factor": 2**10, "block_size": 8, "parallelism": 1},
+    },
+)
+class UserSignInRehashTestCase(APITestCase):
+    def setUp(self):
+        self.user_info = {
+            "email": "testuser@example.com",
+            "password": "TestPassword123!",
+        }
+        # 이전 단계(PBKDF2)로 저장된 비밀번호
+        self.user = User.objects.create(
+            email=self.user_info["email"],
+            password=make_password(self.user_info["password"], hasher="pbkdf2_sha256"),
+        )
+        self.url = reverse("user-signin")
+
+    def test_login_migrates_password_to_preferred_hasher(self):
+        # When
+        response = self.client.post(self.url, self.user_info)
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("scrypt$1024$"))
+
+    def test_failed_login_keeps_old_hash(self):
+        # Given
+        old_password = self.user.password
+        self.user_info["password"] = "InvalidPassword123!"
+
+        # When
+        response = self.client.post(self.url, self.user_info)
+
+        # Then
+        self.assertEqual(response.status_code, 401)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, old_password)
@@ -0,0 +1,144 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from account.bulk_import import BulkUserSerializer, _insert_batch, import_users
+from account.user_cache import GENERATION_KEY, signin_user_cache
+
+User = get_user_model()
+
+
+def make_rows(count, start=0):
+    return [
+        {"email": f"user{number}@example.com", "password": "SecurePass123"}
+        for number in range(start, start + count)
+    ]
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class BulkImportTestCase(TestCase):
+    def test_creates_users_in_batches(self):
+        # When
+        result = import_users(make_rows(25), batch_size=10, max_workers=1)
+
+        # Then
+        self.assertTrue(result.ok)
+        self.assertEqual((result.rows, result.created), (25, 25))
+        self.assertEqual(User.objects.count(), 25)
+        user = User.objects.get(email="user7@example.com")
+        self.assertTrue(user.check_password("SecurePass123"))
+
+    def test_batch_uses_constant_number_of_queries(self):
+        # When (중복 검사 SELECT, SAVEPOINT, INSERT, RELEASE)
+        with self.assertNumQueries(4):
+            import_users(make_rows(50), batch_size=50, max_workers=1)
+
+        # Then
+        self.assertEqual(User.objects.count(), 50)
+
+    def test_validates_each_batch_with_one_serializer(self):
+        # Given
+        get_fields = BulkUserSerializer.get_fields
+
+        # When
+        with mock.patch.object(
+            BulkUserSerializer, "get_fields", autospec=True, side_effect=get_fields
+        ) as patched:
+            result = import_users(make_rows(20), batch_size=10, max_workers=1)
+
+        # Then
+        self.assertEqual(result.created, 20)
+        self.assertEqual(patched.call_count, 2)
+
+    def test_reports_per_row_errors_with_signup_messages(self):
+        # Given
+        User.objects.create_user(email="user1@example.com", password="SecurePass123")
+        rows = make_rows(3) + [
+            {"email": "user0@example.com", "password": "SecurePass123"},
+            {"email": "invalid-email", "password": "SecurePass123"},
+            {"email": "user9@example.com", "password": "weak"},
+        ]
+
+        # When
+        result = import_users(rows, max_workers=1)
+
+        # Then
+        self.assertEqual(result.created, 2)
+        self.assertEqual([error.row for error in result.errors], [1, 3, 4, 5])
+        self.assertIn("이미 존재합니다", result.errors[0].errors["email"][0])
+        self.assertEqual(result.errors[1].errors, result.errors[0].errors)
+        self.assertIn("email", result.errors[2].errors)
+        self.assertIn(
+            "Password must contain at least one uppercase letter",
+            result.errors[3].errors["password"],
+        )
+
+    def test_dry_run_only_validates(self):
+        # When
+        result = import_users(make_rows(5), dry_run=True)
+
+        # Then
+        self.assertTrue(result.ok)
+        self.assertEqual((result.rows, result.created), (5, 0))
+        self.assertFalse(User.objects.exists())
+
+    def test_hashes_in_process_pool(self):
+        # When
+        result = import_users(make_rows(8), max_workers=2)
+
+        # Then
+        self.assertEqual(result.created, 8)
+        self.assertTrue(
+            User.objects.get(email="user3@example.com").check_password("SecurePass123")
+        )
+
+    @override_settings(SIGNIN_USER_CACHE={"ENABLED": True})
+    def test_fallback_rows_are_added_to_bloom_filter_once(self):
+        # Given (검증 뒤 다른 요청이 같은 이메일로 가입한 상황)
+        cache.clear()
+        signin_user_cache.clear()
+        User.objects.create_user(email="user1@example.com", password="SecurePass123")
+        generation = cache.get(GENERATION_KEY)
+        valid = [(row, data) for row, data in enumerate(make_rows(3))]
+
+        # When
+        created, errors = _insert_batch(valid, ["encoded"] * 3)
+
+        # Then (저장한 두 행의 post_save 만 세대를 올립니다)
+        self.assertEqual(created, 2)
+        self.assertEqual([error.row for error in errors], [1])
+        self.assertEqual(cache.get(GENERATION_KEY), generation + 2)
+
+    def test_management_command_reads_csv(self):
+        # Given
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as file:
+            file.write("email,password\n")
+            file.write("csv1@example.com,SecurePass123\n")
+            file.write("csv2@example.com,weak\n")
+        self.addCleanup(os.remove, file.name)
+        errors_path = file.name + ".errors"
+        self.addCleanup(lambda: os.path.exists(errors_path) and os.remove(errors_path))
+        stdout = StringIO()
+
+        # When
+        call_command(
+            "import_users",
+            file.name,
+            workers=1,
+            errors_output=errors_path,
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+
+        # Then
+        self.assertIn("2 rows, 1 created, 1 failed", stdout.getvalue())
+        self.assertTrue(User.objects.filter(email="csv1@example.com").exists())
+        with open(errors_path) as errors_file:
+            self.assertEqual(json.loads(errors_file.readline())["row"], 1)
@@ -0,0 +1,113 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account.authentication import CachedJWTAuthentication, clear_jwt_auth_cache
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_jwt_auth_cache()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="TestPassword123"
+        )
+        self.token = str(AccessToken.for_user(self.user))
+        self.authentication = CachedJWTAuthentication()
+
+    def authenticate(self, token=None):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {token or self.token}"
+        )
+        return self.authentication.authenticate(request)
+
+    def test_repeated_token_skips_user_query(self):
+        # Given
+        self.authenticate()
+
+        # When
+        with self.assertNumQueries(0):
+            user, token = self.authenticate()
+
+        # Then
+        self.assertEqual(user, self.user)
+        self.assertEqual(token["user_id"], str(self.user.pk))
+
+    def test_repeated_token_skips_signature_check(self):
+        # Given
+        self.authenticate()
+
+        # When
+        with self.settings(SIMPLE_JWT={"SIGNING_KEY": "other-key"}):
+            user, _ = self.authenticate()
+
+        # Then
+        self.assertEqual(user, self.user)
+
+    def test_tampered_token_is_verified(self):
+        # Given
+        self.authenticate()
+        header, payload, signature = self.token.split(".")
+        # 마지막 글자는 패딩 비트만 다를 수 있으므로 앞쪽 글자를 바꿉니다.
+        replacement = "B" if signature[0] == "A" else "A"
+        tampered = ".".join([header, payload, replacement + signature[1:]])
+
+        # When / Then
+        with self.assertRaises(InvalidToken):
+            self.authenticate(tampered)
+
+    def test_deactivated_user_is_rejected(self):
+        # Given
+        self.authenticate()
+        self.user.is_active = False
+
+        # When
+        self.user.save()
+
+        # Then
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_returned_user_is_a_copy(self):
+        # Given
+        first, _ = self.authenticate()
+        first.is_staff = True
+
+        # When
+        second, _ = self.authenticate()
+
+        # Then
+        self.assertFalse(second.is_staff)
+
+    @override_settings(JWT_AUTH_CACHE={"SHARED_CACHE_ALIAS": "default"})
+    def test_shared_cache_serves_other_processes(self):
+        # Given
+        self.authenticate()
+        # 다른 프로세스처럼 프로세스 안 캐시를 비웁니다.
+        clear_jwt_auth_cache()
+
+        # When
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate()
+
+        # Then
+        self.assertEqual(user, self.user)
+
+    @override_settings(JWT_AUTH_CACHE={"SHARED_CACHE_ALIAS": "default"})
+    def test_save_invalidates_shared_user(self):
+        # Given
+        self.authenticate()
+        clear_jwt_auth_cache()
+        self.user.is_active = False
+
+        # When
+        self.user.save()
+
+        # Then
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
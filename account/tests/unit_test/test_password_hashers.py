@@ -0,0 +1,87 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.test import TestCase, override_settings
+from account.hashers import acheck_password, amake_password
+
+User = get_user_model()
+
+FAST_HASHER_OPTIONS = {
+    "pbkdf2": {"iterations": 1000},
+    "scrypt": {"work_factor": 2**10, "block_size": 8, "parallelism": 1},
+}
+
+
+@override_settings(
+    PASSWORD_HASHERS=[
+        "account.hashers.TunedScryptPasswordHasher",
+        "account.hashers.TunedPBKDF2PasswordHasher",
+    ],
+    PASSWORD_HASHER_OPTIONS=FAST_HASHER_OPTIONS,
+)
+class PasswordHasherTierTestCase(TestCase):
+    def test_tuned_hasher_uses_configured_parameters(self):
+        # When
+        encoded = make_password("TestPassword123")
+
+        # Then
+        self.assertTrue(encoded.startswith("scrypt$1024$"))
+        self.assertEqual(encoded.split("$")[3:5], ["8", "1"])
+
+    def test_changed_parameters_require_update(self):
+        # Given
+        encoded = make_password("TestPassword123")
+
+        # When
+        with self.settings(PASSWORD_HASHER_OPTIONS={"scrypt": {"work_factor": 2**11}}):
+            must_update = get_hasher().must_update(encoded)
+
+        # Then
+        self.assertTrue(must_update)
+
+    async def test_acheck_password_rehashes_with_preferred_hasher(self):
+        # Given
+        user = await User.objects.acreate(
+            email="testuser@example.com",
+            password=make_password("TestPassword123", hasher="pbkdf2_sha256"),
+        )
+
+        # When
+        is_correct = await acheck_password(user, "TestPassword123")
+
+        # Then
+        self.assertTrue(is_correct)
+        stored = await User.objects.aget(pk=user.pk)
+        self.assertTrue(stored.password.startswith("scrypt$"))
+
+    async def test_acheck_password_with_wrong_password(self):
+        # Given
+        encoded = await amake_password("TestPassword123")
+        user = await User.objects.acreate(
+            email="testuser@example.com", password=encoded
+        )
+
+        # When
+        is_correct = await acheck_password(user, "WrongPassword123")
+
+        # Then
+        self.assertFalse(is_correct)
+        stored = await User.objects.aget(pk=user.pk)
+        self.assertEqual(stored.password, encoded)
+
+
+@override_settings(PASSWORD_HASHER_OPTIONS=FAST_HASHER_OPTIONS)
+class LegacyPasswordHasherTestCase(TestCase):
+    async def test_pbkdf2_sha1_hash_is_verified_and_upgraded(self):
+        # Given
+        user = await User.objects.acreate(
+            email="testuser@example.com",
+            password=make_password("TestPassword123", hasher="pbkdf2_sha1"),
+        )
+
+        # When
+        is_correct = await acheck_password(user, "TestPassword123")
+
+        # Then
+        self.assertTrue(is_correct)
+        stored = await User.objects.aget(pk=user.pk)
+        self.assertTrue(stored.password.startswith(f"{get_hasher().algorithm}$"))
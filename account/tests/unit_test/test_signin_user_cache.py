@@ -0,0 +1,214 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from account.user_cache import (
+    GENERATION_KEY,
+    _email_key,
+    signin_fields,
+    BloomFilter,
+    SignInUserCache,
+    signin_user_cache,
+)
+
+User = get_user_model()
+
+
+class BloomFilterTestCase(TestCase):
+    def test_added_items_are_always_found(self):
+        # Given
+        bloom = BloomFilter(1000, 0.01)
+        emails = [f"user{number}@example.com" for number in range(1000)]
+
+        # When
+        for email in emails:
+            bloom.add(email)
+
+        # Then
+        self.assertTrue(all(email in bloom for email in emails))
+
+    def test_false_positive_rate_stays_near_target(self):
+        # Given
+        bloom = BloomFilter(1000, 0.01)
+        for number in range(1000):
+            bloom.add(f"user{number}@example.com")
+
+        # When
+        false_positives = sum(
+            f"unknown{number}@example.com" in bloom for number in range(10000)
+        )
+
+        # Then
+        self.assertLess(false_positives, 300)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    SIGNIN_USER_CACHE={"ENABLED": True},
+)
+class SignInUserCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        signin_user_cache.clear()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="TestPassword123"
+        )
+
+    def lookup(self, email):
+        # TestCase 의 트랜잭션은 커밋되지 않으므로 커밋 후 콜백을 직접 실행합니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            return signin_user_cache.get_user(email)
+
+    def test_second_lookup_is_served_from_cache(self):
+        # Given
+        self.lookup(self.user.email)
+
+        # When
+        with self.assertNumQueries(0):
+            user = self.lookup(self.user.email)
+
+        # Then
+        self.assertEqual(user, self.user)
+        self.assertEqual(signin_user_cache.stats()["hits"], 1)
+        self.assertEqual(signin_user_cache.stats()["hit_rate"], 0.5)
+
+    def test_cache_stores_only_signin_fields(self):
+        # Given
+        self.lookup(self.user.email)
+
+        # When
+        cached = cache.get(_email_key(self.user.email))
+        with self.assertNumQueries(0):
+            user = self.lookup(self.user.email)
+            checked = user.check_password("TestPassword123")
+
+        # Then
+        self.assertEqual(
+            cached, tuple(getattr(self.user, f) for f in signin_fields(User))
+        )
+        self.assertTrue(checked)
+        self.assertEqual(
+            user.get_deferred_fields(),
+            {"is_staff", "is_superuser", "date_joined", "last_login"},
+        )
+
+    def test_deferred_email_is_not_loaded_on_init(self):
+        # Given
+        for number in range(4):
+            User.objects.create_user(
+                email=f"user{number}@example.com", password="TestPassword123"
+            )
+
+        # When / Then
+        with self.assertNumQueries(1):
+            list(User.objects.only("id"))
+        with self.assertNumQueries(1):
+            list(User.objects.defer("email"))
+
+    def test_saving_deferred_email_user_keeps_email(self):
+        # Given
+        user = User.objects.only("id", "is_active").get(pk=self.user.pk)
+        user.is_active = False
+
+        # When
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+
+        # Then
+        self.assertEqual(User.objects.get(pk=user.pk).email, self.user.email)
+
+    def test_unknown_email_is_rejected_without_query(self):
+        # Given
+        self.lookup(self.user.email)
+
+        # When
+        with self.assertNumQueries(0):
+            user = self.lookup("unknown@example.com")
+
+        # Then
+        self.assertIsNone(user)
+        self.assertEqual(signin_user_cache.stats()["bloom_rejections"], 1)
+
+    def test_user_created_after_rebuild_is_found(self):
+        # Given
+        self.lookup(self.user.email)
+        new_user = User.objects.create_user(
+            email="newuser@example.com", password="TestPassword123"
+        )
+
+        # When
+        user = self.lookup(new_user.email)
+
+        # Then
+        self.assertEqual(user, new_user)
+        self.assertEqual(signin_user_cache.stats()["bloom_rebuilds"], 1)
+
+    def test_signup_in_other_process_disables_negative_answers(self):
+        # Given
+        self.lookup(self.user.email)
+        cache.incr(GENERATION_KEY)
+
+        # When
+        with self.assertNumQueries(1):
+            user = self.lookup("unknown@example.com")
+
+        # Then
+        self.assertIsNone(user)
+
+    def test_save_invalidates_cached_user(self):
+        # Given
+        self.lookup(self.user.email)
+        self.user.is_active = False
+
+        # When
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        with self.assertNumQueries(1):
+            user = self.lookup(self.user.email)
+
+        # Then
+        self.assertFalse(user.is_active)
+
+    def test_email_change_invalidates_previous_email(self):
+        # Given
+        self.lookup(self.user.email)
+        self.user.email = "renamed@example.com"
+
+        # When
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        # Then
+        self.assertIsNone(self.lookup("testuser@example.com"))
+        self.assertEqual(self.lookup("renamed@example.com"), self.user)
+
+    def test_delete_invalidates_cached_user(self):
+        # Given
+        self.lookup(self.user.email)
+
+        # When
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+
+        # Then
+        self.assertIsNone(self.lookup("testuser@example.com"))
+
+    def test_lookup_is_case_sensitive_like_database(self):
+        # Given
+        self.lookup(self.user.email)
+
+        # When
+        user = self.lookup("TestUser@example.com")
+
+        # Then
+        self.assertIsNone(user)
+
+
+class SignInUserCacheSettingsTestCase(TestCase):
+    def test_process_local_cache_is_disabled_by_default(self):
+        # When
+        with self.settings(SIGNIN_USER_CACHE={}):
+            enabled = SignInUserCache().enabled
+
+        # Then
+        self.assertFalse(enabled)
@@ -0,0 +1,91 @@
+from django.test import SimpleTestCase
+
+from account.validators import (
+    signin_email_error,
+    signin_password_error,
+    signup_email_errors,
+    signup_password_errors,
+)
+
+LOCAL_PART_MESSAGE = (
+    "Email local part can only contain letters, numbers, dots, underscores and hyphens."
+)
+
+
+class SignUpValidatorTestCase(SimpleTestCase):
+    def test_valid_values_have_no_errors(self):
+        self.assertEqual(signup_email_errors("user.name@example.com"), [])
+        self.assertEqual(signup_password_errors("SecurePass123"), [])
+
+    def test_email_errors_are_collected_in_order(self):
+        self.assertEqual(
+            signup_email_errors("invalid!email"),
+            [
+                "Invalid email format",
+                "Invalid character in email",
+                "Email must contain @ symbol",
+            ],
+        )
+
+    def test_password_errors_are_collected_in_order(self):
+        self.assertEqual(
+            signup_password_errors("    "),
+            [
+                "Password must contain at least one lowercase letter",
+                "Password must contain at least one uppercase letter",
+                "Password must contain at least one digit",
+                "Password must not contain spaces",
+                "Password must be between 6 and 30 characters long",
+            ],
+        )
+
+    def test_password_uses_unicode_character_classes(self):
+        # Given: é 는 소문자, Ä 는 대문자, ٣ 은 숫자로 분류됩니다.
+        password = "éÄ٣éÄ٣"
+
+        # When / Then
+        self.assertEqual(signup_password_errors(password), [])
+
+
+class SignInValidatorTestCase(SimpleTestCase):
+    def test_valid_values_have_no_error(self):
+        self.assertIsNone(signin_email_error("user.name@example.com"))
+        self.assertIsNone(signin_password_error("SecurePass123"))
+
+    def test_email_errors(self):
+        cases = {
+            "invalid-email": "Invalid email format.",
+            "a" * 250 + "@example.com": "Email must not exceed 254 characters.",
+            "user%name@example.com": LOCAL_PART_MESSAGE,
+            "user+tag@example.com": LOCAL_PART_MESSAGE,
+            "user@other.com": (
+                "Email domain not allowed. Allowed domains are: example.com, yourdomain.com"
+            ),
+        }
+        for email, message in cases.items():
+            with self.subTest(email=email):
+                self.assertEqual(signin_email_error(email), message)
+
+    def test_password_errors(self):
+        cases = {
+            "Short1": "Password must be at least 8 characters long.",
+            "Pässword123": "Password must not contain Unicode characters.",
+            "password123": "Password must contain at least one uppercase letter.",
+            "PASSWORD123": "Password must contain at least one lowercase letter.",
+            "PasswordOnly": "Password must contain at least one digit.",
+        }
+        for password, message in cases.items():
+            with self.subTest(password=password):
+                self.assertEqual(signin_password_error(password), message)
+
+    def test_allowed_domains_follow_settings(self):
+        # When
+        with self.settings(ACCOUNT_ALLOWED_EMAIL_DOMAINS=["other.com"]):
+            allowed = signin_email_error("user@other.com")
+            rejected = signin_email_error("user@example.com")
+
+        # Then
+        self.assertIsNone(allowed)
+        self.assertEqual(
+            rejected, "Email domain not allowed. Allowed domains are: other.com"
+        )
@@ -1,7 +1,35 @@
 from django.urls import path
-from .views import SignUpView, SignInView
+from django.views.decorators.csrf import csrf_exempt
+from .views import (
+    SignUpView,
+    SignInView,
+    AsyncSignUpView,
+    AsyncSignInView,
+    SignInUserCacheStatsView,
+    BulkUserImportView,
+)
 
 urlpatterns = [
     path("user-signup/", SignUpView.as_view(), name="user-signup"),
     path("user-signin/", SignInView.as_view(), name="user-signin"),
+    path(
+        "async/user-signup/",
+        csrf_exempt(AsyncSignUpView.as_view()),
+        name="user-signup-async",
+    ),
+    path(
+        "async/user-signin/",
+        csrf_exempt(AsyncSignInView.as_view()),
+        name="user-signin-async",
+    ),
+    path(
+        "signin-cache-stats/",
+        SignInUserCacheStatsView.as_view(),
+        name="signin-cache-stats",
+    ),
+    path(
+        "users/bulk-import/",
+        BulkUserImportView.as_view(),
+        name="user-bulk-import",
+    ),
 ]
@@ -0,0 +1,325 @@
+import hashlib
+import math
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import router, transaction
+
+DEFAULTS = {
+    # None 이면 캐시 백엔드가 프로세스끼리 공유될 때(Redis, Memcached 등)만 켭니다.
+    "ENABLED": None,
+    "CACHE_ALIAS": "default",
+    "TIMEOUT": 300,
+    # 무효화 직후 이 시간 동안은 같은 이메일을 다시 캐시하지 않습니다.
+    "INVALIDATION_GRACE": 5,
+    "BLOOM_FILTER": True,
+    "BLOOM_ERROR_RATE": 0.001,
+    "BLOOM_REBUILD_INTERVAL": 600,
+    # 다른 프로세스에서 가입이 생겨 필터가 낡았을 때 다시 만드는 최소 간격입니다.
+    "BLOOM_STALE_REBUILD_INTERVAL": 30,
+}
+
+KEY_PREFIX = "signin-user"
+# 로그인에 필요한 필드만 캐시합니다. 비밀번호 해시는 check_password 에 필요합니다.
+SIGNIN_FIELDS = ("id", "email", "password", "is_active")
+GENERATION_KEY = f"{KEY_PREFIX}:generation"
+_INVALIDATED = "invalidated"
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def _email_key(email: str) -> str:
+    digest = hashlib.blake2b(normalize_email(email).encode(), digest_size=16)
+    return f"{KEY_PREFIX}:email:{digest.hexdigest()}"
+
+
+def _pk_key(pk) -> str:
+    return f"{KEY_PREFIX}:pk:{pk}"
+
+
+def signin_fields(model) -> tuple:
+    """
+    SIGNIN_FIELDS 를 Model.from_db 가 기대하는 모델 필드 순서로 돌려줍니다.
+    """
+    return tuple(
+        field.attname
+        for field in model._meta.concrete_fields
+        if field.attname in SIGNIN_FIELDS
+    )
+
+
+class BloomFilter:
+    """
+    이메일 집합을 비트 배열로 근사합니다. "없다" 는 답은 항상 맞고,
+    "있다" 는 답은 error_rate 확률로 틀릴 수 있습니다.
+    """
+
+    __slots__ = ("size", "hash_count", "bits")
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(
+            64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        # 해시 하나를 두 값으로 나눠 k 개의 위치를 만듭니다 (Kirsch-Mitzenmacher).
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class SignInUserCache:
+    """
+    로그인 시 이메일로 사용자를 찾는 조회를 캐시합니다.
+
+    - 찾은 사용자는 SIGNIN_FIELDS 값만 정규화한 이메일을 키로 TIMEOUT 동안 캐시하고,
+      사용자가 저장되거나 삭제되면 시그널(account.signals)로 지웁니다.
+    - 가입된 이메일 전체로 블룸 필터를 만들어 두고, 필터에 없는 이메일은 DB 를 조회하지 않고 거절합니다.
+      필터는 BLOOM_REBUILD_INTERVAL 마다 다시 만듭니다.
+
+    시그널을 보내지 않는 쓰기(QuerySet.update, bulk_create 등)는 캐시에 반영되지 않으므로
+    직접 invalidate 나 add_known_email 을 불러야 합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._bloom_built_at = 0.0
+        self._bloom_generation = None
+        self._rebuilding = False
+        self.reset_stats()
+
+    @property
+    def options(self) -> dict:
+        return {**DEFAULTS, **getattr(settings, "SIGNIN_USER_CACHE", {})}
+
+    @property
+    def cache(self):
+        return caches[self.options["CACHE_ALIAS"]]
+
+    @property
+    def enabled(self) -> bool:
+        enabled = self.options["ENABLED"]
+        if enabled is None:
+            # 프로세스마다 따로인 캐시에서는 다른 워커의 무효화가 보이지 않습니다.
+            return not isinstance(self.cache, (LocMemCache, DummyCache))
+        return enabled
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = dict.fromkeys(
+                (
+                    "hits",
+                    "misses",
+                    "bloom_rejections",
+                    "bloom_false_positives",
+                    "bloom_rebuilds",
+                ),
+                0,
+            )
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        """
+        이 프로세스에서 모은 조회 통계입니다.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            bloom = self._bloom
+            built_at = self._bloom_built_at
+        lookups = stats["hits"] + stats["misses"]
+        requests = lookups + stats["bloom_rejections"]
+        return {
+            **stats,
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else None,
+            "query_avoidance_rate": (
+                round((stats["hits"] + stats["bloom_rejections"]) / requests, 4)
+                if requests
+                else None
+            ),
+            "bloom_bits": bloom.size if bloom is not None else None,
+            "bloom_age_seconds": (
+                round(time.monotonic() - built_at, 1) if bloom is not None else None
+            ),
+        }
+
+    def get_user(self, email: str):
+        """
+        email 과 정확히 일치하는 사용자를 돌려줍니다. 없으면 None 입니다.
+        """
+        User = get_user_model()
+        if not self.enabled:
+            return User.objects.filter(email=email).first()
+
+        in_bloom = self._bloom_lookup(email)
+        if in_bloom is False:
+            self._count("bloom_rejections")
+            return None
+
+        key = _email_key(email)
+        cached = self.cache.get(key)
+        fields = signin_fields(User)
+        # 키는 소문자 이메일이지만 조회는 대소문자를 구분하므로 이메일까지 확인합니다.
+        if isinstance(cached, tuple) and cached[fields.index("email")] == email:
+            self._count("hits")
+            # 나머지 필드는 지연된 채로 두었다가 읽을 때 불러옵니다.
+            return User.from_db(router.db_for_read(User), fields, cached)
+
+        self._count("misses")
+        user = User.objects.filter(email=email).first()
+        if user is None:
+            if in_bloom:
+                self._count("bloom_false_positives")
+        elif cached is None:
+            # 커밋된 값만 캐시합니다. 트랜잭션 밖이면 바로 실행됩니다.
+            transaction.on_commit(lambda: self._store(user))
+        return user
+
+    aget_user = sync_to_async(get_user)
+
+    def _store(self, user):
+        timeout = self.options["TIMEOUT"]
+        # add 는 무효화 표시가 남아 있으면 아무것도 하지 않으므로
+        # 조회와 저장 사이에 바뀐 사용자를 다시 캐시하지 않습니다.
+        values = tuple(getattr(user, field) for field in signin_fields(type(user)))
+        if self.cache.add(_email_key(user.email), values, timeout):
+            self.cache.set(_pk_key(user.pk), user.email, timeout)
+
+    def invalidate(self, user):
+        """
+        user 의 현재 이메일과 캐시에 있던 이전 이메일 항목을 모두 지웁니다.
+        """
+        if not self.enabled:
+            return
+        cache = self.cache
+        grace = self.options["INVALIDATION_GRACE"]
+        emails = {user.email}
+        previous = cache.get(_pk_key(user.pk))
+        if previous is not None:
+            emails.add(previous)
+        cache.set_many({_email_key(email): _INVALIDATED for email in emails}, grace)
+        cache.delete(_pk_key(user.pk))
+
+    def add_known_email(self, email: str):
+        """
+        새로 가입한 이메일을 블룸 필터에 더하고 다른 프로세스의 필터가 낡았음을 알립니다.
+        """
+        self.add_known_emails([email])
+
+    def add_known_emails(self, emails):
+        """
+        add_known_email 과 같지만 세대는 한 번만 올립니다. bulk_create 뒤에 부릅니다.
+        """
+        if not self.enabled or not self.options["BLOOM_FILTER"]:
+            return
+        with self._lock:
+            if self._bloom is not None:
+                for email in emails:
+                    self._bloom.add(normalize_email(email))
+        generation = self._bump_generation()
+        with self._lock:
+            # 중간에 다른 프로세스의 가입이 없었다면 이 프로세스의 필터는 여전히 최신입니다.
+            if self._bloom_generation == generation - 1:
+                self._bloom_generation = generation
+
+    def _bump_generation(self) -> int:
+        cache = self.cache
+        try:
+            return cache.incr(GENERATION_KEY)
+        except ValueError:
+            cache.add(GENERATION_KEY, 0, None)
+            return cache.incr(GENERATION_KEY)
+
+    def _bloom_lookup(self, email: str):
+        """
+        블룸 필터에 있으면 True, 확실히 없으면 False, 필터를 믿을 수 없으면 None 입니다.
+        """
+        options = self.options
+        if not options["BLOOM_FILTER"]:
+            return None
+        bloom = self._current_bloom(options)
+        if bloom is None:
+            return None
+        if normalize_email(email) in bloom:
+            return True
+        # 필터를 만든 뒤 다른 프로세스에서 가입이 있었다면 "없다" 는 답을 믿지 않습니다.
+        if self.cache.get(GENERATION_KEY, 0) != self._bloom_generation:
+            age = time.monotonic() - self._bloom_built_at
+            if age >= options["BLOOM_STALE_REBUILD_INTERVAL"]:
+                self.rebuild_bloom()
+            return None
+        return False
+
+    def _current_bloom(self, options):
+        age = time.monotonic() - self._bloom_built_at
+        if self._bloom is None or age >= options["BLOOM_REBUILD_INTERVAL"]:
+            self.rebuild_bloom()
+        return self._bloom
+
+    def rebuild_bloom(self):
+        """
+        DB 의 모든 이메일로 블룸 필터를 다시 만듭니다. 다른 스레드가 만드는 중이면 기다리지 않고
+        기존 필터를 계속 씁니다.
+        """
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        try:
+            options = self.options
+            # 세대를 먼저 읽어야 읽는 도중에 생긴 가입이 필터를 낡은 것으로 만듭니다.
+            generation = self.cache.get(GENERATION_KEY, 0)
+            users = get_user_model().objects.all()
+            bloom = BloomFilter(
+                max(1024, users.count() * 2), options["BLOOM_ERROR_RATE"]
+            )
+            for email in users.values_list("email", flat=True).iterator(
+                chunk_size=2000
+            ):
+                bloom.add(normalize_email(email))
+            with self._lock:
+                self._bloom = bloom
+                self._bloom_generation = generation
+                self._bloom_built_at = time.monotonic()
+                self._stats["bloom_rebuilds"] += 1
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def clear(self):
+        """
+        블룸 필터와 통계를 버립니다. 캐시 항목은 TIMEOUT 이 지나면 사라집니다.
+        """
+        with self._lock:
+            self._bloom = None
+            self._bloom_generation = None
+            self._bloom_built_at = 0.0
+        self.reset_stats()
+
+
+signin_user_cache = SignInUserCache()
@@ -1,2 +1,146 @@
-from django.core.exceptions import ValidationError
-import abc
+import re
+import string
+
+from django.conf import settings
+
+# 회원가입 이메일
+SIGNUP_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+SIGNUP_EMAIL_FORBIDDEN_CHARACTERS = frozenset("!#$%^&*()=+[]';,/{}|\":<>?")
+
+# 로그인 이메일
+SIGNIN_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+SIGNIN_EMAIL_LOCAL_PART_PATTERN = re.compile(r"^[a-zA-Z0-9._-]+$")
+SIGNIN_EMAIL_DOMAIN_PATTERN = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+SIGNIN_EMAIL_MAX_LENGTH = 254
+
+DEFAULT_ALLOWED_EMAIL_DOMAINS = ("example.com", "yourdomain.com")
+
+ASCII_UPPERCASE = frozenset(string.ascii_uppercase)
+ASCII_LOWERCASE = frozenset(string.ascii_lowercase)
+ASCII_DIGITS = frozenset(string.digits)
+
+_allowed_domains_cache = (None, (), frozenset())
+
+
+def allowed_email_domains():
+    """
+    settings.ACCOUNT_ALLOWED_EMAIL_DOMAINS 를 (오류 메시지용 순서 있는 튜플, 검사용 frozenset) 으로 돌려줍니다.
+    설정 객체가 바뀔 때만(override_settings 등) 다시 만듭니다.
+    """
+    global _allowed_domains_cache
+    configured = getattr(
+        settings, "ACCOUNT_ALLOWED_EMAIL_DOMAINS", DEFAULT_ALLOWED_EMAIL_DOMAINS
+    )
+    source, ordered, lookup = _allowed_domains_cache
+    if configured is not source:
+        ordered = tuple(configured)
+        lookup = frozenset(ordered)
+        _allowed_domains_cache = (configured, ordered, lookup)
+    return ordered, lookup
+
+
+def signup_email_errors(value: str) -> list[str]:
+    errors = []
+
+    if not SIGNUP_EMAIL_PATTERN.match(value):
+        errors.append("Invalid email format")
+
+    if not SIGNUP_EMAIL_FORBIDDEN_CHARACTERS.isdisjoint(value):
+        errors.append("Invalid character in email")
+
+    if "@" not in value:
+        errors.append("Email must contain @ symbol")
+
+    return errors
+
+
+def signup_password_errors(value: str) -> list[str]:
+    # 서로 다른 문자만 한 번 훑으며 세 종류를 모두 찾으면 멈춥니다.
+    has_lower = has_upper = has_digit = False
+    for char in set(value):
+        if char.islower():
+            has_lower = True
+        elif char.isupper():
+            has_upper = True
+        elif char.isdigit():
+            has_digit = True
+        else:
+            continue
+        if has_lower and has_upper and has_digit:
+            break
+
+    errors = []
+
+    if not has_lower:
+        errors.append("Password must contain at least one lowercase letter")
+
+    if not has_upper:
+        errors.append("Password must contain at least one uppercase letter")
+
+    if not has_digit:
+        errors.append("Password must contain at least one digit")
+
+    if " " in value:
+        errors.append("Password must not contain spaces")
+
+    if not 5 < len(value) < 31:
+        errors.append("Password must be between 6 and 30 characters long")
+
+    return errors
+
+
+def signin_email_error(value: str) -> str | None:
+    # 기본 이메일 형식 검증
+    if not SIGNIN_EMAIL_PATTERN.match(value):
+        return "Invalid email format."
+
+    # 길이 검증
+    if len(value) > SIGNIN_EMAIL_MAX_LENGTH:
+        return "Email must not exceed 254 characters."
+
+    # 공백 검사
+    if " " in value:
+        return "Email must not contain spaces."
+
+    # 형식 검증을 통과했으므로 @ 는 정확히 하나입니다.
+    local_part, _, domain = value.partition("@")
+
+    # 로컬 파트 검증
+    if not SIGNIN_EMAIL_LOCAL_PART_PATTERN.match(local_part):
+        return "Email local part can only contain letters, numbers, dots, underscores and hyphens."
+
+    # 특정 특수 문자 제한 (예: '+' 문자 거부)
+    if "+" in local_part:
+        return "Email must not contain '+' character."
+
+    # 도메인 파트 검증
+    if not SIGNIN_EMAIL_DOMAIN_PATTERN.match(domain):
+        return "Invalid email domain."
+
+    # 허용한 도메인만 받습니다.
+    ordered, lookup = allowed_email_domains()
+    if domain not in lookup:
+        return f"Email domain not allowed. Allowed domains are: {', '.join(ordered)}"
+
+    return None
+
+
+def signin_password_error(value: str) -> str | None:
+    # 비밀번호 길이 검증
+    if len(value) < 8:
+        return "Password must be at least 8 characters long."
+
+    # 유니코드 문자 검사
+    if not value.isascii():
+        return "Password must not contain Unicode characters."
+
+    # ASCII 만 남았으므로 대문자, 소문자, 숫자 포함 여부를 문자 집합 하나로 검증합니다.
+    chars = set(value)
+    if ASCII_UPPERCASE.isdisjoint(chars):
+        return "Password must contain at least one uppercase letter."
+    if ASCII_LOWERCASE.isdisjoint(chars):
+        return "Password must contain at least one lowercase letter."
+    if ASCII_DIGITS.isdisjoint(chars):
+        return "Password must contain at least one digit."
+
+    return None
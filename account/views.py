@@ -5,6 +5,19 @@ from account.serializers import UserSignUpSerializer, UserSignInSerializer
 from rest_framework.views import APIView
 from django.contrib.auth import authenticate
 from rest_framework_simplejwt.tokens import RefreshToken
+import json
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views import View
+from account.bulk_import import import_users
+from account.hashers import (
+    acheck_password,
+    bulk_hash_worker_count,
+    get_bulk_hash_executor,
+)
+from django.conf import settings
+from account.user_cache import signin_user_cache
+from rest_framework.permissions import IsAdminUser
 
 User = get_user_model()
 
@@ -23,9 +36,9 @@ class SignInView(APIView):
             email = serializer.validated_data["email"].strip()
             password = serializer.validated_data["password"]
 
-            try:
-                user = User.objects.get(email=email)
+            user = signin_user_cache.get_user(email)
 
+            if user is not None:
                 if not user.is_active:
                     return Response(
                         {"error": "User account is disabled"},
@@ -40,11 +53,139 @@ class SignInView(APIView):
                         },
                         status=status.HTTP_200_OK,
                     )
-            except User.DoesNotExist:
-                pass
 
             return Response(
                 {"error": "Invalid credentials"},
                 status=status.HTTP_401_UNAUTHORIZED,
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _request_data(request):
+    """
+    DRF 파서처럼 JSON 본문과 폼 본문을 모두 받습니다.
+    """
+    if request.content_type == "application/json":
+        try:
+            return json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+    return request.POST
+
+
+class AsyncSignUpView(View):
+    """
+    ASGI 배포용 SignUpView 입니다. 응답 형식은 SignUpView 와 같습니다.
+    """
+
+    async def post(self, request):
+        data = _request_data(request)
+        if data is None:
+            return JsonResponse(
+                {"detail": "JSON parse error"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = UserSignUpSerializer(data=data)
+        # 이메일 중복 검사(UniqueValidator)가 동기 ORM 을 쓰므로 스레드에서 검증합니다.
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        user = await User.objects.acreate_user(**serializer.validated_data)
+        return JsonResponse(
+            UserSignUpSerializer(user).data, status=status.HTTP_201_CREATED
+        )
+
+
+class AsyncSignInView(View):
+    """
+    ASGI 배포용 SignInView 입니다. 사용자 조회는 스레드에서,
+    비밀번호 검증은 해시 전용 스레드 풀에서 하므로 이벤트 루프를 막지 않습니다.
+    """
+
+    async def post(self, request):
+        data = _request_data(request)
+        if data is None:
+            return JsonResponse(
+                {"detail": "JSON parse error"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = UserSignInSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        email = serializer.validated_data["email"].strip()
+        password = serializer.validated_data["password"]
+
+        user = await signin_user_cache.aget_user(email)
+
+        if user is not None:
+            if not user.is_active:
+                return JsonResponse(
+                    {"error": "User account is disabled"},
+                    status=status.HTTP_401_UNAUTHORIZED,
+                )
+            if await acheck_password(user, password):
+                refresh = RefreshToken.for_user(user)
+                return JsonResponse(
+                    {
+                        "refresh": str(refresh),
+                        "access": str(refresh.access_token),
+                    },
+                    status=status.HTTP_200_OK,
+                )
+
+        return JsonResponse(
+            {"error": "Invalid credentials"},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+
+
+class SignInUserCacheStatsView(APIView):
+    """
+    이 프로세스의 로그인 사용자 캐시 적중률을 관리자에게 보여 줍니다.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(signin_user_cache.stats())
+
+
+class BulkUserImportView(APIView):
+    """
+    관리자가 [{"email": ..., "password": ...}, ...] 목록으로 사용자를 한꺼번에 만듭니다.
+    비밀번호는 요청을 처리하는 프로세스를 fork 하지 않도록 일괄 가져오기 전용 스레드 풀에서 계산합니다.
+    한 요청의 행 수는 settings.BULK_IMPORT_MAX_ROWS 로 제한합니다. 더 큰 목록은 import_users 명령을 씁니다.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        rows = request.data
+        if isinstance(rows, dict):
+            rows = rows.get("users")
+        if not isinstance(rows, list):
+            return Response(
+                {"error": "Expected a list of users"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        max_rows = settings.BULK_IMPORT_MAX_ROWS
+        if max_rows is not None and len(rows) > max_rows:
+            return Response(
+                {"error": f"Too many users (max {max_rows} per request)"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        result = import_users(
+            rows,
+            max_workers=bulk_hash_worker_count(),
+            executor=get_bulk_hash_executor(),
+        )
+        if result.ok:
+            response_status = status.HTTP_201_CREATED
+        elif result.created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(result.as_dict(), status=response_status)
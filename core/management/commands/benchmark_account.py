@@ -0,0 +1,147 @@
+import json
+import logging
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test.runner import DiscoverRunner
+from django.test.utils import (
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.utils.endpoint_benchmark import benchmark_endpoint, environment_metadata
+
+BENCHMARK_PASSWORD = "Benchmark123"
+SIGNIN_EMAIL = "bench-signin@example.com"
+
+
+def _signup_payloads(count):
+    for number in range(count):
+        yield {
+            "email": f"bench-signup-{number}@example.com",
+            "password": BENCHMARK_PASSWORD,
+        }
+
+
+def _signin_payloads(count):
+    for _ in range(count):
+        yield {"email": SIGNIN_EMAIL, "password": BENCHMARK_PASSWORD}
+
+
+def _signin_invalid_password_payloads(count):
+    for _ in range(count):
+        yield {"email": SIGNIN_EMAIL, "password": "WrongPassword123"}
+
+
+def _signin_unknown_user_payloads(count):
+    for number in range(count):
+        yield {
+            "email": f"bench-unknown-{number}@example.com",
+            "password": BENCHMARK_PASSWORD,
+        }
+
+
+# 시나리오 이름 -> (URL 이름, 요청 본문 생성기)
+SCENARIOS = {
+    "signup": ("user-signup", _signup_payloads),
+    "signin": ("user-signin", _signin_payloads),
+    "signin_invalid_password": ("user-signin", _signin_invalid_password_payloads),
+    "signin_unknown_user": ("user-signin", _signin_unknown_user_payloads),
+}
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the account sign-up and sign-in endpoints and reports JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenarios",
+            nargs="+",
+            choices=list(SCENARIOS),
+            default=list(SCENARIOS),
+            help="Scenarios to run (default: all)",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=50,
+            help="Measured requests per scenario",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=5,
+            help="Unmeasured requests sent before each scenario",
+        )
+        parser.add_argument(
+            "--password-hasher",
+            help="Override PASSWORD_HASHERS with this hasher (e.g. to measure framework overhead)",
+        )
+        parser.add_argument(
+            "--signin-cache",
+            action="store_true",
+            help="Enable the sign-in user cache even with a process-local cache backend",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this file instead of stdout",
+        )
+
+    def handle(self, *args, **options):
+        overrides = {}
+        if options["password_hasher"]:
+            overrides["PASSWORD_HASHERS"] = [options["password_hasher"]]
+        if options["signin_cache"]:
+            overrides["SIGNIN_USER_CACHE"] = {
+                **getattr(settings, "SIGNIN_USER_CACHE", {}),
+                "ENABLED": True,
+            }
+
+        # 개발 DB 를 건드리지 않도록 테스트 러너처럼 테스트 DB 를 만들어 사용합니다.
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        setup_test_environment()
+        old_config = runner.setup_databases()
+        # 401/400 응답마다 남는 경고 로그가 측정과 출력을 방해하지 않게 합니다.
+        request_logger = logging.getLogger("django.request")
+        old_level = request_logger.level
+        request_logger.setLevel(logging.ERROR)
+        try:
+            with override_settings(**overrides):
+                report = self.run_scenarios(
+                    options["scenarios"], options["requests"], options["warmup"]
+                )
+        finally:
+            request_logger.setLevel(old_level)
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(output + "\n")
+            self.stderr.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(output)
+
+    def run_scenarios(self, scenarios, requests, warmup) -> dict:
+        get_user_model().objects.create_user(
+            email=SIGNIN_EMAIL, password=BENCHMARK_PASSWORD
+        )
+        client = APIClient()
+
+        results = {}
+        for name in scenarios:
+            url_name, payloads = SCENARIOS[name]
+            self.stderr.write(f"Running {name} ({requests} requests)...")
+            results[name] = benchmark_endpoint(
+                client, reverse(url_name), payloads(warmup + requests), warmup
+            )
+
+        return {
+            "meta": environment_metadata(requests=requests, warmup=warmup),
+            "scenarios": results,
+        }
@@ -0,0 +1,113 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password, verify_password
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from core.utils.endpoint_benchmark import environment_metadata
+
+BENCHMARK_PASSWORD = "Benchmark123"
+
+
+class Command(BaseCommand):
+    help = "Measures password hashing cost and logins per second per core for each hasher tier"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tiers",
+            nargs="+",
+            choices=list(settings.PASSWORD_HASHER_TIERS),
+            default=list(settings.PASSWORD_HASHER_TIERS),
+            help="Hasher tiers to measure (default: all)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="Password verifications per measurement",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=None,
+            help="Threads for the parallel measurement (default: PASSWORD_HASHING_WORKERS or CPU count)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this file instead of stdout",
+        )
+
+    def handle(self, *args, **options):
+        threads = (
+            options["threads"] or settings.PASSWORD_HASHING_WORKERS or os.cpu_count()
+        )
+        results = {}
+        for tier in options["tiers"]:
+            hasher_path = settings.PASSWORD_HASHER_TIERS[tier]
+            with override_settings(PASSWORD_HASHERS=[hasher_path]):
+                self.stderr.write(f"Measuring {tier}...")
+                results[tier] = self.measure(options["iterations"], threads)
+
+        report = {
+            "meta": environment_metadata(
+                iterations=options["iterations"], threads=threads
+            ),
+            "tiers": results,
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(output + "\n")
+            self.stderr.write(f"Benchmark report written to {options['output']}")
+        else:
+            self.stdout.write(output)
+
+    @staticmethod
+    def measure(iterations, threads) -> dict:
+        hasher = get_hasher()
+        try:
+            encoded = make_password(BENCHMARK_PASSWORD)
+        except ValueError as error:
+            # argon2-cffi 처럼 선택 설치 라이브러리가 없는 해셔는 건너뜁니다.
+            return {"hasher": hasher.algorithm, "skipped": str(error)}
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            make_password(BENCHMARK_PASSWORD)
+        hash_seconds = (time.perf_counter() - start) / iterations
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            verify_password(BENCHMARK_PASSWORD, encoded)
+        verify_seconds = (time.perf_counter() - start) / iterations
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            list(
+                executor.map(
+                    verify_password,
+                    [BENCHMARK_PASSWORD] * (iterations * threads),
+                    [encoded] * (iterations * threads),
+                )
+            )
+            parallel_seconds = time.perf_counter() - start
+
+        return {
+            "hasher": hasher.algorithm,
+            "summary": {
+                str(key): str(value)
+                for key, value in hasher.safe_summary(encoded).items()
+                if str(key) not in ("salt", "hash")
+            },
+            "hash_ms": round(hash_seconds * 1000, 3),
+            "verify_ms": round(verify_seconds * 1000, 3),
+            "logins_per_second_per_core": round(1 / verify_seconds, 2),
+            "threads": threads,
+            "logins_per_second_threaded": round(
+                iterations * threads / parallel_seconds, 2
+            ),
+        }
@@ -9,9 +9,18 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
             "type",
-            choices=["unit", "integration", "."],
+            choices=["unit", "integration", "changed", "."],
             default=".",
-            help="Specify the type of tests to run (unit/integration/all)",
+            help="Specify the type of tests to run (unit/integration/changed/all)",
+        )
+        parser.add_argument(
+            "--parallel",
+            nargs="?",
+            const="auto",
+            help=(
+                "Run test cases in N worker processes (or 'auto' for one per core), "
+                "balanced by the durations recorded in TEST_TIMINGS_FILE"
+            ),
         )
 
     def run_from_argv(self, argv):
@@ -27,13 +36,19 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         test_type = options.pop("type")
+        parallel = options.pop("parallel")
 
         if test_type == "unit":
             settings.TEST_RUNNER = "core.utils.test_runners.UnitTestRunner"
         elif test_type == "integration":
             settings.TEST_RUNNER = "core.utils.test_runners.IntegrationTestRunner"
+        elif test_type == "changed":
+            settings.TEST_RUNNER = "core.utils.test_runners.ImpactTestRunner"
         else:  # 'all'
-            settings.TEST_RUNNER = "django.test.runner.DiscoverRunner"
+            settings.TEST_RUNNER = "core.utils.test_runners.ParallelDiscoverRunner"
+
+        if parallel is not None:
+            args += (f"--parallel={parallel}",)
 
         # Django의 기본 test 명령어 호출
         # 알려지지 않은 인자들을 포함한 모든 추가 인자를 그대로 전달합니다.
@@ -0,0 +1,92 @@
+import csv
+import json
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from account.bulk_import import DEFAULT_BATCH_SIZE, import_users
+
+
+def _read_rows(path: Path):
+    """
+    CSV(email,password 헤더), JSON Lines(.jsonl) 또는 JSON 배열(.json) 파일에서 행을 읽습니다.
+    """
+    if path.suffix == ".json":
+        with path.open() as file:
+            yield from json.load(file)
+    elif path.suffix == ".jsonl":
+        with path.open() as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with path.open(newline="") as file:
+            yield from csv.DictReader(file)
+
+
+class Command(BaseCommand):
+    help = "Creates users in bulk from a CSV, JSON or JSON Lines file of email/password rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV (email,password), .json or .jsonl file")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Rows validated, hashed and inserted together",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Processes used to hash passwords (default: CPU count)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only validate the rows",
+        )
+        parser.add_argument(
+            "--errors-output",
+            help="Write the per-row errors to this file as JSON Lines",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"File not found: {path}")
+
+        result = import_users(
+            _read_rows(path),
+            batch_size=options["batch_size"],
+            max_workers=options["workers"] or os.cpu_count() or 1,
+            dry_run=options["dry_run"],
+            progress=self.report_progress,
+        )
+
+        for error in result.errors[:20]:
+            self.stderr.write(f"row {error.row}: {error.email} {error.errors}")
+        if len(result.errors) > 20:
+            self.stderr.write(f"... {len(result.errors) - 20} more errors")
+        if options["errors_output"]:
+            with open(options["errors_output"], "w") as file:
+                for error in result.errors:
+                    file.write(json.dumps(error._asdict(), ensure_ascii=False) + "\n")
+
+        timings = ", ".join(
+            f"{name} {seconds:.2f}s" for name, seconds in result.timings.items()
+        )
+        summary = (
+            f"{result.rows} rows, {result.created} created, {len(result.errors)} failed "
+            f"in {result.elapsed:.2f}s ({result.users_per_second or 0:.1f} users/s; {timings})"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(summary) if result.ok else self.style.WARNING(summary)
+        )
+
+    def report_progress(self, result):
+        self.stderr.write(
+            f"{result.rows} rows processed, {result.created} created "
+            f"({result.users_per_second or 0:.1f} users/s)"
+        )
@@ -1,8 +1,48 @@
-from django.test import SimpleTestCase
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.runner import iter_test_cases
+from django.urls import reverse
+import requests
+from rest_framework.test import APIClient
+from core.utils.endpoint_benchmark import benchmark_endpoint
+from core.utils.issue_related_tests import (
+    GitHubIssueBackend,
+    JSONFileIssueBackend,
+    get_test_issue_names,
+)
+from core.utils.markdown_batch import parse_batch
+from core.utils.markdown_cache import MarkdownParseCache
+from core.utils.markdown_diff import diff_markdown
+from core.utils.markdown_search import MappedMarkdownSearchIndex, MarkdownSearchIndex
+from core.utils.test_discovery import find_test_modules
+from core.utils.test_impact import CoverageRecorder, ImpactMap, select_impacted_tests
+from core.utils.test_selection import TestNameMatcher, TestSelection
+from core.utils.test_runners import (
+    ImpactTestSuite,
+    ImpactTextTestResult,
+    ParallelDiscoverRunner,
+    UnitTestRunner,
+    load_timings,
+    save_timings,
+)
 from core.utils.markdown_parser import (
     MarkdownParser,
+    MarkdownIndex,
+    MarkdownParseError,
+    MarkdownSection,
+    MarkdownTreeSection,
     SingleHeadingMarkdown,
     MultiHeadingMarkdown,
+    _level_patterns,
 )
 
 single_heading_markdown = """
@@ -208,3 +248,973 @@ class MarkdownParserTestCase(SimpleTestCase):
         self.assertEqual(markdown["Subtitle_h2"].title, "Subtitle_h2")
         self.assertIsInstance(markdown, MultiHeadingMarkdown)
         self.assertEqual(markdown.parsed_markdown.get("comment"), None)
+
+    def test_parse_builds_nested_sections(self):
+        markdown = MarkdownParser.parse(single_heading_markdown)
+
+        subtitle = markdown["Title_h1"]["Subtitle_h2"]
+        self.assertEqual(subtitle.comment, "주석_h2")
+        self.assertEqual(subtitle.body, "sub_content")
+        self.assertEqual(
+            list(subtitle.sub_sections), ["Subsubtitle_h3", "Subsubtitle_h3_2"]
+        )
+        self.assertEqual(
+            subtitle["Subsubtitle_h3"]["Subsubsubtitle_h4"].body, "subsubsub_content"
+        )
+        self.assertIsNone(subtitle["Subsubtitle_h3"]["Subsubsubtitle_h4"].comment)
+        self.assertEqual(markdown["Title_h1"]["Title_h2_3"].body, "")
+
+    def test_parse_treats_skipped_level_heading_as_body(self):
+        markdown = MarkdownParser.parse("# Title_h1\n\nbody\n\n### Deep_h3\n\ndeep")
+
+        self.assertEqual(markdown["Title_h1"].body, "body\n\n### Deep_h3\n\ndeep")
+        self.assertIsNone(markdown["Title_h1"].sub_sections)
+
+    def test_parse_with_text_before_first_heading(self):
+        with self.assertRaises(MarkdownParseError):
+            MarkdownParser.parse("preamble\n\n# Title_h1")
+
+    def test_parse_without_heading(self):
+        with self.assertRaises(MarkdownParseError):
+            MarkdownParser.parse("### Deep_h3\n\nno main section")
+
+    def test_parse_lazy_markdown(self):
+        markdown = MarkdownParser.parse(single_heading_markdown, lazy=True)
+
+        subtitle = markdown["Title_h1"]["Subtitle_h2"]
+        self.assertEqual(subtitle.comment, "주석_h2")
+        self.assertEqual(subtitle.body, "sub_content")
+        self.assertIs(subtitle._source, single_heading_markdown)
+        self.assertEqual(
+            str(markdown), str(MarkdownParser.parse(single_heading_markdown))
+        )
+
+    def test_parse_lazy_markdown_from_utf8_memoryview(self):
+        source = memoryview(single_heading_markdown.encode("utf-8"))
+
+        markdown = MarkdownParser.parse(source, lazy=True)
+
+        self.assertEqual(markdown["Title_h1"].comment, "주석_h1")
+        self.assertEqual(
+            markdown["Title_h1"]["Subtitle_h2"]["Subsubtitle_h3"].body,
+            "subsub_content",
+        )
+
+    def test_lazy_section_body_can_be_replaced(self):
+        markdown = MarkdownParser.parse(simple_multi_heading_markdown, lazy=True)
+
+        markdown["Subtitle_h2"].body = "changed"
+
+        self.assertEqual(markdown["Subtitle_h2"].body, "changed")
+        self.assertEqual(markdown["Subtitle_h2"].comment, "주석_h2")
+
+    def test_str_round_trip(self):
+        markdown = MarkdownParser.parse(single_heading_markdown)
+
+        reparsed = MarkdownParser.parse(str(markdown))
+
+        self.assertEqual(str(reparsed), str(markdown))
+        self.assertIsNone(reparsed["Title_h1"]["Subtitle_h2_2"].comment)
+
+    def test_write_to_matches_str(self):
+        markdown = MarkdownParser.parse(simple_multi_heading_markdown)
+        buffer = io.StringIO()
+
+        markdown.write_to(buffer)
+
+        self.assertEqual(buffer.getvalue(), str(markdown))
+        flat = MarkdownParser.parse(simple_multi_heading_markdown, flat=True)
+        self.assertEqual(str(flat), str(markdown))
+        self.assertEqual(str(flat["Subtitle_h2"]), str(markdown["Subtitle_h2"]))
+
+    def test_str_separates_empty_body_with_single_blank_line(self):
+        markdown = MarkdownParser.parse("# Title\n\n## Empty\n\n### Leaf\n\nbody")
+
+        self.assertEqual(str(markdown), "# Title\n\n## Empty\n\n### Leaf\n\nbody")
+
+    def test_str_of_deep_document(self):
+        depth = 200
+        lines = [f"{'#' * level} H{level}\n\nbody {level}" for level in range(1, depth)]
+        content = "\n\n".join(lines)
+
+        self.assertEqual(str(MarkdownParser.parse(content)), content)
+
+    def test_section_has_no_instance_dict(self):
+        section = MarkdownSection("Title_h1", None, "body", 1)
+
+        self.assertFalse(hasattr(section, "__dict__"))
+
+    def test_parse_flat_single_heading_markdown(self):
+        markdown = MarkdownParser.parse(single_heading_markdown, flat=True)
+
+        self.assertIsInstance(markdown, SingleHeadingMarkdown)
+        self.assertIsInstance(markdown["Title_h1"], MarkdownTreeSection)
+        subtitle = markdown["Title_h1"]["Subtitle_h2"]
+        self.assertEqual(subtitle.comment, "주석_h2")
+        self.assertEqual(
+            list(subtitle.sub_sections), ["Subsubtitle_h3", "Subsubtitle_h3_2"]
+        )
+        self.assertEqual(
+            str(markdown), str(MarkdownParser.parse(single_heading_markdown))
+        )
+
+    def test_flat_parse_keeps_last_duplicate_sibling_like_dict_parse(self):
+        content = "# R\n\n## A\n\nfirst\n\n## B\n\nb\n\n## A\n\nsecond\n"
+        markdown = MarkdownParser.parse(content)
+        flat = MarkdownParser.parse(content, flat=True)
+        buffer = io.StringIO()
+
+        flat.write_to(buffer)
+
+        self.assertEqual(str(flat), "# R\n\n## A\n\nsecond\n\n## B\n\nb")
+        self.assertEqual(str(flat), str(markdown))
+        self.assertEqual(buffer.getvalue(), str(markdown))
+        self.assertEqual(
+            [section.body for section in flat.iter_sections()],
+            [section.body for section in markdown.iter_sections()],
+        )
+        self.assertEqual(flat["R"]["A"].body, "second")
+
+    def test_flat_parse_freezes_and_thaws(self):
+        for content in (single_heading_markdown, multi_heading_markdown):
+            flat = MarkdownParser.parse(content, flat=True).freeze()
+
+            thawed = flat.thaw()
+            root = next(iter(thawed.roots()))
+            root.body = "changed"
+
+            self.assertIsInstance(root, MarkdownSection)
+            self.assertEqual(str(flat), str(MarkdownParser.parse(content)))
+            self.assertNotEqual(str(thawed), str(flat))
+            self.assertEqual(
+                [section.title for section in thawed.iter_sections()],
+                [section.title for section in flat.iter_sections()],
+            )
+
+    def test_flat_etag_matches_dict_etag_with_duplicate_siblings(self):
+        content = "# R\n\n## A\n\nfirst\n\n## A\n\nsecond\n"
+        flat = MarkdownParser.parse(content, flat=True)
+        etag = flat.etag
+
+        flat.rehash()
+
+        self.assertEqual(etag, MarkdownParser.parse(content).etag)
+        self.assertEqual(flat.etag, etag)
+        self.assertEqual(
+            flat["R"]["A"].digest, MarkdownParser.parse(content)["R"]["A"].digest
+        )
+
+    def test_parse_flat_multi_heading_markdown(self):
+        markdown = MarkdownParser.parse(multi_heading_markdown, flat=True)
+        tree = markdown["Subtitle_h2"].tree
+
+        self.assertIsInstance(markdown, MultiHeadingMarkdown)
+        self.assertEqual(
+            list(markdown.parsed_markdown),
+            ["Subtitle_h2", "Subtitle_h2_2", "Title_h2_3"],
+        )
+        self.assertEqual(list(tree.levels), [2, 3, 2, 2])
+        self.assertEqual(list(tree.parents), [-1, 0, -1, -1])
+        self.assertEqual(list(tree.roots()), [0, 2, 3])
+        self.assertEqual(markdown["Title_h2_3"].comment, "주석_h2_3")
+
+    def test_iter_parse_yields_closed_sections_first(self):
+        chunks = [
+            single_heading_markdown[i : i + 7]
+            for i in range(0, len(single_heading_markdown), 7)
+        ]
+
+        sections = list(MarkdownParser.iter_parse(chunks))
+
+        self.assertEqual(
+            [section.title for section in sections],
+            [
+                "Subsubsubtitle_h4",
+                "Subsubtitle_h3",
+                "Subsubtitle_h3_2",
+                "Subtitle_h2",
+                "Subtitle_h2_2",
+                "Title_h2_3",
+                "Title_h2_4",
+                "Title_h1",
+            ],
+        )
+        self.assertEqual(sections[1].comment, "주석_h3")
+        self.assertEqual(sections[1].body, "subsub_content")
+        self.assertIsNone(sections[-1].sub_sections)
+
+    def test_iter_parse_with_attach_from_utf8_chunks(self):
+        source = single_heading_markdown.encode("utf-8")
+        chunks = [source[i : i + 5] for i in range(0, len(source), 5)]
+
+        root = list(MarkdownParser.iter_parse(chunks, attach=True))[-1]
+
+        self.assertEqual(str(root), str(MarkdownParser.parse(single_heading_markdown)))
+
+    def test_iter_parse_with_text_before_first_heading(self):
+        with self.assertRaises(MarkdownParseError):
+            list(MarkdownParser.iter_parse(["preamble\n", "# Title_h1\n"]))
+
+    def test_iter_sections_in_document_order(self):
+        expected = [
+            "Subtitle_h2",
+            "Subsubtitle_h3",
+            "Subtitle_h2_2",
+            "Title_h2_3",
+        ]
+
+        for flat in (False, True):
+            markdown = MarkdownParser.parse(multi_heading_markdown, flat=flat)
+            self.assertEqual(
+                [section.title for section in markdown.iter_sections()], expected
+            )
+
+    def test_reparse_reuses_untouched_sections(self):
+        markdown = MarkdownParser.parse(single_heading_markdown)
+        offset = single_heading_markdown.index("subsub_content_2")
+
+        edited = MarkdownParser.reparse(markdown, offset, len("subsub"), "edited")
+
+        self.assertEqual(
+            str(edited),
+            str(
+                MarkdownParser.parse(
+                    single_heading_markdown.replace(
+                        "subsub_content_2", "edited_content_2"
+                    )
+                )
+            ),
+        )
+        subtitle = edited["Title_h1"]["Subtitle_h2"]
+        self.assertEqual(subtitle["Subsubtitle_h3_2"].body, "edited_content_2")
+        self.assertIs(
+            subtitle["Subsubtitle_h3"],
+            markdown["Title_h1"]["Subtitle_h2"]["Subsubtitle_h3"],
+        )
+        self.assertIs(
+            edited["Title_h1"]["Subtitle_h2_2"], markdown["Title_h1"]["Subtitle_h2_2"]
+        )
+        self.assertIsNot(edited["Title_h1"], markdown["Title_h1"])
+        self.assertEqual(
+            markdown["Title_h1"]["Subtitle_h2"]["Subsubtitle_h3_2"].body,
+            "subsub_content_2",
+        )
+
+    def test_reparse_with_inserted_heading(self):
+        markdown = MarkdownParser.parse(multi_heading_markdown)
+        offset = multi_heading_markdown.index("sub_content_2") + len("sub_content_2")
+        inserted = "\n\n### Subsubtitle_h3_new\n\nnew_content"
+
+        edited = MarkdownParser.reparse(markdown, offset, 0, inserted)
+
+        self.assertEqual(
+            edited["Subtitle_h2_2"]["Subsubtitle_h3_new"].body, "new_content"
+        )
+        self.assertIs(edited["Subtitle_h2"], markdown["Subtitle_h2"])
+        self.assertIs(edited["Title_h2_3"], markdown["Title_h2_3"])
+
+    def test_reparse_with_edit_changing_parent_structure(self):
+        markdown = MarkdownParser.parse(multi_heading_markdown)
+        offset = multi_heading_markdown.index("### Subsubtitle_h3")
+
+        edited = MarkdownParser.reparse(markdown, offset, len("###"), "##")
+
+        self.assertEqual(
+            list(edited.parsed_markdown),
+            ["Subtitle_h2", "Subsubtitle_h3", "Subtitle_h2_2", "Title_h2_3"],
+        )
+
+    def test_level_patterns_are_compiled_once(self):
+        self.assertIs(_level_patterns(3), _level_patterns(3))
+        self.assertTrue(_level_patterns(3).heading.match("### Title_h3"))
+        self.assertFalse(_level_patterns(3).split.match("####"))
+
+    def test_find_section_by_path(self):
+        markdown = MarkdownParser.parse(single_heading_markdown)
+
+        section = markdown.find("Title_h1/Subtitle_h2/Subsubtitle_h3")
+
+        self.assertIs(section, markdown["Title_h1"]["Subtitle_h2"]["Subsubtitle_h3"])
+        self.assertIs(
+            markdown.find(("Title_h1", "Subtitle_h2", "Subsubtitle_h3")), section
+        )
+        self.assertIsNone(markdown.find("Title_h1/Subsubtitle_h3"))
+
+    def test_find_all_sections_by_title(self):
+        markdown = MarkdownParser.parse(
+            "## Login\n\n### Rules\n\nlogin rules\n\n## Signup\n\n### Rules\n\nsignup rules"
+        )
+
+        sections = markdown.find_all("Rules")
+
+        self.assertEqual(
+            [section.body for section in sections], ["login rules", "signup rules"]
+        )
+        self.assertEqual(markdown.find_all("Unknown"), [])
+
+    def test_find_drops_sections_replaced_by_duplicate_sibling(self):
+        content = "# R\n\n## A\n\n### C\n\nc\n\n## A\n\nsecond\n"
+        markdown = MarkdownParser.parse(content)
+
+        self.assertIsNone(markdown.find("R/A/C"))
+        self.assertEqual(markdown.find_all("C"), [])
+        self.assertEqual(markdown.find_all("A"), [markdown["R"]["A"]])
+        self.assertEqual(markdown.find("R/A").body, "second")
+        self.assertEqual(
+            markdown.index.paths, MarkdownIndex.build(markdown.roots()).paths
+        )
+
+    def test_find_after_reparse_and_in_flat_tree(self):
+        markdown = MarkdownParser.parse(multi_heading_markdown)
+        offset = multi_heading_markdown.index("subsub_content")
+        edited = MarkdownParser.reparse(markdown, offset, 0, "new ")
+
+        for result in (edited, MarkdownParser.parse(multi_heading_markdown, flat=True)):
+            self.assertEqual(
+                result.find("Subtitle_h2/Subsubtitle_h3").comment, "주석_h3"
+            )
+        self.assertEqual(
+            edited.find("Subtitle_h2/Subsubtitle_h3").body, "new subsub_content"
+        )
+
+    def test_digest_covers_sub_sections(self):
+        markdown = MarkdownParser.parse(single_heading_markdown, hashed=True)
+        edited = MarkdownParser.parse(
+            single_heading_markdown.replace("subsubsub_content", "changed")
+        )
+
+        self.assertEqual(
+            markdown["Title_h1"]["Subtitle_h2_2"].digest,
+            edited["Title_h1"]["Subtitle_h2_2"].digest,
+        )
+        self.assertNotEqual(
+            markdown["Title_h1"]["Subtitle_h2"].digest,
+            edited["Title_h1"]["Subtitle_h2"].digest,
+        )
+        self.assertNotEqual(markdown.etag, edited.etag)
+        self.assertEqual(
+            markdown.etag, MarkdownParser.parse(single_heading_markdown, flat=True).etag
+        )
+
+    def test_digest_after_reparse_and_rehash(self):
+        markdown = MarkdownParser.parse(simple_multi_heading_markdown, hashed=True)
+        etag = markdown.etag
+        offset = simple_multi_heading_markdown.index("subsub_content")
+
+        edited = MarkdownParser.reparse(markdown, offset, 0, "x")
+
+        self.assertNotEqual(edited.etag, etag)
+        self.assertEqual(
+            edited.etag,
+            MarkdownParser.parse(edited.source).etag,
+        )
+
+        markdown["Subtitle_h2"]["Subsubtitle_h3"].body = "changed"
+        markdown.rehash()
+        self.assertEqual(
+            markdown["Subtitle_h2"].digest,
+            MarkdownParser.parse(str(markdown))["Subtitle_h2"].digest,
+        )
+
+
+class MarkdownParseCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_parse_returns_cached_tree(self):
+        cache = MarkdownParseCache()
+
+        first = cache.parse(single_heading_markdown)
+        second = cache.parse(single_heading_markdown)
+
+        self.assertIs(first["Title_h1"], second["Title_h1"])
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_cached_tree_is_immutable(self):
+        cache = MarkdownParseCache()
+        markdown = cache.parse(multi_heading_markdown)
+
+        with self.assertRaises(AttributeError):
+            markdown["Subtitle_h2"].body = "changed"
+        with self.assertRaises(TypeError):
+            markdown["Subtitle_h2"].sub_sections["new"] = None
+        with self.assertRaises(TypeError):
+            markdown.parsed_markdown["new"] = None
+
+        thawed = markdown.thaw()
+        thawed["Subtitle_h2"].body = "changed"
+        self.assertEqual(
+            cache.parse(multi_heading_markdown)["Subtitle_h2"].body, "sub_content"
+        )
+
+    def test_evicts_least_recently_used(self):
+        cache = MarkdownParseCache(max_bytes=4300)
+
+        cache.parse(simple_single_heading_markdown)
+        cache.parse(simple_multi_heading_markdown)
+        cache.parse(simple_single_heading_markdown)
+        cache.parse(multi_heading_markdown)
+
+        self.assertEqual(cache.stats()["evictions"], 1)
+        cache.parse(simple_single_heading_markdown)
+        self.assertEqual(cache.stats()["hits"], 2)
+
+    def test_shared_cache_tier(self):
+        first = MarkdownParseCache(shared_cache_alias="default")
+        second = MarkdownParseCache(shared_cache_alias="default")
+
+        first.parse(single_heading_markdown)
+        markdown = second.parse(single_heading_markdown)
+
+        self.assertEqual(second.stats()["shared_hits"], 1)
+        self.assertEqual(second.stats()["misses"], 0)
+        self.assertEqual(
+            str(markdown), str(MarkdownParser.parse(single_heading_markdown))
+        )
+
+    def test_shared_cache_uses_backend_timeout_by_default(self):
+        shared_cache = caches["default"]
+
+        with mock.patch.object(shared_cache, "set") as set_:
+            MarkdownParseCache(shared_cache_alias="default").parse(
+                single_heading_markdown
+            )
+            MarkdownParseCache(shared_cache_alias="default", timeout=None).parse(
+                multi_heading_markdown
+            )
+
+        self.assertIs(set_.call_args_list[0].args[2], DEFAULT_TIMEOUT)
+        self.assertIsNone(set_.call_args_list[1].args[2])
+
+
+class MarkdownBatchTestCase(SimpleTestCase):
+    documents = [
+        single_heading_markdown,
+        "no heading",
+        simple_multi_heading_markdown,
+    ]
+
+    def test_parse_batch_keeps_order_and_captures_errors(self):
+        results = parse_batch(self.documents, max_workers=1)
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsNone(results[1].markdown)
+        self.assertIn("주 섹션 또는 서브 섹션을 찾을 수 없습니다.", results[1].error)
+        self.assertEqual(
+            str(results[2].markdown), str(MarkdownParser.parse(self.documents[2]))
+        )
+
+    def test_parse_batch_with_process_pool(self):
+        results = parse_batch(self.documents * 4, max_workers=2, chunksize=3)
+
+        self.assertEqual(len(results), 12)
+        self.assertEqual(
+            str(results[9].markdown["Title_h1"]["Subtitle_h2"]),
+            str(
+                MarkdownParser.parse(single_heading_markdown)["Title_h1"]["Subtitle_h2"]
+            ),
+        )
+        self.assertFalse(results[10].ok)
+
+    def test_parse_batch_validate_only(self):
+        results = parse_batch(self.documents, max_workers=2, validate_only=True)
+
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertTrue(all(result.markdown is None for result in results))
+
+
+class MarkdownDiffTestCase(SimpleTestCase):
+    old_markdown = "# T\n\n## A\n\na\n\n### A1\n\nx\n\n## B\n\nb\n\n## C\n\nc"
+
+    def diff(self, new_markdown):
+        changes = diff_markdown(
+            MarkdownParser.parse(self.old_markdown), MarkdownParser.parse(new_markdown)
+        )
+        return [(change.kind, change.path, change.old_path) for change in changes]
+
+    def test_identical_documents_have_no_changes(self):
+        self.assertEqual(self.diff(self.old_markdown), [])
+
+    def test_reports_added_removed_and_modified_sections(self):
+        new_markdown = "# T\n\n## A\n\na2\n\n### A1\n\nx\n\n## B\n\nb\n\n## D\n\nd"
+
+        self.assertEqual(
+            self.diff(new_markdown),
+            [
+                ("modified", ("T", "A"), ("T", "A")),
+                ("added", ("T", "D"), None),
+                ("removed", ("T", "C"), ("T", "C")),
+            ],
+        )
+
+    def test_reports_moved_sections(self):
+        new_markdown = "# T\n\n## C\n\nc\n\n## A\n\na\n\n## B\n\nb\n\n### A1\n\nx"
+
+        self.assertEqual(
+            self.diff(new_markdown),
+            [
+                ("moved", ("T", "C"), ("T", "C")),
+                ("moved", ("T", "B", "A1"), ("T", "A", "A1")),
+            ],
+        )
+
+    def test_skips_sections_shared_by_reparse(self):
+        markdown = MarkdownParser.parse(self.old_markdown)
+        offset = self.old_markdown.index("\nb") + 2
+
+        edited = MarkdownParser.reparse(markdown, offset, 0, "!")
+        changes = diff_markdown(markdown, edited)
+
+        self.assertEqual(
+            [(change.kind, change.path) for change in changes],
+            [("modified", ("T", "B"))],
+        )
+        self.assertEqual(changes[0].new.body, "b!")
+
+
+class MarkdownSearchIndexTestCase(SimpleTestCase):
+    def setUp(self):
+        self.index = MarkdownSearchIndex()
+        self.index.index_document(
+            "single", MarkdownParser.parse(single_heading_markdown)
+        )
+        self.index.index_document(
+            "multi", MarkdownParser.parse(simple_multi_heading_markdown)
+        )
+
+    def test_search_ranks_matching_sections(self):
+        hits = self.index.search("subsub_content")
+
+        self.assertEqual(
+            [(hit.document_id, hit.path) for hit in hits],
+            [
+                ("multi", ("Subtitle_h2", "Subsubtitle_h3")),
+                ("single", ("Title_h1", "Subtitle_h2", "Subsubtitle_h3")),
+            ],
+        )
+        self.assertEqual(self.index.search("없는단어"), [])
+
+    def test_title_match_ranks_first(self):
+        self.index.index_document(
+            "guide",
+            MarkdownParser.parse(
+                "# Guide\n\n## Login\n\nsignup flow\n\n## Signup\n\nlogin steps"
+            ),
+        )
+
+        hits = self.index.search("login")
+
+        self.assertEqual(
+            [hit.path for hit in hits], [("Guide", "Login"), ("Guide", "Signup")]
+        )
+
+    def test_reindex_updates_changed_sections_only(self):
+        markdown = MarkdownParser.parse(simple_multi_heading_markdown)
+        self.index.index_document("multi", markdown)
+        offset = simple_multi_heading_markdown.index("sub_content_2")
+
+        edited = MarkdownParser.reparse(
+            markdown, offset, len("sub_content_2"), "새내용"
+        )
+        self.index.index_document("multi", edited)
+
+        self.assertEqual(self.index.search("새내용")[0].path, ("Subtitle_h2_2",))
+        self.assertEqual(
+            [hit.document_id for hit in self.index.search("sub_content_2")],
+            ["single"],
+        )
+        self.assertEqual(
+            self.index.search("subsub_content")[0].path,
+            ("Subtitle_h2", "Subsubtitle_h3"),
+        )
+
+    def test_remove_document(self):
+        self.index.remove_document("single")
+
+        self.assertEqual(
+            {hit.document_id for hit in self.index.search("subsub_content")},
+            {"multi"},
+        )
+        self.assertEqual(len(self.index), 3)
+
+    def test_save_and_load_with_mmap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "search.idx")
+            self.index.save(file_path)
+
+            with MappedMarkdownSearchIndex.load(file_path) as mapped:
+                for query in ("subsub_content", "주석_h2 title_h1", "sub_content"):
+                    self.assertEqual(mapped.search(query), self.index.search(query))
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class EndpointBenchmarkTestCase(TestCase):
+    def test_benchmark_endpoint_reports_latency_and_queries(self):
+        get_user_model().objects.create_user(
+            email="bench@example.com", password="Benchmark123"
+        )
+        payloads = [{"email": "bench@example.com", "password": "Benchmark123"}] * 4
+
+        result = benchmark_endpoint(
+            APIClient(), reverse("user-signin"), payloads, warmup=1
+        )
+
+        self.assertEqual(result["requests"], 3)
+        self.assertEqual(result["status_codes"], {"200": 3})
+        self.assertEqual(result["queries_per_request"], 1)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+
+class ParallelDiscoverRunnerTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.timings_file = os.path.join(directory.name, "timings.json")
+
+    def build_suite(self, **kwargs):
+        runner = ParallelDiscoverRunner(verbosity=0, **kwargs)
+        with override_settings(TEST_TIMINGS_FILE=self.timings_file):
+            return runner.build_suite(["core.tests.MarkdownDiffTestCase"]), runner
+
+    def test_save_timings_merges_with_previous_runs(self):
+        save_timings({"a": 1.0, "b": 2.0}, self.timings_file)
+        save_timings({"b": 3.0}, self.timings_file)
+
+        self.assertEqual(load_timings(self.timings_file), {"a": 1.0, "b": 3.0})
+
+    def test_serial_suite_keeps_discovered_tests(self):
+        suite, runner = self.build_suite()
+
+        self.assertEqual(suite.countTestCases(), 4)
+        self.assertEqual(runner.parallel, 0)
+
+    def test_parallel_suite_sends_slowest_cases_first(self):
+        labels = ["core.tests.MarkdownDiffTestCase", "core.tests.MarkdownBatchTestCase"]
+        serial_suite, _ = self.build_suite()
+        timings = {test.id(): 0.01 for test in serial_suite}
+        timings[
+            "core.tests.MarkdownBatchTestCase."
+            "test_parse_batch_keeps_order_and_captures_errors"
+        ] = 5.0
+        save_timings(timings, self.timings_file)
+
+        with override_settings(TEST_TIMINGS_FILE=self.timings_file):
+            runner = ParallelDiscoverRunner(verbosity=0, parallel=2)
+            suite = runner.build_suite(labels)
+
+        subsuites = list(suite)
+        self.assertEqual(runner.parallel, 2)
+        self.assertIsInstance(subsuites[0]._tests[0], MarkdownBatchTestCase)
+        self.assertGreater(*runner.estimated_durations)
+
+
+class TestDiscoveryTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+        self.cache_file = os.path.join(self.root, ".test_discovery.json")
+        for path in [
+            "app/__init__.py",
+            "app/tests/__init__.py",
+            "app/tests/unit_test/__init__.py",
+            "app/tests/unit_test/test_model.py",
+            "app/tests/unit_test/helpers.py",
+            "app/tests/integration_test/__init__.py",
+            "app/tests/integration_test/test_api.py",
+            "node_modules/tests/unit_test/__init__.py",
+            "node_modules/tests/unit_test/test_vendor.py",
+        ]:
+            self.touch(path)
+
+    def touch(self, path):
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+
+    def find(self, directory_name="unit_test"):
+        return find_test_modules(
+            directory_name, root=self.root, cache_path=self.cache_file
+        )
+
+    def test_finds_only_modules_in_the_test_directory(self):
+        self.assertEqual(self.find(), ["app.tests.unit_test.test_model"])
+        self.assertEqual(
+            self.find("integration_test"), ["app.tests.integration_test.test_api"]
+        )
+
+    def test_reuses_cached_result_until_a_directory_changes(self):
+        self.find()
+        with mock.patch("core.utils.test_discovery._scan") as scan:
+            self.assertEqual(self.find(), ["app.tests.unit_test.test_model"])
+        scan.assert_not_called()
+
+        self.touch("app/tests/unit_test/nested/__init__.py")
+        self.touch("app/tests/unit_test/nested/test_nested.py")
+        self.touch("other/tests/unit_test/__init__.py")
+        self.touch("other/tests/__init__.py")
+        self.touch("other/tests/unit_test/test_other.py")
+
+        self.assertEqual(
+            self.find(),
+            [
+                "app.tests.unit_test.test_model",
+                "app.tests.unit_test.nested.test_nested",
+                "other.tests.unit_test.test_other",
+            ],
+        )
+
+    def test_rescans_when_init_file_is_added_after_first_scan(self):
+        self.touch("other/tests/unit_test/test_other.py")
+        self.assertEqual(self.find(), ["app.tests.unit_test.test_model"])
+
+        self.touch("other/tests/unit_test/__init__.py")
+        self.assertEqual(self.find(), ["app.tests.unit_test.test_model"])
+
+        self.touch("other/tests/__init__.py")
+        self.assertEqual(
+            self.find(),
+            ["app.tests.unit_test.test_model", "other.tests.unit_test.test_other"],
+        )
+
+    def test_unit_runner_builds_suite_from_unit_test_modules_only(self):
+        with override_settings(TEST_DISCOVERY_CACHE_FILE=self.cache_file):
+            suite = UnitTestRunner(verbosity=0).build_suite()
+
+        test_ids = [test.id() for test in suite]
+        self.assertTrue(test_ids)
+        self.assertTrue(all(".tests.unit_test." in test_id for test_id in test_ids))
+
+
+class TestImpactTestCase(SimpleTestCase):
+    identical = (
+        "core.tests.MarkdownDiffTestCase.test_identical_documents_have_no_changes"
+    )
+    modified = (
+        "core.tests.MarkdownDiffTestCase."
+        "test_reports_added_removed_and_modified_sections"
+    )
+
+    def setUp(self):
+        self.tests = [
+            test
+            for test in unittest.defaultTestLoader.loadTestsFromTestCase(
+                MarkdownDiffTestCase
+            )
+            if test.id() in (self.identical, self.modified)
+        ]
+        self.impact_map = ImpactMap(
+            {
+                self.identical: frozenset({"core/utils/markdown_diff.py"}),
+                self.modified: frozenset(
+                    {"core/utils/markdown_diff.py", "core/utils/markdown_parser.py"}
+                ),
+            }
+        )
+
+    def select(self, changed):
+        selected, _ = select_impacted_tests(self.tests, self.impact_map, changed)
+        return [test.id() for test in selected]
+
+    def test_map_round_trips_through_file_and_updates_incrementally(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "impact.json")
+
+        self.impact_map.save(path)
+        loaded = ImpactMap.load(path)
+        loaded.update({self.identical: {"core/utils/markdown_cache.py"}})
+
+        self.assertEqual(
+            loaded.tests[self.modified], self.impact_map.tests[self.modified]
+        )
+        self.assertEqual(loaded.tests[self.identical], {"core/utils/markdown_cache.py"})
+
+    def test_selects_only_tests_that_run_changed_files(self):
+        self.assertEqual(
+            self.select(["core/utils/markdown_parser.py"]), [self.modified]
+        )
+        self.assertEqual(self.select(["README.md"]), [])
+
+    def test_runs_unrecorded_tests_and_changed_test_modules(self):
+        del self.impact_map.tests[self.identical]
+
+        self.assertEqual(
+            self.select(["core/utils/markdown_parser.py"]),
+            [self.identical, self.modified],
+        )
+        self.assertEqual(len(self.select(["core/tests.py"])), 2)
+
+    def test_unknown_change_runs_everything(self):
+        self.assertEqual(len(self.select(["REsQue/settings.py"])), 2)
+
+    def test_class_setup_is_recorded_for_every_test_of_the_case(self):
+        if not CoverageRecorder.available():
+            self.skipTest("coverage is already measuring this run")
+
+        class ClassSetUpTestCase(unittest.TestCase):
+            @classmethod
+            def setUpClass(cls):
+                diff_markdown(
+                    MarkdownParser.parse(single_heading_markdown),
+                    MarkdownParser.parse(multi_heading_markdown),
+                )
+
+            def test_first(self):
+                pass
+
+            def test_second(self):
+                pass
+
+        tests = unittest.defaultTestLoader.loadTestsFromTestCase(ClassSetUpTestCase)
+        recorder = CoverageRecorder()
+        result = ImpactTextTestResult(io.StringIO(), False, 0, recorder=recorder)
+        recorder.start()
+        try:
+            ImpactTestSuite(tests).run(result)
+        finally:
+            recorder.stop()
+
+        files_by_test = recorder.files_by_test()
+        self.assertEqual(
+            set(files_by_test), {test.id() for test in tests}, files_by_test.keys()
+        )
+        for test in tests:
+            self.assertIn("core/utils/markdown_diff.py", files_by_test[test.id()])
+
+
+def issue(title, *labels):
+    return {"title": title, "labels": [{"name": label} for label in labels]}
+
+
+def github_response(status_code, issues=None, etag=None, next_url=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://api.github.com/repos/owner/repo/issues"
+    response._content = json.dumps(issues or []).encode()
+    response.headers["Cache-Control"] = "private, max-age=60"
+    if etag:
+        response.headers["ETag"] = etag
+    if next_url:
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
+
+
+class IssueLookupTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.backend = GitHubIssueBackend(
+            "owner/repo",
+            "token",
+            cache_path=os.path.join(self.directory, "issues.json"),
+        )
+
+    def test_reads_test_issue_names_from_json_file(self):
+        path = os.path.join(self.directory, "issues.json")
+        with open(path, "w") as file:
+            json.dump(
+                [
+                    issue("TEST: #12-SignUpTestCase", "test"),
+                    issue("TEST: #13-SignInTestCase", "test"),
+                    issue("TEST: #12-NotATest", "bug"),
+                ],
+                file,
+            )
+
+        names = get_test_issue_names("#12", backend=JSONFileIssueBackend(path))
+
+        self.assertEqual(names, ["SignUpTestCase"])
+
+    def test_follows_pagination(self):
+        next_url = "https://api.github.com/repos/owner/repo/issues?page=2"
+        with mock.patch.object(
+            self.backend.session,
+            "get",
+            side_effect=[
+                github_response(200, [issue("a")], '"1"', next_url),
+                github_response(200, [issue("b")], '"2"'),
+            ],
+        ) as get:
+            issues = self.backend.fetch_issues("test")
+
+        self.assertEqual([i["title"] for i in issues], ["a", "b"])
+        self.assertEqual(get.call_args_list[1].args[0], next_url)
+
+    def test_reuses_cached_pages_without_refetching(self):
+        with mock.patch.object(
+            self.backend.session,
+            "get",
+            return_value=github_response(200, [issue("a")], '"1"'),
+        ):
+            self.backend.fetch_issues("test")
+
+        with mock.patch.object(self.backend.session, "get") as get:
+            issues = self.backend.fetch_issues("test")
+
+        get.assert_not_called()
+        self.assertEqual([i["title"] for i in issues], ["a"])
+
+    def test_revalidates_expired_pages_with_etag(self):
+        with mock.patch.object(
+            self.backend.session,
+            "get",
+            return_value=github_response(200, [issue("a")], '"1"'),
+        ):
+            self.backend.fetch_issues("test")
+
+        with mock.patch("time.time", return_value=time.time() + 120):
+            with mock.patch.object(
+                self.backend.session, "get", return_value=github_response(304)
+            ) as get:
+                issues = self.backend.fetch_issues("test")
+
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"1"'})
+        self.assertEqual([i["title"] for i in issues], ["a"])
+
+
+class TestSelectionTestCase(SimpleTestCase):
+    def setUp(self):
+        self.suite = unittest.TestSuite(
+            [
+                unittest.defaultTestLoader.loadTestsFromTestCase(MarkdownDiffTestCase),
+                unittest.TestSuite(
+                    unittest.defaultTestLoader.loadTestsFromTestCase(
+                        MarkdownBatchTestCase
+                    )
+                ),
+            ]
+        )
+
+    def select(self, *names):
+        return [
+            test.id()
+            for test in TestSelection(self.suite, TestNameMatcher(names)).tests
+        ]
+
+    def test_selects_by_class_name_in_original_order(self):
+        selected = self.select(" MarkdownBatchTestCase ", "MarkdownDiffTestCase")
+
+        self.assertEqual(selected, [test.id() for test in iter_test_cases(self.suite)])
+
+    def test_selects_by_method_and_module_globs(self):
+        self.assertEqual(
+            self.select("test_identical_*"),
+            [
+                "core.tests.MarkdownDiffTestCase."
+                "test_identical_documents_have_no_changes"
+            ],
+        )
+        self.assertEqual(len(self.select("core.*")), self.suite.countTestCases())
+        self.assertEqual(self.select("UnknownTestCase", "missing_*"), [])
+
+    def test_reports_selected_count(self):
+        selection = TestSelection(self.suite, TestNameMatcher(["MarkdownDiffTestCase"]))
+
+        self.assertEqual(selection.total, self.suite.countTestCases())
+        self.assertIn(
+            f"Selected {len(selection)} of {selection.total}", selection.summary()
+        )
@@ -0,0 +1,96 @@
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import django
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def benchmark_endpoint(client, url: str, payloads, warmup: int = 0) -> dict:
+    """
+    payloads 를 차례로 url 에 POST 하고 요청마다 지연 시간과 쿼리 수를 잽니다.
+    처음 warmup 개의 요청은 결과에서 뺍니다.
+    """
+    latencies = []
+    query_counts = []
+    status_codes = Counter()
+
+    started = None
+    for number, payload in enumerate(payloads):
+        if number == warmup:
+            started = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = client.post(url, payload, format="json")
+            latency = time.perf_counter() - start
+        if number < warmup:
+            continue
+        latencies.append(latency)
+        query_counts.append(len(queries))
+        status_codes[response.status_code] += 1
+
+    elapsed = time.perf_counter() - started if started is not None else 0.0
+    return summarize(latencies, query_counts, status_codes, elapsed)
+
+
+def summarize(latencies, query_counts, status_codes, elapsed: float) -> dict:
+    """
+    지연 시간(초) 목록을 밀리초 단위 백분위와 초당 요청 수로 요약합니다.
+    """
+    if not latencies:
+        return {"requests": 0}
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0]
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "max_ms": round(max(latencies) * 1000, 3),
+        "requests_per_second": (
+            round(len(latencies) / elapsed, 2) if elapsed else None
+        ),
+        "queries_per_request": round(statistics.fmean(query_counts), 2),
+        "max_queries": max(query_counts),
+        "status_codes": {
+            str(code): count for code, count in sorted(status_codes.items())
+        },
+    }
+
+
+def environment_metadata(**extra) -> dict:
+    """
+    커밋끼리 결과를 비교할 수 있도록 벤치마크 보고서에 넣을 실행 환경 정보를 모읍니다.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "django": django.get_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "password_hashers": list(settings.PASSWORD_HASHERS),
+        **extra,
+    }
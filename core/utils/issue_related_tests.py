@@ -1,29 +1,162 @@
+import functools
+import json
 import os
 import sys
 import re
+import time
+from pathlib import Path
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.test.runner import DiscoverRunner
-from django.test import TestCase
 import django
 from django.conf import settings
 from django.core.management import call_command
-from unittest import TestSuite
 
 owner = os.getenv("OWNER")
 repo = os.getenv("REPO")
 branch_name = os.getenv("BRANCH")
 github_token = os.getenv("GITHUB_TOKEN")
 
-if not all([owner, repo, branch_name, github_token]):
-    sys.exit("Missing required environment variables")
-
-print(f"Current working directory: {os.getcwd()}")
-print(f"PYTHONPATH: {os.environ.get('PYTHONPATH')}")
-print(f"sys.path: {sys.path}")
+# GitHub 대신 이 JSON 파일(이슈 목록)에서 이슈를 읽습니다.
+issues_file = os.getenv("ISSUES_FILE")
+# GitHub Enterprise 나 로컬 스텁 서버를 쓸 때 바꿉니다.
+github_api_url = os.getenv("GITHUB_API_URL", "https://api.github.com")
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, project_root)
-print(f"Updated sys.path: {sys.path}")
+# 스크립트로 실행하면 core/utils 만 sys.path 에 있으므로 프로젝트 루트를 넣습니다.
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from core.utils.test_selection import TestNameMatcher, TestSelection  # noqa: E402
+
+issue_cache_file = os.getenv(
+    "ISSUE_CACHE_FILE", os.path.join(project_root, ".issue_cache.json")
+)
+
+
+class IssueLookupError(Exception):
+    pass
+
+
+class JSONFileIssueBackend:
+    """
+    GitHub issues API 응답과 같은 모양의 JSON 배열 파일에서 이슈를 읽습니다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def fetch_issues(self, labels):
+        try:
+            with self.path.open() as file:
+                issues = json.load(file)
+        except (OSError, ValueError) as e:
+            raise IssueLookupError(f"Failed to read issues from {self.path}: {e}")
+        return [
+            issue
+            for issue in issues
+            if labels in {label["name"] for label in issue.get("labels", [])}
+        ]
+
+
+class GitHubIssueBackend:
+    """
+    GitHub issues API 를 페이지를 끝까지 따라가며 읽습니다.
+
+    페이지마다 ETag 와 내용을 캐시 파일에 저장해 두고, Cache-Control 의 max-age 가 지나기 전에는
+    요청하지 않습니다. 지난 뒤에는 If-None-Match 로 다시 물어 304 면 저장한 내용을 씁니다.
+    GitHub 는 304 응답을 rate limit 에 세지 않습니다.
+    """
+
+    per_page = 100
+
+    def __init__(self, repo, token, api_url=github_api_url, cache_path=None):
+        self.repo = repo
+        self.api_url = api_url.rstrip("/")
+        self.cache_path = Path(cache_path or issue_cache_file)
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github.v3+json",
+            }
+        )
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+        self.session.mount("http://", HTTPAdapter(max_retries=retry))
+        self.requests_made = 0
+
+    def fetch_issues(self, labels):
+        cache = self._load_cache()
+        issues = []
+        url = f"{self.api_url}/repos/{self.repo}/issues"
+        params = {"labels": labels, "per_page": self.per_page}
+        while url:
+            page = self._fetch_page(cache, url, params)
+            issues.extend(page["issues"])
+            url, params = page["next"], None
+        self._save_cache(cache)
+        return issues
+
+    def _fetch_page(self, cache, url, params):
+        key = requests.Request("GET", url, params=params).prepare().url
+        cached = cache.get(key)
+        if cached and cached["expires"] > time.time():
+            return cached
+
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        response = self.session.get(url, params=params, headers=headers, timeout=10)
+        self.requests_made += 1
+        if response.status_code == 304:
+            page = cached
+        elif response.status_code == 200:
+            page = {
+                "etag": response.headers.get("ETag"),
+                "issues": response.json(),
+                "next": response.links.get("next", {}).get("url"),
+            }
+        else:
+            raise IssueLookupError(
+                f"Failed to fetch issues: {response.status_code}\nurl = {response.url}"
+            )
+        page["expires"] = time.time() + _max_age(response)
+        if page["etag"]:
+            cache[key] = page
+        return page
+
+    def _load_cache(self):
+        try:
+            with self.cache_path.open() as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache):
+        temporary = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        try:
+            with temporary.open("w") as file:
+                json.dump(cache, file)
+            temporary.replace(self.cache_path)
+        except OSError:
+            pass
+
+
+def _max_age(response):
+    for directive in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "max-age" and value.isdigit():
+            return int(value)
+    return 0
+
+
+def get_issue_backend():
+    if issues_file:
+        return JSONFileIssueBackend(issues_file)
+    if not all([owner, repo, github_token]):
+        sys.exit("Missing required environment variables")
+    return GitHubIssueBackend(repo, github_token)
 
 
 def get_issue_number_from_branch():
@@ -34,22 +167,21 @@ def get_issue_number_from_branch():
     return match.group(2)
 
 
-def get_test_issue_names(issue_number):
-    url = f"https://api.github.com/repos/{repo}/issues?labels=test"
-    headers = {
-        "Authorization": f"token {github_token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        sys.exit(f"Failed to fetch issues: {response.status_code}\nurl = {url}")
+@functools.lru_cache
+def _test_issue_pattern(issue_number):
+    return re.compile(rf"TEST: {issue_number}-([\w\s.*?\[\]]+)")
+
+
+def get_test_issue_names(issue_number, backend=None):
+    backend = backend or get_issue_backend()
+    issues = backend.fetch_issues(labels="test")
 
-    test_issue_pattern = rf"TEST: {issue_number}-([\w\s]+)"
+    test_issue_pattern = _test_issue_pattern(issue_number)
     print(f"Fetching test cases for issue: {issue_number}")
 
     testcase_names = []
-    for issue in response.json():
-        match = re.match(test_issue_pattern, issue["title"])
+    for issue in issues:
+        match = test_issue_pattern.match(issue["title"])
         if match:
             testcase_names.append(match.group(1))
     print(f"Test cases found: {testcase_names}")
@@ -59,41 +191,31 @@ def get_test_issue_names(issue_number):
 class PRTestRunner(DiscoverRunner):
     def __init__(self, testcase_names=None, **kwargs):
         self.testcase_names = testcase_names or []
+        self.matcher = TestNameMatcher(self.testcase_names)
         super().__init__(**kwargs)
 
     def build_suite(self, test_labels=None, **kwargs):
         print(f"build_suite called with: test_labels={test_labels}, kwargs={kwargs}")
 
         suite = super().build_suite(test_labels)
-        if self.testcase_names:
+        if self.matcher:
             return self.filter_suite(suite)
         return suite
 
     def filter_suite(self, suite):
-        filtered_tests = []
-        for test in suite:
-            if isinstance(test, TestCase):
-                if test.__class__.__name__ in self.testcase_names:
-                    filtered_tests.append(test)
-            elif isinstance(test, TestSuite):
-                filtered_suite = self.filter_suite(test)
-                if filtered_suite.countTestCases() > 0:
-                    filtered_tests.extend(filtered_suite)
-
-        if not filtered_tests:
+        selection = TestSelection(suite, self.matcher)
+        print(selection.summary())
+
+        if not selection:
             print("No tests found for this issue")
             return suite.__class__()
 
         print(f"Running tests for: {', '.join(self.testcase_names)}")
-        new_suite = suite.__class__()
-        new_suite.addTests(filtered_tests)
-        return new_suite
+        return suite.__class__(selection.tests)
 
     def run_tests(self, test_labels):
         self.setup_test_environment()
         suite = self.build_suite(test_labels)
-        if self.testcase_names:
-            suite = self.filter_suite(suite)
         result = self.run_suite(suite)
         self.teardown_test_environment()
         return self.suite_result(suite, result)
@@ -104,6 +226,13 @@ class PRTestRunner(DiscoverRunner):
 
 
 def main():
+    if not branch_name:
+        sys.exit("Missing required environment variables")
+
+    print(f"Current working directory: {os.getcwd()}")
+    print(f"PYTHONPATH: {os.environ.get('PYTHONPATH')}")
+    print(f"sys.path: {sys.path}")
+
     if not settings.configured:
         django.setup()
 
@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import NamedTuple
+
+from core.utils.markdown_parser import (
+    Markdown,
+    MarkdownParseError,
+    MarkdownParser,
+    MarkdownTree,
+)
+
+# 워커가 돌려주는 MarkdownTree 배열 (원본은 부모 프로세스에 이미 있으므로 보내지 않음)
+_TREE_ARRAYS = tuple(
+    name
+    for name in MarkdownTree.__slots__
+    if name != "source" and not name.startswith("_")
+)
+
+# 워커 하나에 보낼 청크 수. 문서 크기가 고르지 않아도 워커들이 비슷하게 끝나도록 잘게 나눕니다.
+CHUNKS_PER_WORKER = 4
+
+
+class MarkdownBatchResult(NamedTuple):
+    index: int
+    markdown: Markdown | None
+    error: str | None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def parse_batch(
+    documents,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+    validate_only: bool = False,
+    executor: Executor | None = None,
+) -> list[MarkdownBatchResult]:
+    """
+    여러 마크다운 문서를 프로세스 풀에 나눠 파싱하고 입력 순서대로 결과를 돌려줍니다.
+
+    워커는 MarkdownTree 의 오프셋 배열만 돌려주고, 부모가 원본을 다시 붙여
+    flat 결과(MarkdownParser.parse(..., flat=True) 와 같은 형태)를 만듭니다.
+    MarkdownParseError 는 문서별로 error 에 담기고 나머지 문서는 계속 처리됩니다.
+    validate_only=True 이면 트리를 돌려보내지 않고 오류 여부만 확인합니다.
+    executor 를 주면 풀을 새로 만들지 않고 그것을 사용합니다.
+    """
+    documents = list(documents)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if executor is None and (max_workers <= 1 or len(documents) <= 1):
+        states = [_parse_compact(document, validate_only) for document in documents]
+        return _restore_results(documents, states)
+
+    if chunksize is None:
+        chunksize = max(1, len(documents) // (max_workers * CHUNKS_PER_WORKER))
+
+    flags = [validate_only] * len(documents)
+    if executor is not None:
+        states = list(
+            executor.map(_parse_compact, documents, flags, chunksize=chunksize)
+        )
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            states = list(
+                pool.map(_parse_compact, documents, flags, chunksize=chunksize)
+            )
+    return _restore_results(documents, states)
+
+
+def _parse_compact(markdown_content, validate_only: bool = False):
+    """
+    워커에서 실행됩니다. (배열 튜플 또는 None, 오류 메시지 또는 None) 을 돌려줍니다.
+    """
+    try:
+        tree = MarkdownParser._build_tree(markdown_content)
+    except MarkdownParseError as error:
+        return None, str(error)
+
+    if validate_only:
+        return None, None
+    return tuple(getattr(tree, name) for name in _TREE_ARRAYS), None
+
+
+def _restore_results(documents, states) -> list[MarkdownBatchResult]:
+    results = []
+    for index, (markdown_content, (arrays, error)) in enumerate(zip(documents, states)):
+        markdown = None
+        if arrays is not None:
+            markdown = _restore_markdown(markdown_content, arrays)
+        results.append(MarkdownBatchResult(index, markdown, error))
+    return results
+
+
+def _restore_markdown(markdown_content, arrays) -> Markdown:
+    tree = MarkdownTree(markdown_content)
+    for name, values in zip(_TREE_ARRAYS, arrays):
+        setattr(tree, name, values)
+    return MarkdownParser._wrap(
+        [tree.section(index) for index in tree.roots()], markdown_content
+    )
@@ -0,0 +1,165 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from core.utils.markdown_parser import Markdown, MarkdownParser
+
+# 섹션 하나를 유지하는 데 드는 대략적인 메모리 (dev/benchmark/markdown_section_memory.py 측정값)
+SECTION_COST_BYTES = 450
+
+
+class MarkdownParseCache:
+    """
+    문서 내용의 해시를 키로 MarkdownParser.parse 결과를 재사용하는 LRU 캐시입니다.
+
+    로컬 캐시는 max_bytes 예산을 넘으면 가장 오래 사용하지 않은 결과부터 버립니다.
+    shared_cache_alias 를 주면 Django 캐시를 2차 저장소로 사용해 워커 프로세스끼리 결과를 공유합니다.
+    timeout 을 주지 않으면 그 캐시 백엔드의 기본 TIMEOUT 을 따르고, None 이면 만료되지 않습니다.
+    돌려주는 결과는 freeze() 되어 있으므로 수정하려면 thaw() 로 복사해야 합니다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        shared_cache_alias: str | None = None,
+        timeout: int | None = DEFAULT_TIMEOUT,
+        key_prefix: str = "markdown-parse",
+    ):
+        self.max_bytes = max_bytes
+        self.shared_cache_alias = shared_cache_alias
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+
+        self._entries = OrderedDict()  # key -> (markdown, cost)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def parse(self, markdown_content, lazy: bool = False) -> Markdown:
+        key = self.make_key(markdown_content, lazy)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._share(entry[0])
+
+        markdown = None
+        shared_cache = self._shared_cache()
+        if shared_cache is not None:
+            markdown = shared_cache.get(key)
+
+        if markdown is not None:
+            with self._lock:
+                self.shared_hits += 1
+        else:
+            markdown = MarkdownParser.parse(markdown_content, lazy=lazy)
+            with self._lock:
+                self.misses += 1
+            if shared_cache is not None:
+                # 고정된 트리는 pickle 할 수 없으므로 freeze 전에 공유 캐시에 넣습니다.
+                shared_cache.set(key, markdown, self.timeout)
+
+        markdown.freeze()
+        self._store(key, markdown, self._estimate_cost(markdown_content, markdown))
+        return self._share(markdown)
+
+    def make_key(self, markdown_content, lazy: bool = False) -> str:
+        if isinstance(markdown_content, str):
+            markdown_content = markdown_content.encode("utf-8")
+        digest = hashlib.blake2b(markdown_content, digest_size=16).hexdigest()
+        return f"{self.key_prefix}:{int(lazy)}:{digest}"
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "current_bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _store(self, key: str, markdown: Markdown, cost: int):
+        if cost > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (markdown, cost)
+            self.current_bytes += cost
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_cost) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_cost
+                self.evictions += 1
+
+    def _shared_cache(self):
+        if self.shared_cache_alias is None:
+            return None
+        from django.core.cache import caches
+
+        return caches[self.shared_cache_alias]
+
+    @staticmethod
+    def _estimate_cost(markdown_content, markdown: Markdown) -> int:
+        sections = sum(1 for _ in markdown.iter_sections())
+        return sys.getsizeof(markdown_content) + sections * SECTION_COST_BYTES
+
+    @staticmethod
+    def _share(markdown: Markdown) -> Markdown:
+        """
+        호출자마다 새 래퍼를 주어 래퍼 속성을 바꿔도 캐시된 결과에 영향이 없게 합니다.
+        경로 색인은 캐시된 결과의 것을 함께 씁니다.
+        """
+        shared = type(markdown)(markdown.parsed_markdown, markdown.source)
+        shared._index = markdown.index
+        return shared
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_markdown_parse_cache() -> MarkdownParseCache:
+    """
+    settings.MARKDOWN_PARSE_CACHE 설정으로 만든 프로세스 공용 캐시를 돌려줍니다.
+
+        MARKDOWN_PARSE_CACHE = {
+            "MAX_BYTES": 64 * 1024 * 1024,
+            "SHARED_CACHE": "default",
+            "TIMEOUT": 3600,
+        }
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            from django.conf import settings
+
+            options = getattr(settings, "MARKDOWN_PARSE_CACHE", {})
+            _default_cache = MarkdownParseCache(
+                max_bytes=options.get("MAX_BYTES", 64 * 1024 * 1024),
+                shared_cache_alias=options.get("SHARED_CACHE"),
+                timeout=options.get("TIMEOUT", DEFAULT_TIMEOUT),
+            )
+        return _default_cache
+
+
+def parse_markdown_cached(markdown_content, lazy: bool = False) -> Markdown:
+    return get_markdown_parse_cache().parse(markdown_content, lazy=lazy)
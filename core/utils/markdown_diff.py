@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from typing import NamedTuple
+
+
+class SectionChange(NamedTuple):
+    """
+    kind 는 "added", "removed", "moved", "modified" 중 하나입니다.
+    path 는 새 문서 기준(removed 는 이전 문서 기준) 제목 경로이고,
+    old_path 는 이전 문서에서의 경로입니다(added 는 None).
+    """
+
+    kind: str
+    path: tuple[str, ...]
+    old_path: tuple[str, ...] | None
+    old: object
+    new: object
+
+
+def diff_markdown(old, new) -> list[SectionChange]:
+    """
+    두 마크다운(Markdown 또는 섹션)의 섹션 트리를 제목 경로로 맞춰 비교합니다.
+
+    섹션 해시(digest)가 같은(또는 reparse 로 공유된 같은 객체인) 섹션은 내려가지 않고 건너뜁니다.
+    다른 경로로 옮겨졌거나 형제 사이에서 순서가 바뀐 섹션은 moved 로,
+    제목은 같지만 주석이나 본문이 바뀐 섹션은 modified 로 보고합니다.
+    """
+    changes = []
+    removed = []
+    added = []
+
+    stack = [((), _top_sections(old), _top_sections(new))]
+    while stack:
+        parent_path, old_children, new_children = stack.pop()
+        changes.extend(_reordered(parent_path, old_children, new_children))
+
+        descend = []
+        for title, old_section in old_children.items():
+            path = (*parent_path, title)
+            new_section = new_children.get(title)
+            if new_section is None:
+                removed.append((path, old_section))
+                continue
+            if old_section is new_section or old_section.digest == new_section.digest:
+                continue
+            if _own_content(old_section) != _own_content(new_section):
+                changes.append(
+                    SectionChange("modified", path, path, old_section, new_section)
+                )
+            descend.append(
+                (
+                    path,
+                    old_section.sub_sections or {},
+                    new_section.sub_sections or {},
+                )
+            )
+        for title, new_section in new_children.items():
+            if title not in old_children:
+                added.append(((*parent_path, title), new_section))
+        stack.extend(reversed(descend))
+
+    changes.extend(_pair_moves(removed, added))
+    return changes
+
+
+def _top_sections(markdown) -> dict:
+    if hasattr(markdown, "roots"):
+        return {section.title: section for section in markdown.roots()}
+    return {markdown.title: markdown}
+
+
+def _own_content(section) -> tuple:
+    return section.title, section.comment, section.body
+
+
+def _reordered(parent_path, old_children: dict, new_children: dict):
+    """
+    양쪽에 모두 있는 형제들 중 가장 긴 증가 부분 수열에 들지 않는 섹션을 moved 로 봅니다.
+    """
+    old_positions = {title: position for position, title in enumerate(old_children)}
+    common = [title for title in new_children if title in old_positions]
+    keep = _longest_increasing_subsequence([old_positions[t] for t in common])
+    for position, title in enumerate(common):
+        if position not in keep:
+            path = (*parent_path, title)
+            yield SectionChange(
+                "moved", path, path, old_children[title], new_children[title]
+            )
+
+
+def _pair_moves(removed, added):
+    """
+    다른 경로에서 같은 해시의 하위 트리가 사라지고 나타났다면 moved 로 짝짓습니다.
+    """
+    removed_by_digest = {}
+    for path, section in removed:
+        removed_by_digest.setdefault(section.digest, []).append((path, section))
+
+    changes = []
+    for path, section in added:
+        candidates = removed_by_digest.get(section.digest)
+        if candidates:
+            old_path, old_section = candidates.pop(0)
+            changes.append(SectionChange("moved", path, old_path, old_section, section))
+        else:
+            changes.append(SectionChange("added", path, None, None, section))
+
+    for candidates in removed_by_digest.values():
+        for path, section in candidates:
+            changes.append(SectionChange("removed", path, path, section, None))
+    return changes
+
+
+def _longest_increasing_subsequence(values: list[int]) -> set[int]:
+    """
+    values 의 가장 긴 증가 부분 수열에 속하는 위치들을 돌려줍니다. O(n log n)
+    """
+    tails = []  # 길이별 마지막 값
+    tail_positions = []
+    previous = [-1] * len(values)
+    for position, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else -1
+
+    keep = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position >= 0:
+        keep.add(position)
+        position = previous[position]
+    return keep
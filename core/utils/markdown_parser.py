@@ -1,47 +1,558 @@
+import codecs
+import functools
+import hashlib
 import re
+from array import array
+from types import MappingProxyType
+from typing import NamedTuple
+
+_HEADING_PATTERN = r"^(?P<hashes>#+)[ \t]+(?P<title>[^\n]*\S)"
+_COMMENT_PATTERN = r"[ \t]*\r?\n<!--[ \t]*(?P<comment>.*?)[ \t]*-->"
+_NON_SPACE_PATTERN = r"\S"
+
+# 문자열(str)과 UTF-8 바이트(bytes, memoryview) 원본에 각각 사용할 패턴
+_TEXT_PATTERNS = (
+    re.compile(_HEADING_PATTERN, re.MULTILINE),
+    re.compile(_COMMENT_PATTERN),
+    re.compile(_NON_SPACE_PATTERN),
+)
+_BYTES_PATTERNS = (
+    re.compile(_HEADING_PATTERN.encode(), re.MULTILINE),
+    re.compile(_COMMENT_PATTERN.encode()),
+    re.compile(_NON_SPACE_PATTERN.encode()),
+)
+# 스트리밍 파싱에서 헤딩 바로 다음 줄의 주석을 찾을 때 사용하는 패턴
+_LINE_COMMENT_PATTERN = re.compile(r"<!--[ \t]*(?P<comment>.*?)[ \t]*-->")
+
+
+class _LevelPatterns(NamedTuple):
+    heading: re.Pattern  # 예: 레벨이 2일 때 "##" 다음 공백 문자
+    split: re.Pattern  # 예: 레벨이 2일 때 "## "
+    main_content: re.Pattern
+
+
+@functools.cache
+def _level_patterns(level: int) -> _LevelPatterns:
+    """
+    예전 섹션 단위 도우미(_divide_markdown_before_next_section, _parse_main_content,
+    _split_sub_content)가 쓰는 레벨별 패턴을 레벨마다 한 번만 컴파일합니다.
+    parse 는 이 도우미들을 쓰지 않고 _iter_headings 에서 _TEXT_PATTERNS/_BYTES_PATTERNS 로 한 번에 훑습니다.
+    """
+    return _LevelPatterns(
+        heading=re.compile(rf"^#{{{level}}}\s", re.MULTILINE),
+        split=re.compile(rf"^#{{{level}}} ", re.MULTILINE),
+        main_content=re.compile(
+            rf"^(?P<title>#{{{level}}}\s[^\n]+)(?:\n(?P<comment><!--.*?-->))?(?P<body>(?:\n\n[\s\S]*)?)",
+            re.MULTILINE,
+        ),
+    )
+
+
+def _read_span(source, start: int, end: int) -> str:
+    """
+    원본 버퍼의 [start, end) 구간을 문자열로 돌려줍니다.
+    bytes/memoryview 원본은 UTF-8 로 디코딩합니다.
+    """
+    text = source[start:end]
+    if isinstance(text, str):
+        return text
+    return str(text, "utf-8")
+
+
+def _section_digest(title: str, comment: str | None, body: str, sub_digests) -> bytes:
+    """
+    제목, 주석, 본문과 하위 섹션 해시들을 순서대로 덮는 섹션 해시(머클 트리)를 만듭니다.
+    """
+    comment = "\x00" if comment is None else f"\x01{comment}"
+    hasher = hashlib.blake2b(
+        f"{title}\x00{comment}\x00{body}".encode("utf-8"), digest_size=16
+    )
+    for sub_digest in sub_digests:
+        hasher.update(sub_digest)
+    return hasher.digest()
+
+
+def _replace_item(sections: dict, previous, replaced) -> dict:
+    """
+    순서를 유지한 채 previous 섹션을 replaced 로 바꾼 새 dict 를 돌려줍니다.
+    """
+    return {
+        (replaced.title if section is previous else title): (
+            replaced if section is previous else section
+        )
+        for title, section in sections.items()
+    }
 
 
 class MarkdownParser:
     @classmethod
-    def parse(cls, markdown_content: str) -> "Markdown":
-        try:
-            parsed_markdown = cls._parse_section(markdown_content)
-            if isinstance(parsed_markdown, dict):
-                return MultiHeadingMarkdown(parsed_markdown)
-            return SingleHeadingMarkdown(parsed_markdown)
+    def parse(
+        cls,
+        markdown_content,
+        lazy: bool = False,
+        flat: bool = False,
+        hashed: bool = False,
+    ) -> "Markdown":
+        """
+        lazy=True 이면 섹션이 주석과 본문을 복사하지 않고 원본 버퍼의 오프셋만 저장하며,
+        접근할 때마다 원본에서 문자열을 만듭니다.
+        flat=True 이면 섹션 객체 대신 병렬 배열로 된 MarkdownTree 를 만들고
+        그 위의 뷰(MarkdownTreeSection)를 감싸서 돌려줍니다.
+        원본으로는 str 또는 UTF-8 bytes/memoryview 를 받을 수 있습니다.
+        hashed=True 이면 섹션 해시(digest)를 파싱하면서 아래에서 위로 미리 계산합니다.
+        그렇지 않으면 처음 접근할 때 계산됩니다.
+        """
+        index = None
+        if flat:
+            tree = cls._build_tree(markdown_content)
+            if hashed:
+                tree.digest(0)
+            roots = [tree.section(index) for index in tree.roots()]
+        else:
+            index = MarkdownIndex()
+            roots = cls._build_sections(
+                markdown_content, lazy, index=index, hashed=hashed
+            )
 
-        except MarkdownParseError as e:
-            raise e
+        markdown = cls._wrap(roots, markdown_content)
+        markdown._index = index
+        return markdown
 
     @staticmethod
-    def _parse_section(section_content: str, level: int = 1):
-        main_content, sub_sections_string = (
-            MarkdownParser._divide_markdown_before_next_section(section_content, level)
-        )
+    def _wrap(roots, source=None) -> "Markdown":
+        if roots[0].level == 1:
+            return SingleHeadingMarkdown(roots[0], source)
+        return MultiHeadingMarkdown({root.title: root for root in roots}, source)
+
+    @classmethod
+    def reparse(
+        cls,
+        markdown: "Markdown",
+        offset: int,
+        deleted_length: int,
+        inserted_text: str,
+        lazy: bool = False,
+    ) -> "Markdown":
+        """
+        이전 parse 결과에 편집(offset 위치에서 deleted_length 글자를 지우고 inserted_text 를 삽입)을
+        적용한 문서를 파싱합니다.
+        편집 범위를 포함하는 가장 작은 섹션만 다시 파싱하고, 편집과 겹치지 않는 섹션 객체는
+        그대로 재사용합니다. 바뀐 섹션의 조상만 복사되므로 이전 결과는 변경되지 않습니다.
+        편집이 섹션 구조를 바꾸면 바깥 섹션으로, 최종적으로는 문서 전체로 범위를 넓힙니다.
+        """
+        source = markdown.source
+        if not isinstance(source, str):
+            raise ValueError("원본 문자열을 가진 parse 결과만 다시 파싱할 수 있습니다.")
+        edit_end = offset + deleted_length
+        new_source = source[:offset] + inserted_text + source[edit_end:]
+        delta = len(inserted_text) - deleted_length
+
+        roots = list(markdown.roots())
+        path = cls._locate_edit(roots, source, offset, edit_end)
+        root_level = roots[0].level
+
+        for depth in range(len(path) - 1, -1, -1):
+            section, start = path[depth]
+            if section.level == 1:
+                break
+
+            # 가장 안쪽 섹션은 하위 섹션 앞부분만 편집됐다면 그 부분만 다시 파싱합니다.
+            head_only = (
+                depth == len(path) - 1
+                and section.sub_sections
+                and edit_end < start + section._head
+            )
+            if head_only:
+                replaced = cls._reparse_region(
+                    new_source, start, start + section._head + delta, root_level, lazy
+                )
+                if (
+                    replaced
+                    and replaced.level == section.level
+                    and not replaced.sub_sections
+                ):
+                    replaced.sub_sections = dict(section.sub_sections)
+                    replaced._extent = section._extent + delta
+                    return cls._replace_path(
+                        markdown, path, depth, replaced, delta, new_source
+                    )
+
+            replaced = cls._reparse_region(
+                new_source, start, start + section._extent + delta, root_level, lazy
+            )
+            if replaced and replaced.level == section.level:
+                return cls._replace_path(
+                    markdown, path, depth, replaced, delta, new_source
+                )
+
+        return cls.parse(new_source, lazy=lazy)
+
+    @staticmethod
+    def _locate_edit(roots, source: str, edit_start: int, edit_end: int):
+        """
+        편집 범위를 완전히 포함하는 섹션들을 바깥쪽부터 [(section, start), ...] 로 돌려줍니다.
+        섹션 범위는 헤딩부터 하위 섹션의 끝까지이며, 다음 헤딩이 시작되는 위치를 건드리는
+        편집은 그 섹션에 포함되지 않는 것으로 봅니다.
+        """
+        if not isinstance(roots[0], MarkdownSection) or any(
+            root._extent is None for root in roots
+        ):
+            return []
+        source_length = len(source)
+
+        path = []
+        sections = roots
+        start = source_length - sum(root._extent for root in roots)
+        if start != _TEXT_PATTERNS[2].search(source).start():
+            # 같은 제목의 최상위 섹션이 덮어써져 범위를 이어 붙일 수 없습니다.
+            return []
+
+        while True:
+            found = None
+            position = start
+            for section in sections:
+                if position > edit_start:
+                    break
+                end = position + section._extent
+                if edit_end < end or end == source_length:
+                    found = (section, position)
+                    break
+                position = end
 
-        main_section = None
-        if main_content:
-            main_section = MarkdownSection(
-                **MarkdownParser._parse_main_content(main_content, level), level=level
+            if not found:
+                return path
+            path.append(found)
+
+            section, position = found
+            if not section.sub_sections:
+                return path
+            start = position + section._head
+            sections = list(section.sub_sections.values())
+            if any(child._extent is None for child in sections) or start + sum(
+                child._extent for child in sections
+            ) != (position + section._extent):
+                # 같은 제목의 형제가 덮어써졌거나 직접 추가된 섹션이 있어
+                # 하위 섹션 범위를 이어 붙일 수 없습니다.
+                return path
+
+    @classmethod
+    def _reparse_region(cls, markdown_content, start, end, root_level, lazy):
+        """
+        [start, end) 구간이 start 의 헤딩으로 시작하는 섹션 하나로만 파싱되면 그 섹션을,
+        구조가 바뀌어 구간 밖까지 영향을 준다면 None 을 돌려줍니다.
+        """
+        heading = _TEXT_PATTERNS[0].match(markdown_content, start, end)
+        if not heading:
+            return None
+        level = heading.end("hashes") - start
+        try:
+            sections = cls._build_sections(
+                markdown_content, lazy, start, end, root_level, level - 1
             )
+        except MarkdownParseError:
+            return None
+        if len(sections) != 1:
+            return None
+        return sections[0]
 
-        if not sub_sections_string:
-            return main_section
+    @staticmethod
+    def _replace_path(markdown, path, depth, replaced, delta, new_source):
+        for ancestor_depth in range(depth - 1, -1, -1):
+            ancestor = path[ancestor_depth][0]
+            previous = path[ancestor_depth + 1][0]
+            copied = ancestor._copy()
+            copied.sub_sections = _replace_item(
+                ancestor.sub_sections, previous, replaced
+            )
+            copied._extent = ancestor._extent + delta
+            copied._digest = None
+            replaced = copied
 
-        splitted_sub_sections = MarkdownParser._split_sub_content(
-            sub_sections_string, level + 1
+        if isinstance(markdown, SingleHeadingMarkdown):
+            return SingleHeadingMarkdown(replaced, new_source)
+        return MultiHeadingMarkdown(
+            _replace_item(markdown.parsed_markdown, path[0][0], replaced), new_source
         )
 
-        sub_sections = [
-            MarkdownParser._parse_section(sub_section_content, level + 1)
-            for sub_section_content in splitted_sub_sections
-        ]
+    @staticmethod
+    def _iter_headings(markdown_content, start=0, end=None, root_level=0, top_level=0):
+        """
+        문서를 한 번만 앞에서부터 훑으며 섹션을 여는 헤딩만 문서 순서대로 돌려줍니다.
+        (level, heading_start, title_span, comment_span, body_start)
+        각 섹션의 본문은 다음으로 돌려주는 헤딩의 시작(없으면 end)에서 끝납니다.
+        root_level 과 top_level 을 주면 문서 중간의 [start, end) 구간을
+        그 위치의 최상위 레벨과 열린 섹션 레벨에서 이어서 훑습니다.
+        """
+        if end is None:
+            end = len(markdown_content)
+        if isinstance(markdown_content, str):
+            heading_pattern, comment_pattern, non_space_pattern = _TEXT_PATTERNS
+        else:
+            heading_pattern, comment_pattern, non_space_pattern = _BYTES_PATTERNS
+
+        scan_region = root_level > 0
+        for match in heading_pattern.finditer(markdown_content, start, end):
+            level = match.end("hashes") - match.start("hashes")
+
+            if not root_level:
+                if non_space_pattern.search(markdown_content, start, match.start()):
+                    raise MarkdownParseError(
+                        "주 섹션의 구조가 올바르지 않습니다. (레벨: 1)"
+                    )
+                if level > 2:
+                    break
+                root_level = level
+            elif not MarkdownParser._opens_section(level, root_level, top_level):
+                continue
+            top_level = level
 
-        if main_section:
-            main_section.insert_sub_sections(sub_sections)
-            return main_section
+            body_start = match.end()
+            comment_span = None
+            comment_match = comment_pattern.match(markdown_content, body_start, end)
+            if comment_match:
+                comment_span = comment_match.span("comment")
+                body_start = comment_match.end()
 
-        return {sub_section.title: sub_section for sub_section in sub_sections}
+            yield level, match.start(), match.span("title"), comment_span, body_start
+
+        if not root_level and not scan_region:
+            raise MarkdownParseError(
+                f"주 섹션 또는 서브 섹션을 찾을 수 없습니다. (레벨: 1)\n"
+                f"{_read_span(markdown_content, 0, len(markdown_content))}"
+            )
+
+    @staticmethod
+    def _opens_section(level: int, root_level: int, top_level: int) -> bool:
+        """
+        두 번째 h1, 최상위보다 얕거나 바로 아래 레벨보다 깊은 헤딩은 본문으로 취급합니다.
+        """
+        return level != 1 and root_level <= level <= top_level + 1
+
+    @classmethod
+    def iter_parse(cls, chunks, attach: bool = False):
+        """
+        줄 또는 임의 크기 조각(str 또는 UTF-8 bytes)의 iterable 을 읽으면서
+        범위가 닫힌 MarkdownSection 을 곧바로 돌려줍니다. (하위 섹션이 상위 섹션보다 먼저 나옵니다.)
+        파일 객체나 업로드 스트림을 그대로 넘길 수 있습니다.
+
+        기본적으로 섹션은 하위 섹션과 연결되지 않으므로 열린 헤딩들과 현재 본문만 메모리에 남습니다.
+        attach=True 이면 parse 와 같은 트리가 되도록 하위 섹션을 연결해서 돌려줍니다.
+        """
+        heading_pattern = _TEXT_PATTERNS[0]
+        root_level = 0
+        stack = []  # [section, body_lines]
+        expect_comment = False
+
+        for line in cls._iter_lines(chunks):
+            match = heading_pattern.match(line)
+            level = match.end("hashes") if match else 0
+
+            if not root_level:
+                if not match:
+                    if line.strip():
+                        raise MarkdownParseError(
+                            "주 섹션의 구조가 올바르지 않습니다. (레벨: 1)"
+                        )
+                    continue
+                if level > 2:
+                    break
+                root_level = level
+            elif not match or not cls._opens_section(
+                level, root_level, stack[-1][0].level
+            ):
+                if expect_comment:
+                    expect_comment = False
+                    comment_match = _LINE_COMMENT_PATTERN.match(line)
+                    if comment_match:
+                        stack[-1][0].comment = comment_match.group("comment")
+                        line = line[comment_match.end() :]
+                stack[-1][1].append(line)
+                continue
+
+            if stack:
+                cls._close_line_body(stack[-1])
+            while stack and stack[-1][0].level >= level:
+                yield stack.pop()[0]
+
+            section = MarkdownSection(match.group("title"), None, "", level)
+            if attach and stack:
+                stack[-1][0].insert_sub_sections([section])
+            stack.append([section, []])
+            expect_comment = True
+
+        if not root_level:
+            raise MarkdownParseError(
+                "주 섹션 또는 서브 섹션을 찾을 수 없습니다. (레벨: 1)"
+            )
+
+        cls._close_line_body(stack[-1])
+        while stack:
+            yield stack.pop()[0]
+
+    @staticmethod
+    def _close_line_body(entry):
+        section, body_lines = entry
+        section.body = "".join(body_lines).strip()
+        body_lines.clear()
+
+    @staticmethod
+    def _iter_lines(chunks):
+        """
+        조각 경계와 관계없이 "\n" 으로 끝나는 한 줄씩 돌려줍니다.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = []
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                chunk = decoder.decode(chunk)
+            if "\n" not in chunk:
+                pending.append(chunk)
+                continue
+
+            pending.append(chunk)
+            lines = "".join(pending).split("\n")
+            pending = [lines.pop()]
+            for line in lines:
+                yield line + "\n"
+
+        pending.append(decoder.decode(b"", final=True))
+        last_line = "".join(pending)
+        if last_line:
+            yield last_line
+
+    @staticmethod
+    def _build_sections(
+        markdown_content,
+        lazy: bool = False,
+        start=0,
+        end=None,
+        root_level=0,
+        top_level=0,
+        index: "MarkdownIndex | None" = None,
+        hashed: bool = False,
+    ) -> list["MarkdownSection"]:
+        """
+        헤딩을 차례로 받아 열린 섹션을 스택으로 관리하며 MarkdownSection 트리를 만듭니다.
+        섹션마다 헤딩부터 하위 섹션 끝까지의 길이(_extent)와 첫 하위 섹션 전까지의
+        길이(_head)를 기록해 두어 reparse 가 편집 위치를 찾을 수 있게 합니다.
+        index 를 주면 스택에 있는 제목들로 경로를 만들어 함께 색인합니다.
+        hashed=True 이면 섹션이 닫힐 때(하위 섹션이 모두 닫힌 뒤) 해시를 계산합니다.
+        """
+        if end is None:
+            end = len(markdown_content)
+        roots = []
+        stack = []  # (section, body_start, heading_start)
+        paths = []  # stack 과 같은 깊이의 제목 경로
+
+        for (
+            level,
+            heading_start,
+            title_span,
+            comment_span,
+            body_start,
+        ) in MarkdownParser._iter_headings(
+            markdown_content, start, end, root_level, top_level
+        ):
+            MarkdownParser._close_body(markdown_content, stack, heading_start, lazy)
+            MarkdownParser._close_sections(stack, level, heading_start, hashed)
+
+            title = _read_span(markdown_content, *title_span)
+            if lazy:
+                section = MarkdownSection.from_source(
+                    markdown_content, title, level, comment_span
+                )
+            else:
+                comment = (
+                    _read_span(markdown_content, *comment_span)
+                    if comment_span
+                    else None
+                )
+                section = MarkdownSection(title, comment, "", level)
+
+            if stack:
+                parent, _, parent_start = stack[-1]
+                if parent.sub_sections is None:
+                    parent.sub_sections = {}
+                    parent._head = heading_start - parent_start
+                parent.sub_sections[title] = section
+            else:
+                roots.append(section)
+            stack.append((section, body_start, heading_start))
+
+            if index is not None:
+                del paths[len(stack) - 1 :]
+                path = (*paths[-1], title) if paths else (title,)
+                paths.append(path)
+                index.add(path, section)
+
+        MarkdownParser._close_body(markdown_content, stack, end, lazy)
+        MarkdownParser._close_sections(stack, 0, end, hashed)
+        return roots
+
+    @staticmethod
+    def _close_sections(stack, level: int, end: int, hashed: bool = False):
+        while stack and stack[-1][0].level >= level:
+            section, _, heading_start = stack.pop()
+            section._extent = end - heading_start
+            if section._head is None:
+                section._head = section._extent
+            if hashed:
+                section.digest
+
+    @staticmethod
+    def _close_body(markdown_content, stack, body_end: int, lazy: bool):
+        """
+        본문은 항상 가장 마지막에 열린 섹션의 것이므로 스택의 맨 위만 닫습니다.
+        """
+        if not stack:
+            return
+        section, body_start, _ = stack[-1]
+        if lazy:
+            section._body_span = (body_start, body_end)
+        else:
+            section.body = _read_span(markdown_content, body_start, body_end).strip()
+
+    @staticmethod
+    def _build_tree(markdown_content) -> "MarkdownTree":
+        """
+        섹션 객체를 만들지 않고 헤딩 정보를 MarkdownTree 의 병렬 배열에 바로 채웁니다.
+        """
+        tree = MarkdownTree(markdown_content)
+        stack = []  # [index, last_child_index]
+        last_root = -1
+
+        for index, (level, start, title_span, comment_span, body_start) in enumerate(
+            MarkdownParser._iter_headings(markdown_content)
+        ):
+            if index:
+                tree.body_ends.append(start)
+            while stack and tree.levels[stack[-1][0]] >= level:
+                stack.pop()
+
+            if stack:
+                parent, previous = stack[-1]
+                stack[-1][1] = index
+            else:
+                parent, previous = -1, last_root
+                last_root = index
+            if previous >= 0:
+                tree.next_siblings[previous] = index
+
+            tree.levels.append(level)
+            tree.parents.append(parent)
+            tree.next_siblings.append(-1)
+            tree.title_starts.append(title_span[0])
+            tree.title_ends.append(title_span[1])
+            tree.comment_starts.append(comment_span[0] if comment_span else -1)
+            tree.comment_ends.append(comment_span[1] if comment_span else -1)
+            tree.body_starts.append(body_start)
+            stack.append([index, -1])
+
+        tree.body_ends.append(len(markdown_content))
+        return tree
+
+    # 아래는 섹션마다 문자열을 잘라 파싱하던 예전 방식의 도우미입니다.
+    # parse 는 더 이상 부르지 않으며, 섹션 단위로 나눠 보는 외부 코드와 테스트를 위해 남겨 둡니다.
 
     @staticmethod
     def _divide_markdown_before_next_section(markdown_content: str, level=1):
@@ -49,14 +560,12 @@ class MarkdownParser:
         마크다운 문자열을 현재 레벨의 섹션과 다음 레벨의 섹션으로 나눕니다.
         둘 중 하나가 없을 수 있습니다.
         """
-        pattern = rf"^#{{{level+1}}}\s"  # 예: 레벨이 1일 때 "## "를 찾음
-
-        match = re.search(pattern, markdown_content, re.MULTILINE)
+        # 예: 레벨이 1일 때 "## "를 찾음
+        match = _level_patterns(level + 1).heading.search(markdown_content)
 
         if not match:
-            pattern = rf"^#{{{level}}}\s"  # 예: 레벨이 1일 때 "# "를 찾음
-
-            match = re.search(pattern, markdown_content, re.MULTILINE)
+            # 예: 레벨이 1일 때 "# "를 찾음
+            match = _level_patterns(level).heading.search(markdown_content)
 
             if not match:
                 raise MarkdownParseError(
@@ -73,12 +582,7 @@ class MarkdownParser:
 
     @staticmethod
     def _parse_main_content(main_content: str, level: int = 1):
-        main_content_pattern = re.compile(
-            rf"^(?P<title>#{{{level}}}\s[^\n]+)(?:\n(?P<comment><!--.*?-->))?(?P<body>(?:\n\n[\s\S]*)?)",
-            re.MULTILINE,
-        )
-
-        match = main_content_pattern.match(main_content.strip())
+        match = _level_patterns(level).main_content.match(main_content.strip())
         if not match:
             raise MarkdownParseError(
                 f"주 섹션의 구조가 올바르지 않습니다. (레벨: {level})"
@@ -106,8 +610,7 @@ class MarkdownParser:
         """
         서브 섹션을 분할합니다.
         """
-        pattern = rf"^#{{{level}}} "
-        matches = list(re.finditer(pattern, sub_contents, re.MULTILINE))
+        matches = list(_level_patterns(level).split.finditer(sub_contents))
 
         if not matches:
             return [sub_contents] if sub_contents.strip() else []
@@ -128,35 +631,263 @@ class MarkdownParseError(Exception):
 
 
 class Markdown:
-    def __init__(self, parsed_markdown):
+    def __init__(self, parsed_markdown, source=None):
         self.parsed_markdown = parsed_markdown
+        self.source = source
+        self._index = None
 
     def __str__(self) -> str:
+        pieces = []
+        _write_sections(self.iter_sections(), pieces.append)
+        return "".join(pieces)
+
+    def write_to(self, file):
+        """
+        문서 전체를 file 에 씁니다. 큰 문서도 전체 문자열을 만들지 않고 디스크로 내보낼 수 있습니다.
+        """
+        _write_sections(self.iter_sections(), file.write)
+
+    def roots(self):
+        raise NotImplementedError("Not implemented")
+
+    @property
+    def etag(self) -> str:
+        """
+        최상위 섹션들의 해시로 만든 강한 ETag 입니다. 문서 내용이 같으면 항상 같은 값입니다.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for root in self.roots():
+            hasher.update(root.digest)
+        return f'"{hasher.hexdigest()}"'
+
+    def rehash(self):
+        """
+        섹션을 직접 수정한 뒤 저장된 해시를 모두 지웁니다.
+        """
+        for root in self.roots():
+            root.rehash()
+
+    @property
+    def index(self) -> "MarkdownIndex":
+        """
+        parse 가 만든 색인을 돌려주고, 없으면(reparse, flat 등) 트리를 한 번 훑어 만듭니다.
+        """
+        if self._index is None:
+            self._index = MarkdownIndex.build(self.roots())
+        return self._index
+
+    def find(self, path):
+        """
+        "Title_h1/Subtitle_h2" 같은 제목 경로(또는 제목 튜플)로 섹션을 찾습니다. 없으면 None.
+        """
+        return self.index.find(path)
+
+    def find_all(self, title: str) -> list:
+        """
+        트리 어디에 있든 제목이 title 인 섹션을 문서 순서대로 모두 돌려줍니다.
+        """
+        return self.index.find_all(title)
+
+    def freeze(self) -> "Markdown":
+        """
+        모든 섹션을 변경할 수 없게 만듭니다. 여러 호출자가 같은 결과를 공유할 때 사용합니다.
+        """
+        for root in self.roots():
+            root.freeze()
+        return self
+
+    def thaw(self) -> "Markdown":
+        """
+        변경 가능한 섹션들로 깊은 복사한 새 결과를 돌려줍니다.
+        """
+        raise NotImplementedError("Not implemented")
+
+    def iter_sections(self):
         raise NotImplementedError("Not implemented")
 
 
 class SingleHeadingMarkdown(Markdown):
-    def __init__(self, parsed_markdown):
+    def __init__(self, parsed_markdown, source=None):
         self.parsed_markdown: MarkdownSection = parsed_markdown
+        self.source = source
+        self._index = None
 
-    def __str__(self) -> str:
-        return str(self.parsed_markdown)
+    def roots(self):
+        return [self.parsed_markdown]
 
     def __getitem__(self, heading: str):
         if heading != self.parsed_markdown.title:
             return None
         return self.parsed_markdown
 
+    def iter_sections(self):
+        return self.parsed_markdown.iter_sections()
+
+    def thaw(self) -> "SingleHeadingMarkdown":
+        return SingleHeadingMarkdown(self.parsed_markdown.thaw(), self.source)
 
-class MultiHeadingMarkdown(Markdown):
-    def __str__(self) -> str:
-        return "\n\n".join(str(s) for s in self.parsed_markdown.values())
 
+class MultiHeadingMarkdown(Markdown):
     def __getitem__(self, title: str):
         return self.parsed_markdown[title]
 
+    def roots(self):
+        return self.parsed_markdown.values()
+
+    def freeze(self) -> "MultiHeadingMarkdown":
+        super().freeze()
+        self.parsed_markdown = MappingProxyType(self.parsed_markdown)
+        return self
+
+    def thaw(self) -> "MultiHeadingMarkdown":
+        return MultiHeadingMarkdown(
+            {title: section.thaw() for title, section in self.parsed_markdown.items()},
+            self.source,
+        )
+
+    def iter_sections(self):
+        for section in self.parsed_markdown.values():
+            yield from section.iter_sections()
+
+
+class MarkdownIndex:
+    """
+    제목 경로 → 섹션, 제목 → 섹션 목록 색인입니다.
+    같은 경로의 형제가 여럿이면 sub_sections 와 같이 마지막 섹션을 가리킵니다.
+    """
+
+    __slots__ = ("paths", "titles")
+
+    def __init__(self):
+        self.paths = {}
+        self.titles = {}
+
+    @classmethod
+    def build(cls, roots) -> "MarkdownIndex":
+        index = cls()
+        stack = [((root.title,), root) for root in reversed(list(roots))]
+        while stack:
+            path, section = stack.pop()
+            index.add(path, section)
+            if section.sub_sections:
+                stack.extend(
+                    ((*path, title), sub_section)
+                    for title, sub_section in reversed(section.sub_sections.items())
+                )
+        return index
+
+    def add(self, path: tuple[str, ...], section):
+        previous = self.paths.get(path)
+        if previous is not None and previous is not section:
+            self._discard(path, previous)
+        self.paths[path] = section
+        self.titles.setdefault(path[-1], []).append(section)
+
+    def _discard(self, path: tuple[str, ...], section):
+        """
+        같은 제목의 형제에게 밀려난 섹션과 그 하위 섹션들의 항목을 지웁니다.
+        """
+        stack = [(path, section)]
+        while stack:
+            path, section = stack.pop()
+            if self.paths.get(path) is section:
+                del self.paths[path]
+            titles = self.titles.get(path[-1], [])
+            titles[:] = [other for other in titles if other is not section]
+            if not titles:
+                self.titles.pop(path[-1], None)
+            if section.sub_sections:
+                stack.extend(
+                    ((*path, title), sub_section)
+                    for title, sub_section in section.sub_sections.items()
+                )
+
+    def find(self, path):
+        if isinstance(path, str):
+            path = tuple(path.split("/"))
+        return self.paths.get(tuple(path))
+
+    def find_all(self, title: str) -> list:
+        return list(self.titles.get(title, ()))
+
+
+def _write_sections(sections, write):
+    """
+    섹션들을 문서 순서대로 한 번 순회하며 조각을 write 로 내보냅니다.
+    섹션 사이, 제목(과 주석)과 본문 사이는 빈 줄 하나로 구분하고 빈 본문은 생략합니다.
+    """
+    separator = ""
+    for section in sections:
+        write(separator)
+        separator = "\n\n"
+        write("#" * section.level)
+        write(" ")
+        write(section.title)
+        comment = section.comment
+        if comment is not None:
+            write("\n<!-- ")
+            write(comment)
+            write(" -->")
+        body = section.body
+        if body:
+            write("\n\n")
+            write(body)
+
+
+class BaseMarkdownSection:
+    """
+    MarkdownSection 과 MarkdownTreeSection 이 공유하는 조회/직렬화 동작입니다.
+    하위 클래스는 title, comment, body, level, sub_sections 를 제공해야 합니다.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, title: str):
+        if not self.sub_sections:
+            return None
+
+        return self.sub_sections[title]
+
+    def __str__(self) -> str:
+        pieces = []
+        _write_sections(self.iter_sections(), pieces.append)
+        return "".join(pieces)
+
+    def write_to(self, file):
+        """
+        이 섹션과 하위 섹션을 str() 과 같은 형식으로 file(.write 를 가진 텍스트 싱크)에 씁니다.
+        전체 문자열을 만들지 않고 조각 단위로 바로 내보냅니다.
+        """
+        _write_sections(self.iter_sections(), file.write)
+
+    def iter_sections(self):
+        """
+        이 섹션과 모든 하위 섹션을 깊이 우선(전위) 순서로 하나씩 돌려줍니다.
+        재귀나 전체 목록 없이 아직 방문하지 않은 형제들만 스택에 둡니다.
+        """
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            yield section
+            if section.sub_sections:
+                stack.extend(reversed(section.sub_sections.values()))
+
+
+class MarkdownSection(BaseMarkdownSection):
+    __slots__ = (
+        "title",
+        "level",
+        "sub_sections",
+        "_comment",
+        "_body",
+        "_source",
+        "_comment_span",
+        "_body_span",
+        "_extent",
+        "_head",
+        "_digest",
+    )
 
-class MarkdownSection:
     def __init__(
         self,
         title: str,
@@ -170,22 +901,340 @@ class MarkdownSection:
         self.level = level
 
         self.sub_sections = None
+        self._source = None
+        self._extent = None
+        self._head = None
+        self._digest = None
 
-    def __getitem__(self, title: str):
-        if not self.sub_sections:
-            return None
+    @classmethod
+    def from_source(
+        cls,
+        source,
+        title: str,
+        level: int,
+        comment_span: tuple[int, int] | None = None,
+        body_span: tuple[int, int] = (0, 0),
+    ) -> "MarkdownSection":
+        """
+        주석과 본문을 원본 버퍼의 오프셋으로만 가지는 섹션을 만듭니다.
+        여러 섹션이 같은 원본을 공유하며, 문자열은 접근할 때 만들어집니다.
+        """
+        section = cls.__new__(cls)
+        section.title = title
+        section.level = level
+        section.sub_sections = None
+        section._comment = None
+        section._body = None
+        section._source = source
+        section._comment_span = comment_span
+        section._body_span = body_span
+        section._extent = None
+        section._head = None
+        section._digest = None
+        return section
 
-        return self.sub_sections[title]
+    def _copy(self) -> "MarkdownSection":
+        section = MarkdownSection.__new__(MarkdownSection)
+        for name in MarkdownSection.__slots__:
+            setattr(section, name, getattr(self, name))
+        return section
 
-    def __str__(self) -> str:
-        main_content = (
-            f"{'#' * self.level} {self.title}\n<!-- {self.comment} -->\n\n{self.body}"
-        )
-        sub_content = "\n\n".join(str(s) for s in self.sub_sections.values())
-        return f"{main_content}\n\n{sub_content}".strip()
+    @property
+    def comment(self) -> str | None:
+        if self._comment_span is None:
+            return self._comment
+        return _read_span(self._source, *self._comment_span)
+
+    @comment.setter
+    def comment(self, comment: str | None):
+        self._comment = comment
+        self._comment_span = None
+        self._digest = None
+
+    @property
+    def body(self) -> str:
+        if self._body_span is None:
+            return self._body
+        return _read_span(self._source, *self._body_span).strip()
+
+    @body.setter
+    def body(self, body: str):
+        self._body = body
+        self._body_span = None
+        self._digest = None
+
+    @property
+    def digest(self) -> bytes:
+        """
+        제목, 주석, 본문과 모든 하위 섹션을 덮는 16바이트 해시입니다. 한 번 계산하면 저장해 둡니다.
+        두 섹션의 digest 가 같으면 하위 트리 전체가 같으므로 내려가 보지 않아도 됩니다.
+        comment/body 를 바꾸면 그 섹션의 해시만 지워지므로, 트리를 직접 수정했다면
+        rehash() 로 저장된 해시를 모두 지워야 합니다. (reparse 는 바뀐 경로만 새로 계산합니다.)
+        """
+        if self._digest is None:
+            sub_digests = [
+                sub_section.digest for sub_section in (self.sub_sections or {}).values()
+            ]
+            # 고정된 섹션에도 계산한 해시는 저장할 수 있어야 합니다.
+            object.__setattr__(
+                self,
+                "_digest",
+                _section_digest(self.title, self.comment, self.body, sub_digests),
+            )
+        return self._digest
+
+    def rehash(self):
+        """
+        이 섹션과 하위 섹션에 저장된 해시를 지워 다음 접근 때 다시 계산하게 합니다.
+        """
+        for section in self.iter_sections():
+            object.__setattr__(section, "_digest", None)
 
     def insert_sub_sections(self, sub_sections):
         if not self.sub_sections:
             self.sub_sections = {}
 
         self.sub_sections.update({s.title: s for s in sub_sections})
+        self._digest = None
+
+    def freeze(self) -> "MarkdownSection":
+        """
+        이 섹션과 하위 섹션을 FrozenMarkdownSection 으로 바꿔 변경할 수 없게 만듭니다.
+        """
+        for section in self.iter_sections():
+            if isinstance(section, FrozenMarkdownSection):
+                continue
+            if section.sub_sections:
+                section.sub_sections = MappingProxyType(section.sub_sections)
+            section.__class__ = FrozenMarkdownSection
+        return self
+
+    def thaw(self) -> "MarkdownSection":
+        """
+        하위 섹션까지 변경 가능한 MarkdownSection 으로 복사합니다.
+        """
+        section = self._copy()
+        if self.sub_sections:
+            section.sub_sections = {
+                title: sub_section.thaw()
+                for title, sub_section in self.sub_sections.items()
+            }
+        return section
+
+
+class FrozenMarkdownSection(MarkdownSection):
+    """
+    freeze() 된 섹션입니다. 속성을 바꾸거나 하위 섹션을 추가하면 AttributeError 가 발생합니다.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"고정된 섹션은 변경할 수 없습니다. ({name})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"고정된 섹션은 변경할 수 없습니다. ({name})")
+
+    def insert_sub_sections(self, sub_sections):
+        raise AttributeError("고정된 섹션에는 하위 섹션을 추가할 수 없습니다.")
+
+
+class MarkdownTree:
+    """
+    섹션 트리를 문서 순서(전위 순회)의 병렬 배열로 표현합니다.
+    i 번째 섹션의 부모/다음 형제 인덱스(없으면 -1)와 제목, 주석, 본문의
+    원본 오프셋(주석이 없으면 -1)만 저장하므로 섹션마다 객체나 dict 를 만들지 않습니다.
+    """
+
+    __slots__ = (
+        "source",
+        "levels",
+        "parents",
+        "next_siblings",
+        "title_starts",
+        "title_ends",
+        "comment_starts",
+        "comment_ends",
+        "body_starts",
+        "body_ends",
+        "_digests",
+        "_has_duplicate_siblings",
+    )
+
+    def __init__(self, source):
+        self.source = source
+        self.levels = array("H")
+        self.parents = array("i")
+        self.next_siblings = array("i")
+        self.title_starts = array("q")
+        self.title_ends = array("q")
+        self.comment_starts = array("q")
+        self.comment_ends = array("q")
+        self.body_starts = array("q")
+        self.body_ends = array("q")
+        self._digests = None
+        self._has_duplicate_siblings = None
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def roots(self):
+        index = 0 if self.levels else -1
+        while index >= 0:
+            yield index
+            index = self.next_siblings[index]
+
+    def children(self, index: int):
+        child = index + 1
+        if child >= len(self.levels) or self.parents[child] != index:
+            return
+        while child >= 0:
+            yield child
+            child = self.next_siblings[child]
+
+    @property
+    def has_duplicate_siblings(self) -> bool:
+        """
+        같은 부모 아래 제목이 같은 형제가 있는지 처음 접근할 때 한 번 훑어 저장합니다.
+        dict 로 된 트리에서는 이런 형제 중 마지막 것만 (첫 형제의 자리에) 남습니다.
+        """
+        if self._has_duplicate_siblings is None:
+            seen = set()
+            self._has_duplicate_siblings = False
+            for index, parent in enumerate(self.parents):
+                if parent < 0:
+                    continue
+                key = (parent, self.title(index))
+                if key in seen:
+                    self._has_duplicate_siblings = True
+                    break
+                seen.add(key)
+        return self._has_duplicate_siblings
+
+    def sub_section_indexes(self, index: int) -> list[int]:
+        """
+        dict 로 된 트리의 sub_sections 에 남는 하위 섹션들입니다. 제목이 같은 형제는
+        첫 형제의 자리에 마지막 형제만 남습니다.
+        """
+        if not self.has_duplicate_siblings:
+            return list(self.children(index))
+        children = {}
+        for child in self.children(index):
+            children[self.title(child)] = child
+        return list(children.values())
+
+    def section(self, index: int) -> "MarkdownTreeSection":
+        return MarkdownTreeSection(self, index)
+
+    def title(self, index: int) -> str:
+        return _read_span(self.source, self.title_starts[index], self.title_ends[index])
+
+    def comment(self, index: int) -> str | None:
+        if self.comment_starts[index] < 0:
+            return None
+        return _read_span(
+            self.source, self.comment_starts[index], self.comment_ends[index]
+        )
+
+    def body(self, index: int) -> str:
+        return _read_span(
+            self.source, self.body_starts[index], self.body_ends[index]
+        ).strip()
+
+    def digest(self, index: int) -> bytes:
+        """
+        처음 호출될 때 뒤에서부터(하위 섹션이 먼저) 한 번 훑어 모든 섹션의 해시를 계산합니다.
+        같은 내용이면 dict 로 된 트리와 같은 해시가 되도록 sub_section_indexes 만 덮습니다.
+        """
+        if self._digests is None:
+            digests = [b""] * len(self.levels)
+            for i in range(len(self.levels) - 1, -1, -1):
+                digests[i] = _section_digest(
+                    self.title(i),
+                    self.comment(i),
+                    self.body(i),
+                    [digests[child] for child in self.sub_section_indexes(i)],
+                )
+            self._digests = digests
+        return self._digests[index]
+
+
+class MarkdownTreeSection(BaseMarkdownSection):
+    """
+    MarkdownTree 의 한 섹션을 MarkdownSection 과 같은 방식으로 읽을 수 있게 해 주는 읽기 전용 뷰입니다.
+    """
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree: MarkdownTree, index: int):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def title(self) -> str:
+        return self.tree.title(self.index)
+
+    @property
+    def comment(self) -> str | None:
+        return self.tree.comment(self.index)
+
+    @property
+    def body(self) -> str:
+        return self.tree.body(self.index)
+
+    @property
+    def level(self) -> int:
+        return self.tree.levels[self.index]
+
+    @property
+    def digest(self) -> bytes:
+        return self.tree.digest(self.index)
+
+    def iter_sections(self):
+        """
+        배열이 이미 전위 순서이므로 하위 트리의 인덱스 구간을 그대로 훑습니다.
+        제목이 같은 형제가 있으면 dict 로 된 트리와 같은 섹션을 같은 순서로 돌려주도록
+        sub_sections 를 따라갑니다.
+        """
+        if self.tree.has_duplicate_siblings:
+            yield from super().iter_sections()
+            return
+        levels = self.tree.levels
+        level = levels[self.index]
+        yield self
+        index = self.index + 1
+        while index < len(levels) and levels[index] > level:
+            yield self.tree.section(index)
+            index += 1
+
+    def freeze(self) -> "MarkdownTreeSection":
+        """
+        이미 읽기 전용이므로 그대로 돌려줍니다.
+        """
+        return self
+
+    def thaw(self) -> MarkdownSection:
+        """
+        하위 섹션까지 변경 가능한 MarkdownSection 으로 만듭니다.
+        """
+        section = MarkdownSection(self.title, self.comment, self.body, self.level)
+        sub_sections = self.sub_sections
+        if sub_sections:
+            section.sub_sections = {
+                title: sub_section.thaw() for title, sub_section in sub_sections.items()
+            }
+        return section
+
+    @property
+    def sub_sections(self) -> dict[str, "MarkdownTreeSection"] | None:
+        children = [
+            self.tree.section(child) for child in self.tree.children(self.index)
+        ]
+        if not children:
+            return None
+        return {child.title: child for child in children}
+
+    def rehash(self):
+        """
+        원본에서 읽는 뷰라 내용이 바뀔 수 없으므로 저장된 해시를 그대로 둡니다.
+        """
@@ -0,0 +1,301 @@
+import json
+import math
+import mmap
+import re
+import struct
+from array import array
+from collections import Counter
+from heapq import nlargest
+from typing import NamedTuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# 제목에 나온 단어는 본문보다 이만큼 더 자주 나온 것으로 셉니다.
+TITLE_WEIGHT = 3
+
+# BM25 매개변수
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_MAGIC = b"RSQIDX01"
+_HEADER = struct.Struct("<8sQ")
+
+
+class SearchHit(NamedTuple):
+    document_id: str
+    path: tuple[str, ...]
+    score: float
+
+
+def tokenize(text: str | None) -> list[str]:
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _section_terms(section) -> Counter:
+    terms = Counter(tokenize(section.comment))
+    terms.update(tokenize(section.body))
+    for token in tokenize(section.title):
+        terms[token] += TITLE_WEIGHT
+    return terms
+
+
+class MarkdownSearchIndex:
+    """
+    섹션 제목, 주석, 본문에 대한 역색인(단어 → 섹션별 출현 횟수)입니다.
+
+    섹션은 (문서 ID, 제목 경로) 로 구분하고 BM25 로 순위를 매깁니다.
+    문서를 다시 색인하면 섹션 해시(digest)가 같은 하위 트리는 건너뛰고
+    바뀐 섹션의 단어만 갱신합니다.
+    save() 로 쓴 파일은 MappedMarkdownSearchIndex.load() 로 읽기 전용으로 열 수 있습니다.
+    """
+
+    def __init__(self):
+        self.postings = {}  # token -> {section_id: term_frequency}
+        self._sections = []  # section_id -> (document_id, path) 또는 None(삭제됨)
+        self._section_ids = {}  # (document_id, path) -> section_id
+        self._free_ids = []
+        self._terms = {}  # section_id -> Counter
+        self._lengths = {}  # section_id -> 단어 수
+        self._total_length = 0
+        self._digests = {}  # document_id -> {path: digest}
+
+    def __len__(self) -> int:
+        return len(self._section_ids)
+
+    def index_document(self, document_id: str, markdown):
+        """
+        document_id 의 이전 색인을 markdown(Markdown 결과)의 내용으로 바꿉니다.
+        """
+        previous = self._digests.get(document_id, {})
+        digests = {}
+        kept = set()
+
+        stack = [((root.title,), root) for root in reversed(list(markdown.roots()))]
+        while stack:
+            path, section = stack.pop()
+            digest = section.digest
+            if previous.get(path) == digest:
+                # 하위 트리 전체가 그대로이므로 내려가지 않습니다.
+                kept.add(path)
+                continue
+            digests[path] = digest
+            self._set_section(document_id, path, _section_terms(section))
+            if section.sub_sections:
+                stack.extend(
+                    ((*path, title), sub_section)
+                    for title, sub_section in reversed(section.sub_sections.items())
+                )
+
+        for path, digest in previous.items():
+            if path in digests:
+                continue
+            if any(path[:depth] in kept for depth in range(1, len(path) + 1)):
+                digests[path] = digest
+            else:
+                self._remove_section(document_id, path)
+        self._digests[document_id] = digests
+
+    def remove_document(self, document_id: str):
+        for path in self._digests.pop(document_id, {}):
+            self._remove_section(document_id, path)
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        return _rank(
+            tokenize(query),
+            lambda token: self.postings.get(token, {}).items(),
+            self._lengths.__getitem__,
+            len(self),
+            self._total_length,
+            self._sections.__getitem__,
+            limit,
+        )
+
+    def save(self, file_path):
+        """
+        단어 사전과 섹션 목록은 JSON 헤더에, 섹션 ID(uint32), 출현 횟수(uint16, 65535 에서 자름),
+        섹션 길이(uint32) 배열을 그 뒤에 이어 씁니다. 삭제로 비어 있는 ID 는 당겨서 씁니다.
+        """
+        section_ids = sorted(self._section_ids.values())
+        compact = {section_id: i for i, section_id in enumerate(section_ids)}
+
+        terms = {}
+        ids = array("I")
+        frequencies = array("H")
+        for token in sorted(self.postings):
+            posting = self.postings[token]
+            terms[token] = [len(ids), len(posting)]
+            ordered = sorted(posting)
+            ids.extend(map(compact.__getitem__, ordered))
+            counts = array("I", map(posting.__getitem__, ordered))
+            if max(counts) > 0xFFFF:
+                counts = array("I", (min(count, 0xFFFF) for count in counts))
+            frequencies.extend(array("H", counts))
+        lengths = array("I", (self._lengths[section_id] for section_id in section_ids))
+
+        header = json.dumps(
+            {
+                "sections": [
+                    [*self._sections[section_id]] for section_id in section_ids
+                ],
+                "terms": terms,
+                "postings": len(ids),
+                "total_length": self._total_length,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        header += b" " * (-len(header) % 4)
+
+        with open(file_path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, len(header)))
+            file.write(header)
+            ids.tofile(file)
+            frequencies.tofile(file)
+            file.write(b"\0" * (len(frequencies) % 2 * 2))
+            lengths.tofile(file)
+
+    def _set_section(self, document_id: str, path: tuple, terms: Counter):
+        key = (document_id, path)
+        section_id = self._section_ids.get(key)
+        if section_id is None:
+            section_id = self._free_ids.pop() if self._free_ids else len(self._sections)
+            if section_id == len(self._sections):
+                self._sections.append(key)
+            else:
+                self._sections[section_id] = key
+            self._section_ids[key] = section_id
+        else:
+            old_terms = self._terms[section_id]
+            if old_terms == terms:
+                return
+            self._clear_terms(section_id)
+
+        for token, frequency in terms.items():
+            self.postings.setdefault(token, {})[section_id] = frequency
+        self._terms[section_id] = terms
+        length = terms.total()
+        self._lengths[section_id] = length
+        self._total_length += length
+
+    def _remove_section(self, document_id: str, path: tuple):
+        section_id = self._section_ids.pop((document_id, path), None)
+        if section_id is None:
+            return
+        self._clear_terms(section_id)
+        del self._terms[section_id]
+        del self._lengths[section_id]
+        self._sections[section_id] = None
+        self._free_ids.append(section_id)
+
+    def _clear_terms(self, section_id: int):
+        for token in self._terms[section_id]:
+            posting = self.postings[token]
+            del posting[section_id]
+            if not posting:
+                del self.postings[token]
+        self._total_length -= self._lengths[section_id]
+
+
+class MappedMarkdownSearchIndex:
+    """
+    MarkdownSearchIndex.save() 로 쓴 파일을 mmap 으로 여는 읽기 전용 색인입니다.
+    출현 목록은 질의할 때 필요한 구간만 파일에서 읽습니다.
+    """
+
+    def __init__(self, file, mapped, header, offset):
+        self._file = file
+        self._mmap = mapped
+        self._sections = [
+            (document_id, tuple(path)) for document_id, path in header["sections"]
+        ]
+        self._terms = header["terms"]
+        self._total_length = header["total_length"]
+
+        postings = header["postings"]
+        view = memoryview(mapped)
+        self._ids = view[offset : offset + postings * 4].cast("I")
+        offset += postings * 4
+        self._frequencies = view[offset : offset + postings * 2].cast("H")
+        offset += postings * 2 + postings % 2 * 2
+        self._lengths = view[offset : offset + len(self._sections) * 4].cast("I")
+
+    @classmethod
+    def load(cls, file_path) -> "MappedMarkdownSearchIndex":
+        file = open(file_path, "rb")
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            file.close()
+            raise
+        magic, header_length = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC:
+            mapped.close()
+            file.close()
+            raise ValueError(f"검색 색인 파일이 아닙니다. ({file_path})")
+        offset = _HEADER.size
+        header = json.loads(mapped[offset : offset + header_length])
+        return cls(file, mapped, header, offset + header_length)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        # mmap 을 닫기 전에 그 위의 memoryview 들을 먼저 풀어야 합니다.
+        for view in (self._ids, self._frequencies, self._lengths):
+            view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        return _rank(
+            tokenize(query),
+            self._posting,
+            self._lengths.__getitem__,
+            len(self),
+            self._total_length,
+            self._sections.__getitem__,
+            limit,
+        )
+
+    def _posting(self, token: str):
+        start, count = self._terms.get(token, (0, 0))
+        return zip(
+            self._ids[start : start + count], self._frequencies[start : start + count]
+        )
+
+
+def _rank(
+    tokens, posting, length, section_count, total_length, section, limit
+) -> list[SearchHit]:
+    """
+    질의 단어들의 BM25 점수를 섹션별로 더해 상위 limit 개를 돌려줍니다.
+    """
+    if not tokens or not section_count:
+        return []
+    average_length = total_length / section_count or 1
+
+    scores = {}
+    for token, query_frequency in Counter(tokens).items():
+        entries = list(posting(token))
+        if not entries:
+            continue
+        idf = math.log(1 + (section_count - len(entries) + 0.5) / (len(entries) + 0.5))
+        for section_id, frequency in entries:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length(section_id) / average_length)
+            score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+            scores[section_id] = scores.get(section_id, 0.0) + score * query_frequency
+
+    return [
+        SearchHit(*section(section_id), score)
+        for section_id, score in nlargest(
+            limit, scores.items(), key=lambda item: item[1]
+        )
+    ]
@@ -0,0 +1,128 @@
+import fnmatch
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+
+# 테스트 디렉터리가 있을 수 없는 최상위 디렉터리
+SKIP_DIRECTORIES = frozenset(
+    {".git", ".venv", "venv", "node_modules", "__pycache__", "static", "staticfiles"}
+)
+
+
+def discovery_cache_path() -> Path:
+    return Path(
+        getattr(
+            settings,
+            "TEST_DISCOVERY_CACHE_FILE",
+            settings.BASE_DIR / ".test_discovery.json",
+        )
+    )
+
+
+def find_test_modules(
+    directory_name: str, pattern: str = "test*.py", root=None, cache_path=None
+) -> list[str]:
+    """
+    root/*/tests/<directory_name> 아래에서 pattern 에 맞는 테스트 모듈 이름을 찾습니다.
+    모듈을 import 하지 않으므로 다른 종류의 테스트가 늘어나도 비용이 늘지 않습니다.
+
+    결과는 최상위 앱 목록, 훑어본 디렉터리들의 mtime 과 함께 캐시 파일에 저장합니다. 파일이나
+    디렉터리가 추가, 삭제, 이름 변경되면 그 부모 디렉터리의 mtime 이 바뀌므로 그때만 다시 훑습니다.
+    root 는 캐시 파일 자체가 바뀌는 곳이라 mtime 대신 하위 디렉터리 목록을 비교합니다.
+    """
+    root = Path(root or settings.BASE_DIR)
+    cache_path = Path(cache_path or discovery_cache_path())
+    key = f"{root}:{directory_name}:{pattern}"
+
+    cache = _load_cache(cache_path)
+    entry = cache.get(key)
+    apps = _list_apps(root)
+    if entry is not None and entry["apps"] == apps and _is_fresh(root, entry["mtimes"]):
+        return entry["modules"]
+
+    modules, mtimes = _scan(root, apps, directory_name, pattern)
+    cache[key] = {"apps": apps, "mtimes": mtimes, "modules": modules}
+    _save_cache(cache_path, cache)
+    return modules
+
+
+def _list_apps(root: Path) -> list[str]:
+    with os.scandir(root) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.is_dir()
+            and entry.name not in SKIP_DIRECTORIES
+            and not entry.name.startswith(".")
+        )
+
+
+def _scan(root: Path, apps: list[str], directory_name: str, pattern: str):
+    mtimes = {}
+    modules = []
+    for app in apps:
+        app_path = root / app
+        tests_path = app_path / "tests"
+        mtimes[app] = app_path.stat().st_mtime_ns
+        # __init__.py 가 나중에 생겨도 알아챌 수 있도록 검사하기 전에 mtime 을 남깁니다.
+        # 디렉터리가 없으면 새로 생길 때 부모의 mtime 이 바뀝니다.
+        if not tests_path.is_dir():
+            continue
+        mtimes[f"{app}/tests"] = tests_path.stat().st_mtime_ns
+        if not (tests_path / "__init__.py").exists():
+            continue
+        target = tests_path / directory_name
+        if not target.is_dir():
+            continue
+        mtimes[target.relative_to(root).as_posix()] = target.stat().st_mtime_ns
+        if not (target / "__init__.py").exists():
+            continue
+
+        for directory, subdirectories, files in os.walk(target):
+            directory = Path(directory)
+            relative = directory.relative_to(root)
+            mtimes[relative.as_posix()] = directory.stat().st_mtime_ns
+            # unittest discovery 와 같이 패키지인 하위 디렉터리만 따라 들어갑니다.
+            subdirectories[:] = sorted(
+                name
+                for name in subdirectories
+                if (directory / name / "__init__.py").exists()
+            )
+            package = ".".join(relative.parts)
+            modules.extend(
+                f"{package}.{name[:-3]}"
+                for name in sorted(files)
+                if name.endswith(".py") and fnmatch.fnmatch(name, pattern)
+            )
+    return modules, mtimes
+
+
+def _is_fresh(root: Path, mtimes: dict) -> bool:
+    for relative, mtime in mtimes.items():
+        try:
+            if (root / relative).stat().st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _load_cache(path: Path) -> dict:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path: Path, cache: dict):
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(temporary, "w") as file:
+            json.dump(cache, file)
+        temporary.replace(path)
+    except OSError:
+        # 읽기 전용 체크아웃에서도 테스트는 돌아가야 합니다.
+        pass
@@ -0,0 +1,224 @@
+import fnmatch
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import coverage
+from django.conf import settings
+
+# 바뀌어도 테스트 결과에 영향이 없는 파일
+DEFAULT_IGNORED_CHANGES = (
+    "*.md",
+    ".github/*",
+    ".gitignore",
+    "LICENSE",
+    "dev/*",
+)
+
+
+def impact_map_path() -> Path:
+    return Path(
+        getattr(
+            settings, "TEST_IMPACT_MAP_FILE", settings.BASE_DIR / ".test_impact.json"
+        )
+    )
+
+
+class ImpactMap:
+    """
+    테스트 id -> 그 테스트가 실행한 프로젝트 파일(BASE_DIR 기준 경로)의 집합.
+    파일에는 파일 목록의 인덱스만 적어 테스트가 늘어도 크기가 작게 유지됩니다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, tests=None):
+        self.tests = tests or {}
+
+    @classmethod
+    def load(cls, path=None):
+        path = Path(path or impact_map_path())
+        try:
+            with open(path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return cls()
+        if data.get("version") != cls.VERSION:
+            return cls()
+        files = data["files"]
+        return cls(
+            {
+                test_id: frozenset(files[index] for index in indexes)
+                for test_id, indexes in data["tests"].items()
+            }
+        )
+
+    def save(self, path=None):
+        path = Path(path or impact_map_path())
+        files = sorted(self.files)
+        index = {name: position for position, name in enumerate(files)}
+        data = {
+            "version": self.VERSION,
+            "files": files,
+            "tests": {
+                test_id: sorted(index[name] for name in names)
+                for test_id, names in sorted(self.tests.items())
+            },
+        }
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        with open(temporary, "w") as file:
+            json.dump(data, file, separators=(",", ":"))
+        temporary.replace(path)
+
+    @property
+    def files(self) -> set:
+        return set().union(*self.tests.values())
+
+    def update(self, files_by_test: dict):
+        """
+        이번에 실행한 테스트의 기록만 바꿉니다. 실행하지 않은 테스트의 기록은 그대로 둡니다.
+        """
+        self.tests.update(
+            {test_id: frozenset(names) for test_id, names in files_by_test.items()}
+        )
+
+    def tests_for(self, paths) -> set:
+        paths = set(paths)
+        return {test_id for test_id, names in self.tests.items() if names & paths}
+
+
+def changed_files(base: str, root=None) -> list[str]:
+    """
+    base 와 갈라진 지점부터 지금 작업 트리까지 바뀐 파일(root 기준 경로)입니다.
+    커밋하지 않은 변경과 추적하지 않는 새 파일도 포함합니다.
+    """
+    root = Path(root or settings.BASE_DIR)
+
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+
+    merge_base = git("merge-base", base, "HEAD")[0]
+    changed = set(git("diff", "--name-only", "--relative", merge_base))
+    changed.update(git("ls-files", "--others", "--exclude-standard"))
+    return sorted(changed)
+
+
+def _module_path(test, root: Path):
+    module = sys.modules.get(type(test).__module__)
+    filename = getattr(module, "__file__", None)
+    if filename is None:
+        return None
+    try:
+        return Path(filename).resolve().relative_to(root).as_posix()
+    except ValueError:
+        return None
+
+
+def select_impacted_tests(tests, impact_map: ImpactMap, changed, root=None):
+    """
+    바뀐 파일을 실행하는 테스트만 고릅니다. (선택한 테스트, 이유) 를 돌려줍니다.
+
+    - 기록이 없는 테스트(새 테스트 등)는 항상 실행합니다.
+    - 바뀐 파일이 테스트 모듈이면 그 모듈의 테스트를 실행합니다.
+    - 바뀐 파일이 어떤 테스트에서도 실행된 적이 없으면(설정, 마이그레이션, 새 모듈, 파이썬이
+      아닌 파일 등) 영향을 알 수 없으므로 전부 실행합니다. DEFAULT_IGNORED_CHANGES 와
+      settings.TEST_IMPACT_IGNORE 의 패턴에 맞는 파일은 무시합니다.
+    """
+    root = Path(root or settings.BASE_DIR).resolve()
+    ignored = getattr(settings, "TEST_IMPACT_IGNORE", DEFAULT_IGNORED_CHANGES)
+    changed = {
+        name
+        for name in changed
+        if not any(fnmatch.fnmatch(name, pattern) for pattern in ignored)
+    }
+    if not changed:
+        return [], "no relevant changes"
+
+    tests_by_module = {}
+    for test in tests:
+        tests_by_module.setdefault(_module_path(test, root), set()).add(test.id())
+
+    known = impact_map.files
+    unknown = sorted(changed - known - tests_by_module.keys())
+    if unknown:
+        return list(tests), f"impact of {', '.join(unknown[:3])} is unknown"
+
+    selected = impact_map.tests_for(changed)
+    for name in changed & tests_by_module.keys():
+        selected.update(tests_by_module[name])
+    selected = [
+        test
+        for test in tests
+        if test.id() in selected or test.id() not in impact_map.tests
+    ]
+    return selected, f"{len(changed)} changed file(s)"
+
+
+class CoverageRecorder:
+    """
+    테스트마다 coverage 의 동적 context 를 바꿔 가며 어떤 테스트가 어떤 파일을 실행했는지 모읍니다.
+
+    클래스 단위 준비(setUpClass, setUpTestData, fixture 로딩)는 TestCase 의 context 로 따로 모았다가
+    그 TestCase 에서 실행한 모든 테스트의 파일에 더합니다.
+    """
+
+    def __init__(self, root=None):
+        self.root = Path(root or settings.BASE_DIR).resolve()
+        # TestCase context -> 그 TestCase 에서 실행한 테스트 id
+        self.class_tests = {}
+        self.coverage = coverage.Coverage(
+            data_file=None,
+            config_file=False,
+            source=[str(self.root)],
+            omit=[str(self.root / pattern) for pattern in ("*/migrations/*", "dev/*")],
+        )
+
+    @staticmethod
+    def available() -> bool:
+        # coverage run 으로 이미 측정 중이면 그쪽 결과를 망가뜨리지 않도록 기록하지 않습니다.
+        return coverage.Coverage.current() is None
+
+    def start(self):
+        self.coverage.start()
+
+    def stop(self):
+        self.coverage.stop()
+
+    def switch_class(self, test_class):
+        context = _class_context(test_class)
+        self.class_tests.setdefault(context, set())
+        self.coverage.switch_context(context)
+
+    def switch(self, test):
+        test_id = test.id()
+        self.class_tests.setdefault(_class_context(type(test)), set()).add(test_id)
+        self.coverage.switch_context(test_id)
+
+    def files_by_test(self) -> dict:
+        data = self.coverage.get_data()
+        files_by_test = {}
+        for filename in data.measured_files():
+            try:
+                name = Path(filename).resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                continue
+            contexts = set()
+            for line_contexts in data.contexts_by_lineno(filename).values():
+                contexts.update(line_contexts)
+            for test_id in contexts:
+                if test_id:
+                    files_by_test.setdefault(test_id, set()).add(name)
+
+        for context, test_ids in self.class_tests.items():
+            class_files = files_by_test.pop(context, set())
+            for test_id in test_ids:
+                files_by_test.setdefault(test_id, set()).update(class_files)
+        return files_by_test
+
+
+def _class_context(test_class) -> str:
+    # 테스트 id 의 앞부분과 같습니다.
+    return f"{test_class.__module__}.{test_class.__qualname__}"
@@ -1,17 +1,359 @@
-from django.test.runner import DiscoverRunner
+import functools
+import json
+import logging
+import multiprocessing
+import statistics
+import subprocess
+import sys
+import time
+import unittest
+from pathlib import Path
 
+from django.conf import settings
+from django.test.runner import (
+    DiscoverRunner,
+    ParallelTestSuite,
+    RemoteTestResult,
+    RemoteTestRunner,
+    _init_worker as django_init_worker,
+    iter_test_cases,
+    partition_suite_by_case,
+)
+
+from core.utils.test_discovery import find_test_modules
+from core.utils.test_impact import (
+    CoverageRecorder,
+    ImpactMap,
+    changed_files,
+    select_impacted_tests,
+)
+
+# Python 3.12 부터는 unittest 가 addDuration 을 직접 부릅니다.
+PY312 = sys.version_info >= (3, 12)
+
+# 기록이 하나도 없을 때 테스트 하나에 잡는 예상 시간(초)
+DEFAULT_TEST_DURATION = 0.05
+
+
+def timings_path() -> Path:
+    return Path(
+        getattr(settings, "TEST_TIMINGS_FILE", settings.BASE_DIR / ".test_timings.json")
+    )
+
+
+def load_timings(path=None) -> dict:
+    """
+    테스트 id -> 마지막 실행 시간(초). 파일이 없거나 깨졌으면 빈 dict 입니다.
+    """
+    path = Path(path or timings_path())
+    try:
+        with open(path) as file:
+            return json.load(file).get("tests", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_timings(durations: dict, path=None):
+    """
+    이번에 실행한 테스트의 시간만 덮어쓰고 나머지 기록은 그대로 둡니다.
+    """
+    path = Path(path or timings_path())
+    timings = load_timings(path)
+    timings.update(
+        {test_id: round(seconds, 4) for test_id, seconds in durations.items()}
+    )
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    with open(temporary, "w") as file:
+        json.dump({"tests": timings}, file, indent=0, sort_keys=True)
+    temporary.replace(path)
+
+
+class TimingTextTestResult(unittest.TextTestResult):
+    """
+    테스트마다 걸린 시간을 durations 에 모읍니다. 병렬 실행에서는 워커가 보낸 addDuration 을 씁니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.durations = {}
+        self._started = {}
+
+    def startTest(self, test):
+        self._started[test.id()] = time.perf_counter()
+        super().startTest(test)
+
+    def addDuration(self, test, elapsed):
+        if PY312:
+            super().addDuration(test, elapsed)
+        self.durations[test.id()] = elapsed
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        started = self._started.pop(test.id(), None)
+        if started is not None:
+            self.durations.setdefault(test.id(), time.perf_counter() - started)
+
+
+class ImpactTextTestResult(TimingTextTestResult):
+    """
+    테스트가 시작될 때마다 coverage context 를 그 테스트 id 로 바꿉니다.
+    ImpactTestSuite 가 클래스 단위 준비를 시작할 때는 TestCase 의 context 로 바꿉니다.
+    """
+
+    def __init__(self, *args, recorder, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recorder = recorder
+
+    def startClassSetUp(self, test_class):
+        self.recorder.switch_class(test_class)
+
+    def startTest(self, test):
+        self.recorder.switch(test)
+        super().startTest(test)
+
+
+class ImpactTestSuite(unittest.TestSuite):
+    """
+    setUpClass 를 실행하기 전에 결과 객체의 startClassSetUp 을 불러, setUpTestData 나 fixture
+    로딩처럼 클래스 단위로 실행된 코드가 이전 테스트에 기록되지 않게 합니다.
+    """
+
+    def _handleClassSetUp(self, test, result):
+        start = getattr(result, "startClassSetUp", None)
+        previous = getattr(result, "_previousTestClass", None)
+        if start is not None and test.__class__ != previous:
+            start(test.__class__)
+        super()._handleClassSetUp(test, result)
+
+
+class TimedRemoteTestResult(RemoteTestResult):
+    def startTest(self, test):
+        self._test_started = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        if not PY312:
+            # 부모 프로세스에서는 이벤트를 몰아서 재생하므로 시간을 워커에서 재서 보냅니다.
+            elapsed = time.perf_counter() - self._test_started
+            self.events.append(("addDuration", self.test_index, elapsed))
+        super().stopTest(test)
+
+
+class TimedRemoteTestRunner(RemoteTestRunner):
+    resultclass = TimedRemoteTestResult
+
+
+def _init_worker(*args, **kwargs):
+    """
+    Django 의 워커 초기화 뒤에 daemon 표시를 풉니다. multiprocessing.Pool 워커는 daemon 이라
+    자식 프로세스를 만들 수 없으므로, 그대로 두면 ProcessPoolExecutor 를 쓰는 코드
+    (parse_batch, import_users)를 병렬 실행에서 테스트할 수 없습니다.
+    """
+    django_init_worker(*args, **kwargs)
+    multiprocessing.current_process().daemon = False
+
+
+class TimedParallelTestSuite(ParallelTestSuite):
+    init_worker = _init_worker
+    runner_class = TimedRemoteTestRunner
+
+
+class ParallelDiscoverRunner(DiscoverRunner):
+    """
+    --parallel N 으로 실행하면 select_tests 로 고른 테스트를 TestCase 단위로 N 개의 워커 프로세스에
+    나눠 실행합니다. 워커마다 테스트 DB 복제본을 쓰고, 결과는 하나의 보고서로 합쳐집니다.
+
+    TestCase 는 이전 실행 시간(TEST_TIMINGS_FILE)의 합이 큰 것부터 워커에 넘깁니다.
+    워커는 끝나는 대로 다음 TestCase 를 가져가므로 긴 것을 먼저 보내면 마지막에 한 워커만 남아
+    오래 도는 일이 줄어듭니다. 실행이 끝나면 테스트별 시간을 파일에 다시 기록합니다.
+    """
+
+    parallel_test_suite = TimedParallelTestSuite
+
+    def select_tests(self, tests):
+        """
+        실행할 테스트를 고릅니다. 하위 클래스에서 덮어씁니다.
+        """
+        return tests
 
-class UnitTestRunner(DiscoverRunner):
     def build_suite(self, test_labels=None, **kwargs):
-        suite = super().build_suite(test_labels, **kwargs)
-        tests = [t for t in suite._tests if "unit_test" in str(t).lower()]
-        suite._tests = tests
+        # 나누기 전에 골라야 하므로 부모에서는 나누지 않게 합니다.
+        parallel = self.parallel
+        self.parallel = 1
+        try:
+            suite = super().build_suite(test_labels, **kwargs)
+        finally:
+            self.parallel = parallel
+        suite = self.test_suite(self.select_tests(list(iter_test_cases(suite))))
+
+        if self.parallel > 1:
+            subsuites = self.balance_subsuites(partition_suite_by_case(suite))
+            processes = min(self.parallel, len(subsuites))
+            # 테스트 DB 복제본 수도 이 값으로 정해집니다.
+            self.parallel = processes
+            if processes > 1:
+                suite = self.parallel_test_suite(
+                    subsuites,
+                    processes,
+                    self.failfast,
+                    self.debug_mode,
+                    self.buffer,
+                )
         return suite
 
+    def balance_subsuites(self, subsuites):
+        timings = load_timings()
+        default = (
+            statistics.median(timings.values()) if timings else DEFAULT_TEST_DURATION
+        )
+        estimates = [
+            sum(timings.get(test.id(), default) for test in subsuite)
+            for subsuite in subsuites
+        ]
+        order = sorted(range(len(subsuites)), key=lambda index: -estimates[index])
+        self.estimated_durations = [estimates[index] for index in order]
+        self.log(
+            f"Balancing {len(subsuites)} test cases "
+            f"(~{sum(self.estimated_durations):.1f}s of recorded test time) "
+            f"across {min(self.parallel, len(subsuites))} processes."
+        )
+        return [subsuites[index] for index in order]
+
+    def get_resultclass(self):
+        return super().get_resultclass() or TimingTextTestResult
+
+    def run_suite(self, suite, **kwargs):
+        started = time.perf_counter()
+        result = super().run_suite(suite, **kwargs)
+        self.wall_time = time.perf_counter() - started
+        return result
+
+    def suite_result(self, suite, result, **kwargs):
+        durations = getattr(result, "durations", None)
+        if durations and self.wall_time:
+            save_timings(durations)
+            total = sum(durations.values())
+            self.log(
+                f"Test time {total:.1f}s in {self.wall_time:.1f}s wall clock "
+                f"({max(self.parallel, 1)} process(es), x{total / self.wall_time:.1f})."
+            )
+        return super().suite_result(suite, result, **kwargs)
+
+
+class TestDirectoryRunner(ParallelDiscoverRunner):
+    """
+    라벨 없이 실행하면 */tests/<test_directory_name> 아래의 모듈만 라벨로 넘겨 import 합니다.
+    전체를 import 한 뒤 걸러내지 않으므로 다른 종류의 테스트가 늘어나도 시작 시간이 그대로입니다.
+    라벨을 주면 그 라벨로 찾은 테스트 중 이 디렉터리의 것만 고릅니다.
+    """
+
+    test_directory_name = None
 
-class IntegrationTestRunner(DiscoverRunner):
     def build_suite(self, test_labels=None, **kwargs):
-        suite = super().build_suite(test_labels, **kwargs)
-        tests = [t for t in suite._tests if "integration_test" in str(t).lower()]
-        suite._tests = tests
-        return suite
+        if not test_labels:
+            started = time.perf_counter()
+            test_labels = find_test_modules(
+                self.test_directory_name, self.pattern or "test*.py"
+            )
+            self.log(
+                f"Found {len(test_labels)} {self.test_directory_name} module(s) "
+                f"in {time.perf_counter() - started:.3f}s.",
+                level=logging.DEBUG,
+            )
+            if not test_labels:
+                # 빈 라벨은 전체 탐색이 되므로 여기서 끝냅니다.
+                return self.test_suite()
+        return super().build_suite(test_labels, **kwargs)
+
+    def select_tests(self, tests):
+        return [t for t in tests if self.test_directory_name in str(t).lower()]
+
+
+class UnitTestRunner(TestDirectoryRunner):
+    test_directory_name = "unit_test"
+
+
+class IntegrationTestRunner(TestDirectoryRunner):
+    test_directory_name = "integration_test"
+
+
+class ImpactTestRunner(ParallelDiscoverRunner):
+    """
+    --changed-since 와 갈라진 뒤 바뀐 파일을 실행하는 테스트만 실행합니다.
+
+    어떤 테스트가 어떤 파일을 실행하는지는 TEST_IMPACT_MAP_FILE 에 기록해 둡니다. 기록은 직렬로
+    실행할 때마다 coverage 로 다시 재서 이번에 실행한 테스트의 항목만 바꿉니다. 기록이 없는
+    테스트와 영향을 알 수 없는 변경은 빠뜨리지 않도록 실행하는 쪽으로 고릅니다.
+    """
+
+    test_suite = ImpactTestSuite
+
+    def __init__(self, changed_since=None, record_impact=True, **kwargs):
+        super().__init__(**kwargs)
+        self.changed_since = changed_since or getattr(
+            settings, "TEST_IMPACT_BASE", "origin/main"
+        )
+        self.record_impact = record_impact
+        self.recorder = None
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--changed-since",
+            help="Git ref to diff against (default: TEST_IMPACT_BASE or origin/main)",
+        )
+        parser.add_argument(
+            "--no-impact-record",
+            action="store_false",
+            dest="record_impact",
+            help="Do not update the test impact map after the run",
+        )
+
+    def select_tests(self, tests):
+        started = time.perf_counter()
+        self.impact_map = ImpactMap.load()
+        if not self.impact_map.tests:
+            self.log("No test impact map recorded yet, running all tests.")
+            return tests
+        try:
+            changed = changed_files(self.changed_since)
+        except (OSError, subprocess.CalledProcessError):
+            self.log(f"Could not diff against {self.changed_since}, running all tests.")
+            return tests
+        selected, reason = select_impacted_tests(tests, self.impact_map, changed)
+        self.log(
+            f"Selected {len(selected)} of {len(tests)} test(s) affected by changes "
+            f"since {self.changed_since} ({reason}) in "
+            f"{time.perf_counter() - started:.3f}s."
+        )
+        return selected
+
+    def get_test_runner_kwargs(self):
+        kwargs = super().get_test_runner_kwargs()
+        if self.recorder is not None:
+            kwargs["resultclass"] = functools.partial(
+                ImpactTextTestResult, recorder=self.recorder
+            )
+        return kwargs
+
+    def run_suite(self, suite, **kwargs):
+        # DebugSQL 등 다른 결과 클래스를 쓸 때나 병렬 실행에서는 기록하지 않습니다.
+        if not (
+            self.record_impact
+            and self.parallel <= 1
+            and DiscoverRunner.get_resultclass(self) is None
+            and CoverageRecorder.available()
+        ):
+            return super().run_suite(suite, **kwargs)
+
+        self.recorder = CoverageRecorder()
+        self.recorder.start()
+        try:
+            result = super().run_suite(suite, **kwargs)
+        finally:
+            self.recorder.stop()
+        self.impact_map.update(self.recorder.files_by_test())
+        self.impact_map.save()
+        self.recorder = None
+        return result
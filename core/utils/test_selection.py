@@ -0,0 +1,99 @@
+import fnmatch
+import re
+import time
+
+from django.test.runner import iter_test_cases
+
+GLOB_CHARACTERS = frozenset("*?[")
+
+
+class TestNameMatcher:
+    """
+    요청한 이름으로 테스트를 고릅니다. 이름은 다음 중 하나와 같으면 맞습니다.
+
+    - 클래스 이름 (SignUpTestCase)
+    - 메서드 이름 (test_signup_with_invalid_email)
+    - 모듈 이름 (account.tests.unit_test.test_validators)
+    - 클래스.메서드, 또는 테스트 id 전체
+
+    *, ?, [ 가 들어간 이름은 glob 으로 보고 하나의 정규식으로 합쳐 컴파일합니다. 나머지는 집합에
+    넣어 해시로 찾으므로 요청한 이름이 많아져도 테스트 하나를 보는 비용은 그대로입니다.
+    """
+
+    def __init__(self, names):
+        names = {name.strip() for name in names if name.strip()}
+        globs = sorted(name for name in names if not GLOB_CHARACTERS.isdisjoint(name))
+        self.names = frozenset(names.difference(globs))
+        self.pattern = _compile(globs)
+        # 점이 들어간 이름만 클래스.메서드나 테스트 id 와 비교하면 되므로 따로 둡니다.
+        # 점이 없는 이름이 맞을 수 있는 건 클래스, 모듈, 메서드 이름뿐입니다.
+        self.dotted_names = frozenset(name for name in self.names if "." in name)
+        self.dotted_pattern = _compile(glob for glob in globs if "." in glob)
+        # 같은 클래스, 같은 메서드 이름은 이전 결과를 다시 씁니다.
+        self._class_matches = {}
+        self._method_matches = {}
+
+    def __bool__(self):
+        return bool(self.names) or self.pattern is not None
+
+    def _matches(self, keys):
+        if not self.names.isdisjoint(keys):
+            return True
+        return self.pattern is not None and any(self.pattern.match(key) for key in keys)
+
+    def __call__(self, test) -> bool:
+        cls = type(test)
+        class_match = self._class_matches.get(cls)
+        if class_match is None:
+            class_match = self._class_matches[cls] = self._matches(
+                (cls.__name__, cls.__module__, f"{cls.__module__}.{cls.__qualname__}")
+            )
+        if class_match:
+            return True
+
+        method = getattr(test, "_testMethodName", "")
+        method_match = self._method_matches.get(method)
+        if method_match is None:
+            method_match = self._method_matches[method] = method in self.names or bool(
+                self.pattern and self.pattern.match(method)
+            )
+        if method_match:
+            return True
+        if not (self.dotted_names or self.dotted_pattern):
+            return False
+        keys = (f"{cls.__name__}.{method}", test.id())
+        if not self.dotted_names.isdisjoint(keys):
+            return True
+        return self.dotted_pattern is not None and any(
+            self.dotted_pattern.match(key) for key in keys
+        )
+
+
+def _compile(globs):
+    globs = list(globs)
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(glob) for glob in globs))
+
+
+class TestSelection:
+    """
+    스위트를 한 번만 펼쳐 matcher 에 맞는 테스트를 원래 순서대로 모읍니다.
+    """
+
+    def __init__(self, suite, matcher: TestNameMatcher):
+        started = time.perf_counter()
+        tests = list(iter_test_cases(suite))
+        self.total = len(tests)
+        self.tests = list(filter(matcher, tests))
+        self.elapsed = time.perf_counter() - started
+
+    def __len__(self):
+        return len(self.tests)
+
+    def summary(self) -> str:
+        classes = len({type(test) for test in self.tests})
+        return (
+            f"Selected {len(self.tests)} of {self.total} tests "
+            f"({classes} test case(s)) in {self.elapsed * 1000:.1f}ms"
+        )
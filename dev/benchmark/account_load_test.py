@@ -0,0 +1,175 @@
+"""
+동시 연결 수를 늘려 가며 로그인 엔드포인트에 부하를 주고 처리량과 지연 시간을 비교합니다.
+서버는 따로 띄워 두고 URL 만 넘깁니다. 예를 들어 같은 DB 로
+
+    uvicorn REsQue.asgi:application --port 8001
+    gunicorn REsQue.wsgi --bind 127.0.0.1:8002 --threads 16
+
+을 띄운 뒤
+
+    python -m dev.benchmark.account_load_test \\
+        --target asgi=http://127.0.0.1:8001/account/async/user-signin/ \\
+        --target wsgi=http://127.0.0.1:8002/account/user-signin/ \\
+        --signup-url http://127.0.0.1:8001/account/async/user-signup/ \\
+        --concurrency 1 4 16 64 --duration 10
+
+처럼 실행합니다. 외부 HTTP 라이브러리 없이 asyncio 스트림으로 keep-alive 요청을 보냅니다.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_EMAIL = "load-test@example.com"
+DEFAULT_PASSWORD = "LoadTest1234"
+
+
+class HttpConnection:
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path or "/"
+        self.reader = None
+        self.writer = None
+
+    async def post_json(self, payload: dict) -> int:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        body = json.dumps(payload).encode()
+        self.writer.write(
+            (
+                f"POST {self.path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: keep-alive\r\n\r\n"
+            ).encode()
+            + body
+        )
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            # 서버가 keep-alive 연결을 닫았으면 다시 연결해 보냅니다.
+            await self.close()
+            return await self.post_json(payload)
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        if headers.get("transfer-encoding") == "chunked":
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        else:
+            await self.reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection") == "close":
+            await self.close()
+        return status
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+        self.reader = self.writer = None
+
+
+async def run_level(url: str, payload: dict, concurrency: int, duration: float):
+    latencies = []
+    statuses = {}
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        connection = HttpConnection(url)
+        try:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                status = await connection.post_json(payload)
+                latencies.append(time.perf_counter() - start)
+                statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            await connection.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+async def main_async(args):
+    payload = {"email": args.email, "password": args.password}
+    if args.signup_url:
+        connection = HttpConnection(args.signup_url)
+        status = await connection.post_json(payload)
+        await connection.close()
+        print(f"signup: {status} (400 means the user already exists)")
+
+    report = {}
+    for target in args.target:
+        name, _, url = target.partition("=")
+        report[name] = []
+        for concurrency in args.concurrency:
+            result = await run_level(url, payload, concurrency, args.duration)
+            report[name].append(result)
+            print(
+                f"{name:<6} c={concurrency:<4} {result['requests_per_second']:9.1f} req/s"
+                f"  p50 {result['p50_ms']:8.1f} ms  p95 {result['p95_ms']:8.1f} ms"
+                f"  p99 {result['p99_ms']:8.1f} ms  {result['status_codes']}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="name=url of a sign-in endpoint (repeatable)",
+    )
+    parser.add_argument("--signup-url", help="Sign-up endpoint used to seed the user")
+    parser.add_argument("--email", default=DEFAULT_EMAIL)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
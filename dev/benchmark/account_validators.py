@@ -0,0 +1,154 @@
+"""
+account.validators 의 호출당 시간을 이전 serializer 구현과 비교하고,
+무작위 입력에서 두 구현의 오류 메시지가 같은지 확인합니다.
+
+    python -m dev.benchmark.account_validators [--filter NAME] [--samples 20000]
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "REsQue.settings")
+django.setup()
+
+from account.validators import (  # noqa: E402
+    signin_email_error,
+    signin_password_error,
+    signup_email_errors,
+    signup_password_errors,
+)
+
+# 이전 UserSignUpSerializer / UserSignInSerializer 의 검증 코드
+
+
+def legacy_signup_email_errors(value):
+    errors = []
+    email_pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+    if not re.match(email_pattern, value):
+        errors.append("Invalid email format")
+    if any(invalid_char in value for invalid_char in "!#$%^&*()=+[]';,/{}|\":<>?"):
+        errors.append("Invalid character in email")
+    if "@" not in value:
+        errors.append("Email must contain @ symbol")
+    return errors
+
+
+def legacy_signup_password_errors(value):
+    errors = []
+    if not any(char.islower() for char in value):
+        errors.append("Password must contain at least one lowercase letter")
+    if not any(char.isupper() for char in value):
+        errors.append("Password must contain at least one uppercase letter")
+    if not any(char.isdigit() for char in value):
+        errors.append("Password must contain at least one digit")
+    if " " in value:
+        errors.append("Password must not contain spaces")
+    if not 5 < len(value) < 31:
+        errors.append("Password must be between 6 and 30 characters long")
+    return errors
+
+
+def legacy_signin_email_error(value):
+    if not re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", value):
+        return "Invalid email format."
+    if len(value) > 254:
+        return "Email must not exceed 254 characters."
+    if " " in value:
+        return "Email must not contain spaces."
+    local_part, domain = value.split("@")
+    if not re.match(r"^[a-zA-Z0-9._-]+$", local_part):
+        return "Email local part can only contain letters, numbers, dots, underscores and hyphens."
+    if "+" in local_part:
+        return "Email must not contain '+' character."
+    if not re.match(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", domain):
+        return "Invalid email domain."
+    allowed_domains = ["example.com", "yourdomain.com"]
+    if domain not in allowed_domains:
+        return f"Email domain not allowed. Allowed domains are: {', '.join(allowed_domains)}"
+    return None
+
+
+def legacy_signin_password_error(value):
+    if len(value) < 8:
+        return "Password must be at least 8 characters long."
+    if any(ord(char) > 127 for char in value):
+        return "Password must not contain Unicode characters."
+    if not re.search(r"[A-Z]", value):
+        return "Password must contain at least one uppercase letter."
+    if not re.search(r"[a-z]", value):
+        return "Password must contain at least one lowercase letter."
+    if not re.search(r"\d", value):
+        return "Password must contain at least one digit."
+    return None
+
+
+PAIRS = {
+    "signup_email": (legacy_signup_email_errors, signup_email_errors),
+    "signup_password": (legacy_signup_password_errors, signup_password_errors),
+    "signin_email": (legacy_signin_email_error, signin_email_error),
+    "signin_password": (legacy_signin_password_error, signin_password_error),
+}
+
+INPUTS = {
+    "signup_email": ["new.user@example.com", "bad!email", "a" * 40 + "@example.com"],
+    "signup_password": ["SecurePass123", "weak", "x" * 29 + "A1"],
+    "signin_email": ["user.name@example.com", "user@other.com", "invalid-email"],
+    "signin_password": ["SecurePass123", "password123", "Pässword123"],
+}
+
+ALPHABET = string.ascii_letters + string.digits + " .@_+-%!#é٣Ä"
+
+
+def random_value(rng):
+    length = rng.randint(0, 40)
+    value = "".join(rng.choice(ALPHABET) for _ in range(length))
+    if rng.random() < 0.5:
+        value = value.replace("@", "") + rng.choice(
+            ["@example.com", "@yourdomain.com", "@other.org", "@ex-ample.co"]
+        )
+    return value
+
+
+def check_equivalence(samples):
+    rng = random.Random(0)
+    values = [random_value(rng) for _ in range(samples)]
+    for inputs in INPUTS.values():
+        values.extend(inputs)
+    for name, (legacy, current) in PAIRS.items():
+        for value in values:
+            if legacy(value) != current(value):
+                raise SystemExit(f"{name}: messages differ for {value!r}")
+    print(f"{len(values)} inputs give identical messages\n")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--samples", type=int, default=20000)
+    args = parser.parse_args()
+
+    check_equivalence(args.samples)
+
+    print(f"{'validator':<18} {'input':<32} {'legacy us':>10} {'current us':>11}")
+    for name, (legacy, current) in PAIRS.items():
+        if args.filter not in name:
+            continue
+        for value in INPUTS[name]:
+            timings = []
+            for function in (legacy, current):
+                timer = timeit.Timer(lambda: function(value))
+                number, _ = timer.autorange()
+                timings.append(min(timer.repeat(repeat=3, number=number)) / number)
+            print(
+                f"{name:<18} {value[:32]:<32} {timings[0] * 1e6:>10.2f} {timings[1] * 1e6:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+여러 문서를 직렬 루프(MarkdownParser.parse)와 parse_batch 로 파싱할 때의 처리량을 비교합니다.
+
+    python -m dev.benchmark.markdown_batch_parsing [--documents 5000] [--size 8192] [--workers 1 2 4]
+"""
+
+import argparse
+import time
+
+from core.utils.markdown_batch import parse_batch
+from core.utils.markdown_parser import MarkdownParseError, MarkdownParser
+from dev.benchmark.markdown_documents import generate_markdown
+
+
+def serial(documents, validate_only):
+    for document in documents:
+        try:
+            MarkdownParser.parse(document, flat=validate_only)
+        except MarkdownParseError:
+            pass
+
+
+def report(label, seconds, documents, total_bytes):
+    print(
+        f"{label:<28} {seconds:7.2f} s  {len(documents) / seconds:9.0f} docs/s"
+        f"  {total_bytes / seconds / 1024 / 1024:7.1f} MB/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--size", type=int, default=8 * 1024)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunksize", type=int, default=None)
+    parser.add_argument("--validate-only", action="store_true")
+    args = parser.parse_args()
+
+    documents = [
+        generate_markdown(args.size, max_depth=4, seed=seed)
+        for seed in range(args.documents)
+    ]
+    total_bytes = sum(len(document) for document in documents)
+    print(f"{len(documents)} documents, {total_bytes / 1024 / 1024:.1f} MB")
+
+    start = time.perf_counter()
+    serial(documents, args.validate_only)
+    report("serial parse", time.perf_counter() - start, documents, total_bytes)
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = parse_batch(
+            documents,
+            max_workers=workers,
+            chunksize=args.chunksize,
+            validate_only=args.validate_only,
+        )
+        elapsed = time.perf_counter() - start
+        assert all(result.ok for result in results)
+        report(f"parse_batch workers={workers}", elapsed, documents, total_bytes)
+
+
+if __name__ == "__main__":
+    main()
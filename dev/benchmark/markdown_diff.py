@@ -0,0 +1,70 @@
+"""
+본문 한 곳이 바뀐 두 문서 버전을 diff_markdown 으로 비교하는 데 걸리는 시간을 잽니다.
+따로 파싱한 두 트리와, reparse 로 섹션을 공유하는 두 트리를 각각 비교합니다.
+첫 비교(cold)는 섹션 해시 계산을 포함하고, 이후(warm)는 저장된 해시만 씁니다.
+parse(hashed=True) 는 해시를 파싱하면서 미리 계산합니다.
+
+    python -m dev.benchmark.markdown_diff [--sections 10000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from core.utils.markdown_diff import diff_markdown
+from core.utils.markdown_parser import MarkdownParser
+from dev.benchmark.markdown_documents import generate_markdown
+
+
+def measure(old, new, repeat):
+    start = time.perf_counter()
+    changes = diff_markdown(old, new)
+    cold = time.perf_counter() - start
+
+    warm = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        diff_markdown(old, new)
+        warm = min(warm, time.perf_counter() - start)
+    return cold, warm, changes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    document = generate_markdown(args.sections * 420, max_depth=4, seed=1)
+    sections = sum(1 for _ in MarkdownParser.parse(document).iter_sections())
+    print(f"document: {len(document) / 1024:.0f} KB, {sections} sections")
+
+    offset = len(document) // 2
+    offset = document.index("\n\n#", offset)
+    edited = document[:offset] + "!" + document[offset:]
+
+    cases = (
+        ("separately parsed", lambda: MarkdownParser.parse(document), None),
+        (
+            "parse(hashed=True)",
+            lambda: MarkdownParser.parse(document, hashed=True),
+            True,
+        ),
+        ("reparse (shared)", lambda: MarkdownParser.parse(document), "reparse"),
+    )
+    for label, parse_old, variant in cases:
+        old = parse_old()
+        if variant == "reparse":
+            new = MarkdownParser.reparse(old, offset, 0, "!")
+        else:
+            new = MarkdownParser.parse(edited, hashed=bool(variant))
+        cold, warm, changes = measure(old, new, args.repeat)
+        kinds = ", ".join(
+            f"{change.kind} {'/'.join(change.path)}" for change in changes
+        )
+        print(
+            f"{label:<20} cold {cold * 1000:7.1f} ms  warm {warm * 1000:6.2f} ms  {kinds}"
+        )
+
+
+if __name__ == "__main__":
+    main()
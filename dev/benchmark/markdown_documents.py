@@ -0,0 +1,52 @@
+import random
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua 요구사항 사용자 시스템 "
+    "로그인 회원가입 검증 테스트"
+).split()
+
+
+def generate_markdown(
+    target_size: int,
+    max_depth: int = 4,
+    body_words: int = 60,
+    multi_heading: bool = False,
+    seed: int = 0,
+    words=WORDS,
+) -> str:
+    """
+    벤치마크용 요구사항 문서를 target_size 글자 이상이 될 때까지 생성합니다.
+    헤딩 레벨은 항상 한 단계씩만 깊어지므로 파서가 만드는 트리와 문서 구조가 일치합니다.
+    본문 단어는 words 에서 고릅니다.
+    """
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    counter = 0
+    level = 2 if multi_heading else 1
+    root_level = level
+
+    def add_section(level):
+        nonlocal size, counter
+        counter += 1
+        title = f"{'#' * level} Section_{counter}_h{level}"
+        lines = [title]
+        if rng.random() < 0.5:
+            lines.append(f"<!-- 주석_{counter} -->")
+        body = " ".join(rng.choice(words) for _ in range(body_words))
+        text = "\n".join(lines) + "\n\n" + body
+        parts.append(text)
+        size += len(text) + 2
+
+    add_section(level)
+    while size < target_size:
+        if level < root_level + max_depth - 1 and rng.random() < 0.5:
+            level += 1
+        elif level > root_level + 1 and rng.random() < 0.5:
+            level -= rng.randint(1, level - root_level - 1)
+        elif level == root_level and root_level == 1:
+            level += 1
+        add_section(level)
+
+    return "\n\n".join(parts) + "\n"
@@ -0,0 +1,68 @@
+"""
+키 입력 단위 편집마다 MarkdownParser.reparse 와 전체 parse 의 비용을 비교합니다.
+
+    python -m dev.benchmark.markdown_incremental [--sections 500] [--edits 2000]
+"""
+
+import argparse
+import random
+import time
+
+from core.utils.markdown_parser import MarkdownParser
+from dev.benchmark.markdown_documents import generate_markdown
+
+
+def body_offsets(markdown):
+    """
+    각 섹션 본문의 중간 위치를 원본 문자열 기준으로 돌려줍니다.
+    """
+    source = markdown.source
+    offsets = []
+    for section in markdown.iter_sections():
+        if section.body:
+            offsets.append(source.index(section.body) + len(section.body) // 2)
+    return offsets
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=500)
+    parser.add_argument("--edits", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    document = generate_markdown(args.sections * 420, max_depth=4, seed=1)
+    markdown = MarkdownParser.parse(document)
+    sections = sum(1 for _ in markdown.iter_sections())
+    print(f"document: {len(document) / 1024:.0f} KB, {sections} sections")
+
+    offsets = body_offsets(markdown)
+    edits = [(rng.choice(offsets), rng.choice("abc ")) for _ in range(args.edits)]
+
+    current = markdown
+    reused = 0
+    for offset, text in edits:
+        previous = {id(section) for section in current.iter_sections()}
+        current = MarkdownParser.reparse(current, offset, 0, text)
+        reused += sum(id(section) in previous for section in current.iter_sections())
+    # 재사용 비율을 세는 데 든 시간은 빼고 다시 측정합니다.
+    current = markdown
+    start = time.perf_counter()
+    for offset, text in edits:
+        current = MarkdownParser.reparse(current, offset, 0, text)
+    incremental = (time.perf_counter() - start) / len(edits)
+
+    source = markdown.source
+    start = time.perf_counter()
+    for offset, text in edits:
+        source = source[:offset] + text + source[offset:]
+        MarkdownParser.parse(source)
+    full = (time.perf_counter() - start) / len(edits)
+
+    print(f"reparse: {incremental * 1e6:8.1f} us/edit")
+    print(f"parse:   {full * 1e6:8.1f} us/edit")
+    print(f"reused sections: {reused / (len(edits) * sections):.1%}")
+
+
+if __name__ == "__main__":
+    main()
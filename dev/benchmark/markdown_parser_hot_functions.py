@@ -0,0 +1,81 @@
+"""
+MarkdownParser.parse 가 실제로 거치는 함수와 패턴(_TEXT_PATTERNS, _BYTES_PATTERNS)의
+호출당 시간을 측정합니다.
+
+    python -m dev.benchmark.markdown_parser_hot_functions [--purge-re-cache] [--filter NAME]
+
+--purge-re-cache 를 주면 매 호출 전에 re 모듈의 내부 캐시를 비워
+다른 코드가 캐시를 밀어낸 상황에서의 비용을 봅니다.
+"""
+
+import argparse
+import re
+import timeit
+
+from core.utils.markdown_parser import _BYTES_PATTERNS, _TEXT_PATTERNS, MarkdownParser
+from dev.benchmark.markdown_documents import generate_markdown
+
+
+def build_cases():
+    document = generate_markdown(256 * 1024, max_depth=4, seed=7)
+    encoded = document.encode()
+    lines = document.splitlines(keepends=True)
+    markdown = MarkdownParser.parse(document)
+
+    text_heading, text_comment, _ = _TEXT_PATTERNS
+    bytes_heading, bytes_comment, _ = _BYTES_PATTERNS
+    text_heading_ends = [match.end() for match in text_heading.finditer(document)]
+    bytes_heading_ends = [match.end() for match in bytes_heading.finditer(encoded)]
+
+    return {
+        "heading pattern(256KB)": lambda: sum(
+            1 for _ in text_heading.finditer(document)
+        ),
+        "heading pattern(256KB bytes)": lambda: sum(
+            1 for _ in bytes_heading.finditer(encoded)
+        ),
+        "comment pattern(per heading)": lambda: [
+            text_comment.match(document, end) for end in text_heading_ends
+        ],
+        "comment pattern(per heading, bytes)": lambda: [
+            bytes_comment.match(encoded, end) for end in bytes_heading_ends
+        ],
+        "_iter_headings(256KB)": lambda: list(MarkdownParser._iter_headings(document)),
+        "_iter_headings(256KB bytes)": lambda: list(
+            MarkdownParser._iter_headings(encoded)
+        ),
+        "_build_sections(256KB)": lambda: MarkdownParser._build_sections(document),
+        "_build_sections(256KB, lazy)": lambda: MarkdownParser._build_sections(
+            document, lazy=True
+        ),
+        "_build_tree(256KB)": lambda: MarkdownParser._build_tree(document),
+        "iter_parse(256KB lines)": lambda: list(MarkdownParser.iter_parse(lines)),
+        "str(markdown 256KB)": lambda: str(markdown),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--purge-re-cache", action="store_true")
+    parser.add_argument("--filter", default="")
+    args = parser.parse_args()
+
+    print(f"{'function':<40} {'us/call':>12}")
+    for name, case in build_cases().items():
+        if args.filter not in name:
+            continue
+        if args.purge_re_cache:
+            call = case
+
+            def case():
+                re.purge()
+                call()
+
+        timer = timeit.Timer(case)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=3, number=number)) / number
+        print(f"{name:<40} {best * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+MarkdownParser.parse 의 문서 크기/깊이에 따른 확장성을 측정합니다.
+
+    python -m dev.benchmark.markdown_parser_scaling [--legacy]
+
+--legacy 를 주면 레벨마다 문서를 다시 나누던 이전 재귀 방식도 함께 측정합니다.
+"""
+
+import argparse
+import time
+
+from core.utils.markdown_parser import MarkdownParser, MarkdownSection
+from dev.benchmark.markdown_documents import generate_markdown
+
+SIZES = [128 * 1024, 256 * 1024, 512 * 1024, 1024 * 1024, 2048 * 1024]
+DEPTHS = [2, 4, 8]
+
+
+def legacy_parse_section(section_content: str, level: int = 1):
+    main_content, sub_sections_string = (
+        MarkdownParser._divide_markdown_before_next_section(section_content, level)
+    )
+    main_section = None
+    if main_content:
+        main_section = MarkdownSection(
+            **MarkdownParser._parse_main_content(main_content, level), level=level
+        )
+    if not sub_sections_string:
+        return main_section
+
+    sub_sections = [
+        legacy_parse_section(sub_section_content, level + 1)
+        for sub_section_content in MarkdownParser._split_sub_content(
+            sub_sections_string, level + 1
+        )
+    ]
+    if main_section:
+        main_section.insert_sub_sections(sub_sections)
+        return main_section
+    return {sub_section.title: sub_section for sub_section in sub_sections}
+
+
+def best_of(func, document, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--legacy", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = f"{'depth':>5} {'size(KB)':>9} {'parse(ms)':>10} {'us/KB':>8}"
+    if args.legacy:
+        header += f" {'legacy(ms)':>11} {'us/KB':>8}"
+    print(header)
+
+    for depth in DEPTHS:
+        for size in SIZES:
+            document = generate_markdown(size, max_depth=depth, seed=depth)
+            kilobytes = len(document.encode()) / 1024
+            elapsed = best_of(MarkdownParser.parse, document, args.repeat)
+            line = (
+                f"{depth:>5} {kilobytes:>9.0f} {elapsed * 1000:>10.2f}"
+                f" {elapsed * 1e6 / kilobytes:>8.2f}"
+            )
+            if args.legacy:
+                legacy = best_of(legacy_parse_section, document, args.repeat)
+                line += f" {legacy * 1000:>11.2f} {legacy * 1e6 / kilobytes:>8.2f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+생성한 요구사항 문서 묶음으로 MarkdownSearchIndex 의 색인, 재색인, 질의, 저장/mmap 로드 비용을 잽니다.
+
+    python -m dev.benchmark.markdown_search [--documents 10000] [--size 2048] [--vocabulary 20000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from core.utils.markdown_parser import MarkdownParser
+from core.utils.markdown_search import MappedMarkdownSearchIndex, MarkdownSearchIndex
+from dev.benchmark.markdown_documents import WORDS, generate_markdown
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=10000)
+    parser.add_argument("--size", type=int, default=2048)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    words = WORDS + [f"term{i}" for i in range(args.vocabulary)]
+    documents = {
+        f"doc-{seed}": generate_markdown(args.size, seed=seed, words=words)
+        for seed in range(args.documents)
+    }
+    parsed = {
+        document_id: MarkdownParser.parse(document, hashed=True)
+        for document_id, document in documents.items()
+    }
+    total_bytes = sum(len(document) for document in documents.values())
+    print(f"{len(documents)} documents, {total_bytes / 1024 / 1024:.1f} MB")
+
+    index = MarkdownSearchIndex()
+    start = time.perf_counter()
+    for document_id, markdown in parsed.items():
+        index.index_document(document_id, markdown)
+    elapsed = time.perf_counter() - start
+    print(
+        f"index:    {elapsed:7.2f} s  {len(index)} sections, {len(index.postings)} terms"
+    )
+
+    # 문서 하나의 본문 한 곳을 바꾸고 다시 색인합니다.
+    edits = rng.sample(list(documents), min(200, len(documents)))
+    start = time.perf_counter()
+    for document_id in edits:
+        markdown = parsed[document_id]
+        offset = markdown.source.index("\n\n#", len(markdown.source) // 2)
+        index.index_document(
+            document_id, MarkdownParser.reparse(markdown, offset, 0, " term0")
+        )
+    print(f"reindex:  {(time.perf_counter() - start) / len(edits) * 1e6:7.0f} us/doc")
+
+    queries = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        for _ in range(args.queries)
+    ]
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query)
+    memory_query = (time.perf_counter() - start) / len(queries)
+    print(f"query:    {memory_query * 1e6:7.0f} us (in memory)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "search.idx")
+        _, elapsed = timed(index.save, file_path)
+        size = os.path.getsize(file_path)
+        print(f"save:     {elapsed:7.2f} s  {size / 1024 / 1024:.1f} MB")
+
+        mapped, elapsed = timed(MappedMarkdownSearchIndex.load, file_path)
+        print(f"load:     {elapsed:7.2f} s  (mmap)")
+        with mapped:
+            start = time.perf_counter()
+            for query in queries:
+                mapped.search(query)
+            mapped_query = (time.perf_counter() - start) / len(queries)
+            print(f"query:    {mapped_query * 1e6:7.0f} us (mmap)")
+
+
+if __name__ == "__main__":
+    main()
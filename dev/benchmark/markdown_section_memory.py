@@ -0,0 +1,64 @@
+"""
+섹션 표현 방식별 메모리 사용량과 생성 시간을 측정합니다.
+
+    python -m dev.benchmark.markdown_section_memory [--size KB]
+
+object: 문자열을 복사해 두는 MarkdownSection 트리
+lazy:   원본 오프셋만 가지는 MarkdownSection 트리
+flat:   병렬 배열로 된 MarkdownTree
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from core.utils.markdown_parser import MarkdownParser
+from dev.benchmark.markdown_documents import generate_markdown
+
+MODES = {
+    "object": {},
+    "lazy": {"lazy": True},
+    "flat": {"flat": True},
+}
+
+
+def measure(document, options):
+    gc.collect()
+    tracemalloc.start()
+    markdown = MarkdownParser.parse(document, **options)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del markdown
+
+    gc.collect()
+    start = time.perf_counter()
+    MarkdownParser.parse(document, **options)
+    elapsed = time.perf_counter() - start
+    return current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=4096, help="document size in KB")
+    parser.add_argument("--body-words", type=int, default=8)
+    args = parser.parse_args()
+
+    document = generate_markdown(
+        args.size * 1024, max_depth=6, body_words=args.body_words
+    )
+    headings = document.count("\n#") + 1
+    print(f"document: {len(document) / 1024:.0f} KB, {headings} headings")
+    print(
+        f"{'mode':>6} {'retained(KB)':>13} {'peak(KB)':>9} {'B/heading':>10} {'build(ms)':>10}"
+    )
+    for name, options in MODES.items():
+        current, peak, elapsed = measure(document, options)
+        print(
+            f"{name:>6} {current / 1024:>13.0f} {peak / 1024:>9.0f}"
+            f" {current / headings:>10.0f} {elapsed * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+PRTestRunner 가 쓰는 TestSelection 으로 테스트 수만 개짜리 스위트에서 테스트를 고르는 시간을
+이전의 재귀 filter_suite(리스트에서 클래스 이름 찾기) 와 비교합니다.
+
+    python -m dev.benchmark.test_selection [--classes 2000] [--methods 20] [--names 50]
+"""
+
+import argparse
+import os
+import time
+import unittest
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "REsQue.settings")
+django.setup()
+
+from core.utils.test_selection import TestNameMatcher, TestSelection  # noqa: E402
+
+
+def build_suite(classes, methods):
+    suite = unittest.TestSuite()
+    for index in range(classes):
+        attributes = {
+            f"test_method_{method}": lambda self: None for method in range(methods)
+        }
+        attributes["__module__"] = f"app{index % 50}.tests.unit_test.test_module"
+        case = type(f"Generated{index}TestCase", (unittest.TestCase,), attributes)
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    return suite
+
+
+def legacy_filter_suite(suite, testcase_names):
+    # 이전 PRTestRunner.filter_suite 와 같은 순회 (TestCase 종류 검사만 unittest 기준)
+    filtered_tests = []
+    for test in suite:
+        if isinstance(test, unittest.TestCase):
+            if test.__class__.__name__ in testcase_names:
+                filtered_tests.append(test)
+        elif isinstance(test, unittest.TestSuite):
+            filtered_suite = legacy_filter_suite(test, testcase_names)
+            if filtered_suite.countTestCases() > 0:
+                filtered_tests.extend(filtered_suite)
+    new_suite = suite.__class__()
+    new_suite.addTests(filtered_tests)
+    return new_suite
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--classes", type=int, default=2000)
+    parser.add_argument("--methods", type=int, default=20)
+    parser.add_argument("--names", type=int, default=50)
+    args = parser.parse_args()
+
+    suite = build_suite(args.classes, args.methods)
+    step = max(args.classes // args.names, 1)
+    names = [f"Generated{index}TestCase" for index in range(0, args.classes, step)]
+    print(f"{suite.countTestCases()} tests, {len(names)} requested class names")
+
+    start = time.perf_counter()
+    legacy = legacy_filter_suite(suite, names)
+    # 이전 run_tests 는 build_suite 에서 거른 스위트를 한 번 더 걸렀습니다.
+    legacy = legacy_filter_suite(legacy, names)
+    legacy_elapsed = time.perf_counter() - start
+
+    selection = TestSelection(suite, TestNameMatcher(names))
+    assert [test.id() for test in selection.tests] == [
+        test.id() for test in legacy
+    ], "selections differ"
+
+    globbed = TestSelection(
+        suite, TestNameMatcher(names + ["test_method_1*", "app7.*"])
+    )
+    print(f"legacy filter_suite x2: {legacy_elapsed * 1000:.1f}ms")
+    print(f"names:                  {selection.summary()}")
+    print(f"names + globs:          {globbed.summary()}")
+
+
+if __name__ == "__main__":
+    main()